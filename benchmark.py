@@ -0,0 +1,215 @@
+import gc
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+import numpy as np
+import world_map
+from world_map import BigIsland, NoiseMap, Texture, stitch_world_map
+
+
+def time_call(f, *args, **kwargs):
+    start = time.perf_counter()
+    result = f(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def worker_scaling(size=(1000, 1000), worker_counts=(1, 2, 4, 8)):
+    """
+    Times island generation and texturizing for each worker count,
+    checking that every count produces the same images
+    """
+    print(f'{"workers":>8}{"island (s)":>12}{"texturize (s)":>15}{"speedup":>9}')
+    baseline, reference = None, None
+
+    for workers in worker_counts:
+        island_time, island = time_call(BigIsland, size, workers=workers, seed=0)
+        texturize_time, image = time_call(island.terrain.texturize, workers=workers, seed=0)
+
+        image = np.asarray(image)
+        if reference is None:
+            baseline, reference = island_time + texturize_time, image
+        assert np.array_equal(image, reference), f'{workers} workers changed the result'
+
+        speedup = baseline / (island_time + texturize_time)
+        print(f'{workers:>8}{island_time:>12.2f}{texturize_time:>15.2f}{speedup:>8.2f}x')
+
+
+def texture_synthesis(sizes=(1000, 4000, 8000)):
+    """
+    Times synthesizing one full-size layer for textures of each block size
+    """
+    textures = [
+        Texture('images/samples/grass.png', 10, copy_overlap=1.5, seed=0),
+        Texture('images/samples/forest.png', 15, seed=0),
+        Texture('images/samples/ocean.png', 50, seed=0),
+    ]
+    print(f'{"size":>8}' + ''.join(f'{t.name + " (s)":>14}' for t in textures))
+
+    for size in sizes:
+        times = [time_call(t.make_composite, (size, size))[0] for t in textures]
+        print(f'{size:>7}²' + ''.join(f'{x:>14.2f}' for x in times))
+
+
+def texturize_compositing(size=(1000, 1000), blend_factor=0.08):
+    """
+    Compares time and peak traced memory of compositing a whole map as one tile,
+    with sorted-value compositing against full-tile masks per layer
+    """
+    island = BigIsland((200, 200), seed=0)
+    image_map = island.terrain.resize(size)
+    blend_ranges = image_map.blend_ranges(blend_factor)
+    rows, cols = slice(0, image_map.height), slice(0, image_map.width)
+
+    print(f'{"compositing":>24}{"time (s)":>10}{"peak (MB)":>11}')
+    for method in [image_map.texturize_tile_by_layer, image_map.texturize_tile]:
+        tracemalloc.start()
+        elapsed, _ = time_call(method, rows, cols, blend_factor, blend_ranges, 0)
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        print(f'{method.__name__:>24}{elapsed:>10.2f}{peak:>11.0f}')
+
+
+def measure(f, *args, **kwargs):
+    """
+    Wall time of one call, then peak traced memory of a second call, since tracing slows calls down.
+    Cached paste layouts and noise generators are cleared before each,
+    so every call does the full work
+    """
+    peaks = []
+    for trace in [False, True]:
+        world_map.paste_layout.cache_clear()
+        world_map.grid_simplex.cache_clear()
+        gc.collect()
+        if trace:
+            tracemalloc.start()
+        elapsed, _ = time_call(f, *args, **kwargs)
+        if trace:
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        else:
+            seconds = elapsed
+    return {'seconds': seconds, 'peak_mb': peaks[0] / 2 ** 20}
+
+
+def stage_suite(sizes=(200, 1000, 4000)):
+    """
+    Times each world_map stage at every size, headless and with fixed seeds, returning
+    {stage: {size: {'seconds', 'peak_mb'}}}
+    """
+    island = BigIsland((200, 200), seed=0)
+    grass = Texture('images/samples/grass.png', 10, copy_overlap=1.5, seed=0)
+    results = {}
+
+    for size in sizes:
+        print(f'{size}²', file=sys.stderr)
+        noise = NoiseMap((size, size), seed=0)
+        terrain = island.terrain.resize((size, size))
+        stages = {
+            'NoiseMap': lambda: NoiseMap((size, size), seed=0),
+            'ImageMap.resize': lambda: island.terrain.resize((size, size)),
+            'ImageMap.apply_circular_mask': lambda: noise.apply_circular_mask(0.4),
+            'ImageMap.apply_square_mask': lambda: noise.apply_square_mask(0.4, size // 40),
+            'ImageMap.colorize': terrain.colorize,
+            'ImageMap.texturize': lambda: terrain.texturize(seed=0),
+            'Texture._create': lambda: grass._create((size, size), 2),
+            'stitch_world_map': lambda: stitch_world_map(size),
+        }
+        for name, f in stages.items():
+            results.setdefault(name, {})[str(size)] = measure(f)
+
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Prints every result against the baseline, flagging time or memory more than tolerance over it
+    Returns the number of regressions
+    """
+    regressions = 0
+    print(f'{"stage":>30}{"size":>7}{"time (s)":>10}{"base":>8}{"memory (MB)":>13}{"base":>8}')
+    for name, by_size in results.items():
+        for size, result in by_size.items():
+            base = baseline.get(name, {}).get(size)
+            flags = []
+            if base is not None:
+                # Stages taking milliseconds vary too much run to run to compare by ratio alone
+                if result['seconds'] > max(base['seconds'] * (1 + tolerance), base['seconds'] + 0.05):
+                    flags.append('slower')
+                if result['peak_mb'] > base['peak_mb'] * (1 + tolerance):
+                    flags.append('more memory')
+            regressions += len(flags)
+
+            base_seconds = f'{base["seconds"]:.2f}' if base else '-'
+            base_mb = f'{base["peak_mb"]:.0f}' if base else '-'
+            print(
+                f'{name:>30}{size:>7}{result["seconds"]:>10.2f}{base_seconds:>8}'
+                f'{result["peak_mb"]:>13.0f}{base_mb:>8}  {", ".join(flags)}'
+            )
+    return regressions
+
+
+def suite(sizes, output, baseline_path, save_baseline=False, tolerance=0.25):
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': stage_suite(sizes),
+    }
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=1)
+
+    if save_baseline:
+        with open(baseline_path, 'w') as f:
+            json.dump(report, f, indent=1)
+        return 0
+
+    baseline = {}
+    try:
+        with open(baseline_path) as f:
+            baseline = json.load(f)['results']
+    except FileNotFoundError:
+        print(f'No baseline at {baseline_path}, nothing to compare against', file=sys.stderr)
+    return compare(report['results'], baseline, tolerance)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks world map generation')
+    parser.add_argument(
+        'benchmark',
+        nargs='?',
+        choices=['all', 'workers', 'synthesis', 'compositing', 'suite'],
+        default='all',
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[200, 1000, 4000], help='suite map sizes'
+    )
+    parser.add_argument(
+        '--output', default='cache/benchmark.json', help='where the suite writes results'
+    )
+    parser.add_argument(
+        '--baseline', default='cache/benchmark_baseline.json', help='suite results to compare to'
+    )
+    parser.add_argument(
+        '--save-baseline', action='store_true', help='store the suite results as the baseline'
+    )
+    parser.add_argument('--tolerance', type=float, default=0.25, help='slowdown flagged as a regression')
+    args = parser.parse_args()
+
+    if args.benchmark in ['all', 'workers']:
+        worker_scaling()
+    if args.benchmark in ['all', 'synthesis']:
+        texture_synthesis()
+    if args.benchmark in ['all', 'compositing']:
+        texturize_compositing()
+    if args.benchmark == 'suite':
+        regressions = suite(args.sizes, args.output, args.baseline, args.save_baseline, args.tolerance)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Per-stage timing, memory and counters for site builds and map generation.
+
+Set PYRRHOS_PROFILE to enable it, as a comma-separated list of:
+    timing      wall time and calls of each stage (what any other value enables too)
+    memory      peak traced memory of each stage, plus a tracemalloc snapshot dump
+    cprofile    a cProfile dump of the whole run
+Reports go to PYRRHOS_PROFILE_DIR (cache/profile by default) when the process exits:
+report.json, and profile.prof and memory.snapshot when asked for.
+
+When PYRRHOS_PROFILE is unset, stage() returns a shared do-nothing context,
+timed() returns functions unchanged and count() returns immediately.
+Only the main process reports; stages inside worker processes are not recorded.
+"""
+
+import os
+import time
+import json
+import atexit
+import cProfile
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+options = {
+    option.strip() for option in os.environ.get('PYRRHOS_PROFILE', '').split(',') if option.strip()
+}
+enabled = bool(options)
+directory = os.environ.get('PYRRHOS_PROFILE_DIR', 'cache/profile')
+
+stages = {}
+counters = {}
+_disabled = nullcontext()
+_peaks = []
+_profiler = None
+_start = time.perf_counter()
+_pid = os.getpid()
+
+
+@contextmanager
+def _stage(name):
+    if 'memory' in options:
+        tracemalloc.reset_peak()
+        _peaks.append(0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        record = stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+        record['calls'] += 1
+        record['seconds'] += elapsed
+        record['max_seconds'] = max(record['max_seconds'], elapsed)
+
+        if 'memory' in options:
+            # Nested stages reset the peak, so each hands its own up to the stage around it
+            peak = max(_peaks.pop(), tracemalloc.get_traced_memory()[1])
+            record['peak_bytes'] = max(record.get('peak_bytes', 0), peak)
+            if _peaks:
+                _peaks[-1] = max(_peaks[-1], peak)
+            tracemalloc.reset_peak()
+
+
+def stage(name):
+    return _stage(name) if enabled else _disabled
+
+
+def timed(name=None):
+    # Decorator timing every call of a function as a stage, named after the function by default
+    def decorator(f):
+        if not enabled:
+            return f
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            with _stage(name or f.__qualname__):
+                return f(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name, n=1):
+    if enabled:
+        counters[name] = counters.get(name, 0) + n
+
+
+def report():
+    return {
+        'seconds': time.perf_counter() - _start,
+        'stages': stages,
+        'counters': counters,
+    }
+
+
+def _write_report():
+    if os.getpid() != _pid:
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(os.path.join(directory, 'profile.prof'))
+    if 'memory' in options:
+        tracemalloc.take_snapshot().dump(os.path.join(directory, 'memory.snapshot'))
+
+    with open(os.path.join(directory, 'report.json'), 'w') as f:
+        json.dump(report(), f, indent=1)
+
+
+if enabled:
+    if 'memory' in options:
+        tracemalloc.start()
+    if 'cprofile' in options:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    atexit.register(_write_report)
@@ -1,247 +1,254 @@
-var searchTerms = [
-	`{"long": "Erebos", "short": "Erebos", "link": "geography.html#Erebos"}`,
-	`{"long": "Orestes", "short": "Orestes", "link": "geography.html#Orestes"}`,
-	`{"long": "Piskus", "short": "Piskus", "link": "geography.html#Piskus"}`,
-	`{"long": "Kestren", "short": "Kestren", "link": "geography.html#Kestren"}`,
-	`{"long": "Nardone", "short": "Nardone", "link": "geography.html#Nardone"}`,
-	`{"long": "Isles of Constros", "short": "Isles of Constros", "link": "geography.html#Isles of Constros"}`,
-	`{"long": "The Cloud", "short": "Cloud", "link": "geography.html#The Cloud"}`,
-	`{"long": "Calatios (Erebos)", "short": "Calatios", "link": "politics.html#Calatios (Erebos)"}`,
-	`{"long": "Arrigo (Erebos)", "short": "Arrigo", "link": "politics.html#Arrigo (Erebos)"}`,
-	`{"long": "Galima (Erebos)", "short": "Galima", "link": "politics.html#Galima (Erebos)"}`,
-	`{"long": "Bulus (Erebos)", "short": "Bulus", "link": "politics.html#Bulus (Erebos)"}`,
-	`{"long": "Drusque (Erebos)", "short": "Drusque", "link": "politics.html#Drusque (Erebos)"}`,
-	`{"long": "Kishori (Erebos)", "short": "Kishori", "link": "politics.html#Kishori (Erebos)"}`,
-	`{"long": "Kasseiopia (Erebos)", "short": "Kasseiopia", "link": "politics.html#Kasseiopia (Erebos)"}`,
-	`{"long": "Tiryns (Erebos)", "short": "Tiryns", "link": "politics.html#Tiryns (Erebos)"}`,
-	`{"long": "Demetriades (Erebos)", "short": "Demetriades", "link": "politics.html#Demetriades (Erebos)"}`,
-	`{"long": "New Nardone (Erebos)", "short": "New Nardone", "link": "politics.html#New Nardone (Erebos)"}`,
-	`{"long": "Vasileios (Erebos)", "short": "Vasileios", "link": "politics.html#Vasileios (Erebos)"}`,
-	`{"long": "Megaera (Orestes)", "short": "Megaera", "link": "politics.html#Megaera (Orestes)"}`,
-	`{"long": "Kalistos (Orestes)", "short": "Kalistos", "link": "politics.html#Kalistos (Orestes)"}`,
-	`{"long": "Firbolg Villages (Piskus)", "short": "Firbolg Villages", "link": "politics.html#Firbolg Villages (Piskus)"}`,
-	`{"long": "Tortle Villages (Piskus)", "short": "Tortle Villages", "link": "politics.html#Tortle Villages (Piskus)"}`,
-	`{"long": "The Kingdom of Lizael (Piskus)", "short": "Kingdom of Lizael", "link": "politics.html#The Kingdom of Lizael (Piskus)"}`,
-	`{"long": "The Piskus Colonies (Piskus)", "short": "Piskus Colonies", "link": "politics.html#The Piskus Colonies (Piskus)"}`,
-	`{"long": "Calatios", "short": "Calatios", "link": "politics.html#Calatios"}`,
-	`{"long": "Kishori", "short": "Kishori", "link": "politics.html#Kishori"}`,
-	`{"long": "Arrigo", "short": "Arrigo", "link": "politics.html#Arrigo"}`,
-	`{"long": "The Giant Caves (Kestren)", "short": "Giant Caves", "link": "politics.html#The Giant Caves (Kestren)"}`,
-	`{"long": "The Goliath Nomads (Kestren)", "short": "Goliath Nomads", "link": "politics.html#The Goliath Nomads (Kestren)"}`,
-	`{"long": "The Orcish Nomads (Kestren)", "short": "Orcish Nomads", "link": "politics.html#The Orcish Nomads (Kestren)"}`,
-	`{"long": "The Aarakocra Peaks (Kestren)", "short": "Aarakocra Peaks", "link": "politics.html#The Aarakocra Peaks (Kestren)"}`,
-	`{"long": "The Kenku Valleys (Kestren)", "short": "Kenku Valleys", "link": "politics.html#The Kenku Valleys (Kestren)"}`,
-	`{"long": "Haven Town (Kestren)", "short": "Haven Town", "link": "politics.html#Haven Town (Kestren)"}`,
-	`{"long": "Ngana (Constros)", "short": "Ngana", "link": "politics.html#Ngana (Constros)"}`,
-	`{"long": "Gemelo [hem-ello] (Constros)", "short": "Gemelo", "link": "politics.html#Gemelo [hem-ello] (Constros)"}`,
-	`{"long": "Marcella (Constros)", "short": "Marcella", "link": "politics.html#Marcella (Constros)"}`,
-	`{"long": "New Kishori (Constros)", "short": "New Kishori", "link": "politics.html#New Kishori (Constros)"}`,
-	`{"long": "Human", "short": "Human", "link": "races.html#Human"}`,
-	`{"long": "Elf", "short": "Elf", "link": "races.html#Elf"}`,
-	`{"long": "Half-Elf (Khoravar)", "short": "Half-Elf", "link": "races.html#Half-Elf (Khoravar)"}`,
-	`{"long": "Changeling (Khoravar)", "short": "Changeling", "link": "races.html#Changeling (Khoravar)"}`,
-	`{"long": "Dwarf", "short": "Dwarf", "link": "races.html#Dwarf"}`,
-	`{"long": "Tabaxi", "short": "Tabaxi", "link": "races.html#Tabaxi"}`,
-	`{"long": "Goliath", "short": "Goliath", "link": "races.html#Goliath"}`,
-	`{"long": "Orc", "short": "Orc", "link": "races.html#Orc"}`,
-	`{"long": "Half-Orc", "short": "Half-Orc", "link": "races.html#Half-Orc"}`,
-	`{"long": "Aarakocra", "short": "Aarakocra", "link": "races.html#Aarakocra"}`,
-	`{"long": "Kenku", "short": "Kenku", "link": "races.html#Kenku"}`,
-	`{"long": "Kobold", "short": "Kobold", "link": "races.html#Kobold"}`,
-	`{"long": "Tortle", "short": "Tortle", "link": "races.html#Tortle"}`,
-	`{"long": "Hobgoblin", "short": "Hobgoblin", "link": "races.html#Hobgoblin"}`,
-	`{"long": "Goblin", "short": "Goblin", "link": "races.html#Goblin"}`,
-	`{"long": "Bugbear", "short": "Bugbear", "link": "races.html#Bugbear"}`,
-	`{"long": "Shifter", "short": "Shifter", "link": "races.html#Shifter"}`,
-	`{"long": "Loxodon", "short": "Loxodon", "link": "races.html#Loxodon"}`,
-	`{"long": "Centaur", "short": "Centaur", "link": "races.html#Centaur"}`,
-	`{"long": "Minotaur", "short": "Minotaur", "link": "races.html#Minotaur"}`,
-	`{"long": "Drow", "short": "Drow", "link": "races.html#Drow"}`,
-	`{"long": "Tiefling", "short": "Tiefling", "link": "races.html#Tiefling"}`,
-	`{"long": "Aasimar", "short": "Aasimar", "link": "races.html#Aasimar"}`,
-	`{"long": "Firbolg", "short": "Firbolg", "link": "races.html#Firbolg"}`,
-	`{"long": "Lizardfolk", "short": "Lizardfolk", "link": "races.html#Lizardfolk"}`,
-	`{"long": "Triton", "short": "Triton", "link": "races.html#Triton"}`,
-	`{"long": "Kalashtar", "short": "Kalashtar", "link": "races.html#Kalashtar"}`,
-	`{"long": "Warforged", "short": "Warforged", "link": "races.html#Warforged"}`,
-	`{"long": "Dragonborn", "short": "Dragonborn", "link": "races.html#Dragonborn"}`,
-	`{"long": "Gnome", "short": "Gnome", "link": "races.html#Gnome"}`,
-	`{"long": "Halfling", "short": "Halfling", "link": "races.html#Halfling"}`,
-	`{"long": "Genasi", "short": "Genasi", "link": "races.html#Genasi"}`,
-	`{"long": "Vedalken", "short": "Vedalken", "link": "races.html#Vedalken"}`,
-	`{"long": "Satyr", "short": "Satyr", "link": "races.html#Satyr"}`,
-	`{"long": "Simic Hybrid", "short": "Simic Hybrid", "link": "races.html#Simic Hybrid"}`,
-	`{"long": "Giant", "short": "Giant", "link": "races.html#Giant"}`,
-	`{"long": "The Major Gods", "short": "Major Gods", "link": "religion.html#The Major Gods"}`,
-	`{"long": "Volkmer", "short": "Volkmer", "link": "religion.html#Volkmer"}`,
-	`{"long": "Tiya", "short": "Tiya", "link": "religion.html#Tiya"}`,
-	`{"long": "Pyrin", "short": "Pyrin", "link": "religion.html#Pyrin"}`,
-	`{"long": "Shaylar\u00e8", "short": "Shaylare", "link": "religion.html#Shaylar\u00e8"}`,
-	`{"long": "Chyrillus", "short": "Chyrillus", "link": "religion.html#Chyrillus"}`,
-	`{"long": "Einar", "short": "Einar", "link": "religion.html#Einar"}`,
-	`{"long": "Ayla", "short": "Ayla", "link": "religion.html#Ayla"}`,
-	`{"long": "Kor", "short": "Kor", "link": "religion.html#Kor"}`,
-	`{"long": "Archeptolemus", "short": "Archeptolemus", "link": "religion.html#Archeptolemus"}`,
-	`{"long": "Prothous", "short": "Prothous", "link": "religion.html#Prothous"}`,
-	`{"long": "Adour", "short": "Adour", "link": "religion.html#Adour"}`,
-	`{"long": "Nevaeh", "short": "Nevaeh", "link": "religion.html#Nevaeh"}`,
-	`{"long": "Zethos", "short": "Zethos", "link": "religion.html#Zethos"}`,
-	`{"long": "The Minor Gods", "short": "Minor Gods", "link": "religion.html#The Minor Gods"}`,
-	`{"long": "Nechtu", "short": "Nechtu", "link": "religion.html#Nechtu"}`,
-	`{"long": "Loriana", "short": "Loriana", "link": "religion.html#Loriana"}`,
-	`{"long": "Iosepha", "short": "Iosepha", "link": "religion.html#Iosepha"}`,
-	`{"long": "Callicles", "short": "Callicles", "link": "religion.html#Callicles"}`,
-	`{"long": "Gulkishar", "short": "Gulkishar", "link": "religion.html#Gulkishar"}`,
-	`{"long": "Av\u00e8", "short": "Ave", "link": "religion.html#Av\u00e8"}`,
-	`{"long": "Golmala", "short": "Golmala", "link": "religion.html#Golmala"}`,
-	`{"long": "Quiro", "short": "Quiro", "link": "religion.html#Quiro"}`,
-	`{"long": "Thov\u00e8", "short": "Thove", "link": "religion.html#Thov\u00e8"}`,
-	`{"long": "Hurmut", "short": "Hurmut", "link": "religion.html#Hurmut"}`,
-	`{"long": "Nthanda", "short": "Nthanda", "link": "religion.html#Nthanda"}`,
-	`{"long": "Sorcerous Houses", "short": "Sorcerous Houses", "link": "religion.html#Sorcerous Houses"}`,
-	`{"long": "House of Volkmer", "short": "House of Volkmer", "link": "religion.html#House of Volkmer"}`,
-	`{"long": "House of Pyrin", "short": "House of Pyrin", "link": "religion.html#House of Pyrin"}`,
-	`{"long": "House of Kor", "short": "House of Kor", "link": "religion.html#House of Kor"}`,
-	`{"long": "House of Nevaeh", "short": "House of Nevaeh", "link": "religion.html#House of Nevaeh"}`,
-	`{"long": "House of Adour", "short": "House of Adour", "link": "religion.html#House of Adour"}`,
-	`{"long": "House of Shaylar\u00e8", "short": "House of Shaylare", "link": "religion.html#House of Shaylar\u00e8"}`,
-	`{"long": "House of Chyrillus", "short": "House of Chyrillus", "link": "religion.html#House of Chyrillus"}`,
-	`{"long": "Fiends", "short": "Fiend", "link": "monsters.html#Fiends"}`,
-	`{"long": "Aberrations", "short": "Aberration", "link": "monsters.html#Aberrations"}`,
-	`{"long": "Beasts", "short": "Beast", "link": "monsters.html#Beasts"}`,
-	`{"long": "Celestials", "short": "Celestial", "link": "monsters.html#Celestials"}`,
-	`{"long": "Monstrosities", "short": "Monstrositie", "link": "monsters.html#Monstrosities"}`,
-	`{"long": "Plants", "short": "Plant", "link": "monsters.html#Plants"}`,
-	`{"long": "Fey", "short": "Fey", "link": "monsters.html#Fey"}`,
-	`{"long": "Undead", "short": "Undead", "link": "monsters.html#Undead"}`,
-	`{"long": "Constructs", "short": "Construct", "link": "monsters.html#Constructs"}`,
-	`{"long": "Elementals", "short": "Elemental", "link": "monsters.html#Elementals"}`,
-	`{"long": "Unique Monsters", "short": "Unique Monster", "link": "monsters.html#Unique Monsters"}`,
-	`{"long": "Ankris the Conqueror", "short": "Ankris", "link": "demons.html#Ankris the Conqueror"}`,
-	`{"long": "Minos the Disgraced", "short": "Minos", "link": "demons.html#Minos the Disgraced"}`,
-	`{"long": "Yorqiroth the Black Glutton", "short": "Yorqiroth", "link": "demons.html#Yorqiroth the Black Glutton"}`,
-	`{"long": "Ralmong the Demented Razer", "short": "Ralmong", "link": "demons.html#Ralmong the Demented Razer"}`,
-	`{"long": "Animos the Twins of Hatred", "short": "Animos", "link": "demons.html#Animos the Twins of Hatred"}`,
-	`{"long": "Tyf\u00f3nas the Elder Tempest", "short": "Tyfonas", "link": "demons.html#Tyf\u00f3nas the Elder Tempest"}`,
-	`{"long": "Agni the Were-chimera", "short": "Agni", "link": "demons.html#Agni the Were-chimera"}`,
-	`{"long": "Colimune the Mindless Consumer", "short": "Colimune", "link": "demons.html#Colimune the Mindless Consumer"}`,
-	`{"long": "Ar\u2019or the Puppeteer", "short": "Ar'or", "link": "demons.html#Ar\u2019or the Puppeteer"}`,
-	`{"long": "Vito the Profiteer", "short": "Vito", "link": "demons.html#Vito the Profiteer"}`,
-	`{"long": "Lorelei the Faceless Queen", "short": "Lorelei", "link": "demons.html#Lorelei the Faceless Queen"}`,
-	`{"long": "Elementally Touched Areas", "short": "Elementally Touched Areas", "link": "cosmology.html#Elementally Touched Areas"}`,
-	`{"long": "The Feywild", "short": "Feywild", "link": "cosmology.html#The Feywild"}`,
-	`{"long": "The Shadowfell", "short": "Shadowfell", "link": "cosmology.html#The Shadowfell"}`,
-	`{"long": "The Spirit Plane", "short": "Spirit Plane", "link": "cosmology.html#The Spirit Plane"}`,
-	`{"long": "Celestia", "short": "Celestia", "link": "cosmology.html#Celestia"}`,
-	`{"long": "The Ethereal Plane", "short": "Ethereal Plane", "link": "cosmology.html#The Ethereal Plane"}`,
-	`{"long": "The Material Plane", "short": "Material Plane", "link": "cosmology.html#The Material Plane"}`,
-	`{"long": "Blasting Chime", "short": "Blasting Chime", "link": "items.html#Blasting Chime"}`,
-	`{"long": "Behemoth Belt", "short": "Behemoth Belt", "link": "items.html#Behemoth Belt"}`,
-	`{"long": "Tracker Mask", "short": "Tracker Mask", "link": "items.html#Tracker Mask"}`,
-	`{"long": "Goodberry Wine", "short": "Goodberry Wine", "link": "items.html#Goodberry Wine"}`,
-	`{"long": "Balor\u2019s Power Eye", "short": "Balor's Power Eye", "link": "items.html#Balor\u2019s Power Eye"}`,
-	`{"long": "Gun", "short": "Gun", "link": "items.html#Gun"}`,
-	`{"long": "Bow of Piercing", "short": "Bow of Piercing", "link": "items.html#Bow of Piercing"}`,
-	`{"long": "Teddy Bear of Encouragement", "short": "Teddy Bear of Encouragement", "link": "items.html#Teddy Bear of Encouragement"}`,
-	`{"long": "Cat\u2019s Paws", "short": "Cat's Paws", "link": "items.html#Cat\u2019s Paws"}`,
-	`{"long": "Throwing Knife of Distance", "short": "Throwing Knife of Distance", "link": "items.html#Throwing Knife of Distance"}`,
-	`{"long": "Ambrosia", "short": "Ambrosia", "link": "items.html#Ambrosia"}`,
-	`{"long": "Frozen Flower", "short": "Frozen Flower", "link": "items.html#Frozen Flower"}`,
-	`{"long": "Ring of Armor Conjuration", "short": "Ring of Armor Conjuration", "link": "items.html#Ring of Armor Conjuration"}`,
-	`{"long": "Spartan Boots", "short": "Spartan Boots", "link": "items.html#Spartan Boots"}`,
-	`{"long": "Steps of the Wind", "short": "Steps of", "link": "items.html#Steps of the Wind"}`,
-	`{"long": "Amulet of Nimble Escape", "short": "Amulet of Nimble Escape", "link": "items.html#Amulet of Nimble Escape"}`,
-	`{"long": "A Familiar Totem", "short": "Familiar Totem", "link": "items.html#A Familiar Totem"}`,
-	`{"long": "Time Freeze Pouch", "short": "Time Freeze Pouch", "link": "items.html#Time Freeze Pouch"}`,
-	`{"long": "Skulker Bow", "short": "Skulker Bow", "link": "items.html#Skulker Bow"}`,
-	`{"long": "Firestarter Gloves", "short": "Firestarter Gloves", "link": "items.html#Firestarter Gloves"}`,
-	`{"long": "Ice Sculptor Gloves", "short": "Ice Sculptor Gloves", "link": "items.html#Ice Sculptor Gloves"}`,
-	`{"long": "Handyman\u2019s Hammer", "short": "Handyman's Hammer", "link": "items.html#Handyman\u2019s Hammer"}`,
-	`{"long": "Narrating Storybook", "short": "Narrating Storybook", "link": "items.html#Narrating Storybook"}`,
-	`{"long": "RPD", "short": "RPD", "link": "items.html#RPD"}`,
-	`{"long": "Flame Dust", "short": "Flame Dust", "link": "items.html#Flame Dust"}`,
-	`{"long": "Temperate Cloak", "short": "Temperate Cloak", "link": "items.html#Temperate Cloak"}`,
-	`{"long": "Pen of Preparation", "short": "Pen of Preparation", "link": "items.html#Pen of Preparation"}`,
-	`{"long": "Wand of Household Magic", "short": "Wand of Household Magic", "link": "items.html#Wand of Household Magic"}`,
-	`{"long": "Shield of Repercussion", "short": "Shield of Repercussion", "link": "items.html#Shield of Repercussion"}`,
-	`{"long": "Armor of Inversion", "short": "Armor of Inversion", "link": "items.html#Armor of Inversion"}`,
-	`{"long": "Phalanx Shield", "short": "Phalanx Shield", "link": "items.html#Phalanx Shield"}`,
-	`{"long": "Deft Bow", "short": "Deft Bow", "link": "items.html#Deft Bow"}`,
-	`{"long": "Gravity Blade", "short": "Gravity Blade", "link": "items.html#Gravity Blade"}`,
-	`{"long": "Gravekeeper\u2019s Tools:", "short": "Gravekeeper's Tools:", "link": "items.html#Gravekeeper\u2019s Tools:"}`,
-	`{"long": "Gravekeeper\u2019s Spade", "short": "Gravekeeper's Spade", "link": "items.html#Gravekeeper\u2019s Spade"}`,
-	`{"long": "Chain of the Gravekeeper", "short": "Chain of", "link": "items.html#Chain of the Gravekeeper"}`,
-	`{"long": "Coat of the Gravekeeper", "short": "Coat of", "link": "items.html#Coat of the Gravekeeper"}`,
-	`{"long": "Momentary Strength Bandanna", "short": "Momentary Strength Bandanna", "link": "items.html#Momentary Strength Bandanna"}`,
-	`{"long": "Spatial Pocket Ring", "short": "Spatial Pocket Ring", "link": "items.html#Spatial Pocket Ring"}`,
-	`{"long": "Discerning Eye", "short": "Discerning Eye", "link": "items.html#Discerning Eye"}`,
-	`{"long": "Venusdonoa", "short": "Venusdonoa", "link": "items.html#Venusdonoa"}`,
-	`{"long": "Evosferrum", "short": "Evosferrum", "link": "items.html#Evosferrum"}`,
-	`{"long": "The Poisoner\u2019s Pillbox", "short": "Poisoner's Pillbox", "link": "items.html#The Poisoner\u2019s Pillbox"}`,
-	`{"long": "Flamberge", "short": "Flamberge", "link": "items.html#Flamberge"}`,
-	`{"long": "Malachite", "short": "Malachite", "link": "items.html#Malachite"}`,
-	`{"long": "The Stake Pusher", "short": "Stake Pusher", "link": "items.html#The Stake Pusher"}`,
-	`{"long": "Cloak of Wandering", "short": "Cloak of Wandering", "link": "items.html#Cloak of Wandering"}`,
-	`{"long": "Scholar\u2019s Notebook", "short": "Scholar's Notebook", "link": "items.html#Scholar\u2019s Notebook"}`,
-	`{"long": "Woodcutter\u2019s Axe", "short": "Woodcutter's Axe", "link": "items.html#Woodcutter\u2019s Axe"}`,
-	`{"long": "The Bowstaff", "short": "Bowstaff", "link": "items.html#The Bowstaff"}`,
-	`{"long": "Ring of Maneuverability", "short": "Ring of Maneuverability", "link": "items.html#Ring of Maneuverability"}`,
-	`{"long": "Magical Grenade (Blank)", "short": "Magical Grenade", "link": "items.html#Magical Grenade (Blank)"}`,
-	`{"long": "Magical Grenade (Filled)", "short": "Magical Grenade", "link": "items.html#Magical Grenade (Filled)"}`,
-	`{"long": "Magic Eater\u2019s Mask", "short": "Magic Eater's Mask", "link": "items.html#Magic Eater\u2019s Mask"}`,
-	`{"long": "Protective Chain Collar", "short": "Protective Chain Collar", "link": "items.html#Protective Chain Collar"}`,
-	`{"long": "Chromatic Anklet", "short": "Chromatic Anklet", "link": "items.html#Chromatic Anklet"}`,
-	`{"long": "Ring of Very Minor Protection", "short": "Ring of Very Minor Protection", "link": "items.html#Ring of Very Minor Protection"}`,
-	`{"long": "Band of the Brawler", "short": "Band of", "link": "items.html#Band of the Brawler"}`,
-	`{"long": "Manasteel Ingot", "short": "Manasteel Ingot", "link": "items.html#Manasteel Ingot"}`,
-	`{"long": "Bounce Back Sash", "short": "Bounce Back Sash", "link": "items.html#Bounce Back Sash"}`,
-	`{"long": "Musashi\u2019s Blades", "short": "Musashi's Blades", "link": "items.html#Musashi\u2019s Blades"}`,
-	`{"long": "Heedless Hammer", "short": "Heedless Hammer", "link": "items.html#Heedless Hammer"}`,
-	`{"long": "Lull", "short": "Lull", "link": "items.html#Lull"}`,
-	`{"long": "Mirror of Retaliation", "short": "Mirror of Retaliation", "link": "items.html#Mirror of Retaliation"}`,
-	`{"long": "Grudge Orb", "short": "Grudge Orb", "link": "items.html#Grudge Orb"}`,
-	`{"long": "Boots of Sure Footing", "short": "Boots of Sure Footing", "link": "items.html#Boots of Sure Footing"}`,
-	`{"long": "Pass-Through Blade", "short": "Pass-Through Blade", "link": "items.html#Pass-Through Blade"}`,
-	`{"long": "The Markless Stiletto", "short": "Markless Stiletto", "link": "items.html#The Markless Stiletto"}`,
-	`{"long": "Robes of The Paranoid Mage", "short": "Robes of The Paranoid Mage", "link": "items.html#Robes of The Paranoid Mage"}`,
-	`{"long": "Abelheim\u2019s Instant Equipment", "short": "Abelheim's Instant Equipment", "link": "items.html#Abelheim\u2019s Instant Equipment"}`,
-	`{"long": "Commanding Crown", "short": "Commanding Crown", "link": "items.html#Commanding Crown"}`,
-	`{"long": "Ring of Eloquence", "short": "Ring of Eloquence", "link": "items.html#Ring of Eloquence"}`,
-	`{"long": "The Violin of Pacing", "short": "Violin of Pacing", "link": "items.html#The Violin of Pacing"}`,
-	`{"long": "Brand of Retribution", "short": "Brand of Retribution", "link": "items.html#Brand of Retribution"}`,
-	`{"long": "Token of Versatility", "short": "Token of Versatility", "link": "items.html#Token of Versatility"}`,
-	`{"long": "Contacts of Quick Reaction", "short": "Contacts of Quick Reaction", "link": "items.html#Contacts of Quick Reaction"}`,
-	`{"long": "Rod of Seclusion", "short": "Rod of Seclusion", "link": "items.html#Rod of Seclusion"}`,
-	`{"long": "The Sheikah Slate", "short": "Sheikah Slate", "link": "items.html#The Sheikah Slate"}`,
-	`{"long": "Spectacles of Spell Analyzation", "short": "Spectacles of Spell Analyzation", "link": "items.html#Spectacles of Spell Analyzation"}`,
-	`{"long": "Meteorite", "short": "Meteorite", "link": "items.html#Meteorite"}`,
-	`{"long": "Sword of Mercy", "short": "Sword of Mercy", "link": "items.html#Sword of Mercy"}`,
-	`{"long": "Sword of Judgement", "short": "Sword of Judgement", "link": "items.html#Sword of Judgement"}`,
-	`{"long": "Handkerchief of Cleanliness", "short": "Handkerchief of Cleanliness", "link": "items.html#Handkerchief of Cleanliness"}`,
-	`{"long": "Ring of Skill: Distant Strike", "short": "Ring of Skill: Distant Strike", "link": "items.html#Ring of Skill: Distant Strike"}`,
-	`{"long": "Void Link", "short": "Void Link", "link": "items.html#Void Link"}`,
-	`{"long": "Giant Door Shield", "short": "Giant Door Shield", "link": "items.html#Giant Door Shield"}`,
-	`{"long": "Tythalamos\u2019 Helm", "short": "Tythalamos' Helm", "link": "items.html#Tythalamos\u2019 Helm"}`,
-	`{"long": "Ring of Crisis", "short": "Ring of Crisis", "link": "items.html#Ring of Crisis"}`,
-	`{"long": "Luck\u2019s Shield", "short": "Luck's Shield", "link": "items.html#Luck\u2019s Shield"}`
-]
-
-function search(searchInput) {
-    for (i = 0; i < searchTerms.length; i++) {
-        var term = JSON.parse(searchTerms[i].toString());
-        if (term.short.toLowerCase() == searchInput || term.long.toLowerCase() == searchInput) {
-            window.location.href = term.link;
+var searchIndex = {"terms":[["Erebos","geography.html#Erebos"],["Orestes","geography.html#Orestes"],["Piskus","geography.html#Piskus"],["Kestren","geography.html#Kestren"],["Nardone","geography.html#Nardone"],["Isles of Constros","geography.html#Isles of Constros"],["The Cloud","geography.html#The Cloud"],["Calatios (Erebos)","politics.html#Calatios (Erebos)"],["Arrigo (Erebos)","politics.html#Arrigo (Erebos)"],["Galima (Erebos)","politics.html#Galima (Erebos)"],["Bulus (Erebos)","politics.html#Bulus (Erebos)"],["Drusque (Erebos)","politics.html#Drusque (Erebos)"],["Kishori (Erebos)","politics.html#Kishori (Erebos)"],["Kasseiopia (Erebos)","politics.html#Kasseiopia (Erebos)"],["Tiryns (Erebos)","politics.html#Tiryns (Erebos)"],["Demetriades (Erebos)","politics.html#Demetriades (Erebos)"],["New Nardone (Erebos)","politics.html#New Nardone (Erebos)"],["Vasileios (Erebos)","politics.html#Vasileios (Erebos)"],["Megaera (Orestes)","politics.html#Megaera (Orestes)"],["Kalistos (Orestes)","politics.html#Kalistos (Orestes)"],["Firbolg Villages (Piskus)","politics.html#Firbolg Villages (Piskus)"],["Tortle Villages (Piskus)","politics.html#Tortle Villages (Piskus)"],["The Kingdom of Lizael (Piskus)","politics.html#The Kingdom of Lizael (Piskus)"],["The Piskus Colonies (Piskus)","politics.html#The Piskus Colonies (Piskus)"],["Calatios","politics.html#Calatios"],["Kishori","politics.html#Kishori"],["Arrigo","politics.html#Arrigo"],["The Giant Caves (Kestren)","politics.html#The Giant Caves (Kestren)"],["The Goliath Nomads (Kestren)","politics.html#The Goliath Nomads (Kestren)"],["The Orcish Nomads (Kestren)","politics.html#The Orcish Nomads (Kestren)"],["The Aarakocra Peaks (Kestren)","politics.html#The Aarakocra Peaks (Kestren)"],["The Kenku Valleys (Kestren)","politics.html#The Kenku Valleys (Kestren)"],["Haven Town (Kestren)","politics.html#Haven Town (Kestren)"],["Ngana (Constros)","politics.html#Ngana (Constros)"],["Gemelo [hem-ello] (Constros)","politics.html#Gemelo [hem-ello] (Constros)"],["Marcella (Constros)","politics.html#Marcella (Constros)"],["New Kishori (Constros)","politics.html#New Kishori (Constros)"],["Human","races.html#Human"],["Elf","races.html#Elf"],["Half-Elf (Khoravar)","races.html#Half-Elf (Khoravar)"],["Changeling (Khoravar)","races.html#Changeling (Khoravar)"],["Dwarf","races.html#Dwarf"],["Tabaxi","races.html#Tabaxi"],["Goliath","races.html#Goliath"],["Orc","races.html#Orc"],["Half-Orc","races.html#Half-Orc"],["Aarakocra","races.html#Aarakocra"],["Kenku","races.html#Kenku"],["Kobold","races.html#Kobold"],["Tortle","races.html#Tortle"],["Hobgoblin","races.html#Hobgoblin"],["Goblin","races.html#Goblin"],["Bugbear","races.html#Bugbear"],["Shifter","races.html#Shifter"],["Loxodon","races.html#Loxodon"],["Centaur","races.html#Centaur"],["Minotaur","races.html#Minotaur"],["Drow","races.html#Drow"],["Tiefling","races.html#Tiefling"],["Aasimar","races.html#Aasimar"],["Firbolg","races.html#Firbolg"],["Lizardfolk","races.html#Lizardfolk"],["Triton","races.html#Triton"],["Kalashtar","races.html#Kalashtar"],["Warforged","races.html#Warforged"],["Dragonborn","races.html#Dragonborn"],["Gnome","races.html#Gnome"],["Halfling","races.html#Halfling"],["Genasi","races.html#Genasi"],["Vedalken","races.html#Vedalken"],["Satyr","races.html#Satyr"],["Simic Hybrid","races.html#Simic Hybrid"],["Giant","races.html#Giant"],["The Major Gods","religion.html#The Major Gods"],["Volkmer","religion.html#Volkmer"],["Tiya","religion.html#Tiya"],["Pyrin","religion.html#Pyrin"],["Shaylar\u00e8","religion.html#Shaylar\u00e8"],["Chyrillus","religion.html#Chyrillus"],["Einar","religion.html#Einar"],["Ayla","religion.html#Ayla"],["Kor","religion.html#Kor"],["Archeptolemus","religion.html#Archeptolemus"],["Prothous","religion.html#Prothous"],["Adour","religion.html#Adour"],["Nevaeh","religion.html#Nevaeh"],["Zethos","religion.html#Zethos"],["The Minor Gods","religion.html#The Minor Gods"],["Nechtu","religion.html#Nechtu"],["Loriana","religion.html#Loriana"],["Iosepha","religion.html#Iosepha"],["Callicles","religion.html#Callicles"],["Gulkishar","religion.html#Gulkishar"],["Av\u00e8","religion.html#Av\u00e8"],["Golmala","religion.html#Golmala"],["Quiro","religion.html#Quiro"],["Thov\u00e8","religion.html#Thov\u00e8"],["Hurmut","religion.html#Hurmut"],["Nthanda","religion.html#Nthanda"],["Sorcerous Houses","religion.html#Sorcerous Houses"],["House of Volkmer","religion.html#House of Volkmer"],["House of Pyrin","religion.html#House of Pyrin"],["House of Kor","religion.html#House of Kor"],["House of Nevaeh","religion.html#House of Nevaeh"],["House of Adour","religion.html#House of Adour"],["House of Shaylar\u00e8","religion.html#House of Shaylar\u00e8"],["House of Chyrillus","religion.html#House of Chyrillus"],["Fiends","monsters.html#Fiends"],["Aberrations","monsters.html#Aberrations"],["Beasts","monsters.html#Beasts"],["Celestials","monsters.html#Celestials"],["Monstrosities","monsters.html#Monstrosities"],["Plants","monsters.html#Plants"],["Fey","monsters.html#Fey"],["Undead","monsters.html#Undead"],["Constructs","monsters.html#Constructs"],["Elementals","monsters.html#Elementals"],["Unique Monsters","monsters.html#Unique Monsters"],["Ankris the Conqueror","demons.html#Ankris the Conqueror"],["Minos the Disgraced","demons.html#Minos the Disgraced"],["Yorqiroth the Black Glutton","demons.html#Yorqiroth the Black Glutton"],["Ralmong the Demented Razer","demons.html#Ralmong the Demented Razer"],["Animos the Twins of Hatred","demons.html#Animos the Twins of Hatred"],["Tyf\u00f3nas the Elder Tempest","demons.html#Tyf\u00f3nas the Elder Tempest"],["Agni the Were-chimera","demons.html#Agni the Were-chimera"],["Colimune the Mindless Consumer","demons.html#Colimune the Mindless Consumer"],["Ar\u2019or the Puppeteer","demons.html#Ar\u2019or the Puppeteer"],["Vito the Profiteer","demons.html#Vito the Profiteer"],["Lorelei the Faceless Queen","demons.html#Lorelei the Faceless Queen"],["Elementally Touched Areas","cosmology.html#Elementally Touched Areas"],["The Feywild","cosmology.html#The Feywild"],["The Shadowfell","cosmology.html#The Shadowfell"],["The Spirit Plane","cosmology.html#The Spirit Plane"],["Celestia","cosmology.html#Celestia"],["The Ethereal Plane","cosmology.html#The Ethereal Plane"],["The Material Plane","cosmology.html#The Material Plane"],["Blasting Chime","items.html#Blasting Chime"],["Behemoth Belt","items.html#Behemoth Belt"],["Tracker Mask","items.html#Tracker Mask"],["Goodberry Wine","items.html#Goodberry Wine"],["Balor\u2019s Power Eye","items.html#Balor\u2019s Power Eye"],["Gun","items.html#Gun"],["Bow of Piercing","items.html#Bow of Piercing"],["Teddy Bear of Encouragement","items.html#Teddy Bear of Encouragement"],["Cat\u2019s Paws","items.html#Cat\u2019s Paws"],["Throwing Knife of Distance","items.html#Throwing Knife of Distance"],["Ambrosia","items.html#Ambrosia"],["Frozen Flower","items.html#Frozen Flower"],["Ring of Armor Conjuration","items.html#Ring of Armor Conjuration"],["Spartan Boots","items.html#Spartan Boots"],["Steps of the Wind","items.html#Steps of the Wind"],["Amulet of Nimble Escape","items.html#Amulet of Nimble Escape"],["A Familiar Totem","items.html#A Familiar Totem"],["Time Freeze Pouch","items.html#Time Freeze Pouch"],["Skulker Bow","items.html#Skulker Bow"],["Firestarter Gloves","items.html#Firestarter Gloves"],["Ice Sculptor Gloves","items.html#Ice Sculptor Gloves"],["Handyman\u2019s Hammer","items.html#Handyman\u2019s Hammer"],["Narrating Storybook","items.html#Narrating Storybook"],["RPD","items.html#RPD"],["Flame Dust","items.html#Flame Dust"],["Temperate Cloak","items.html#Temperate Cloak"],["Pen of Preparation","items.html#Pen of Preparation"],["Wand of Household Magic","items.html#Wand of Household Magic"],["Shield of Repercussion","items.html#Shield of Repercussion"],["Armor of Inversion","items.html#Armor of Inversion"],["Phalanx Shield","items.html#Phalanx Shield"],["Deft Bow","items.html#Deft Bow"],["Gravity Blade","items.html#Gravity Blade"],["Gravekeeper\u2019s Tools:","items.html#Gravekeeper\u2019s Tools:"],["Gravekeeper\u2019s Spade","items.html#Gravekeeper\u2019s Spade"],["Chain of the Gravekeeper","items.html#Chain of the Gravekeeper"],["Coat of the Gravekeeper","items.html#Coat of the Gravekeeper"],["Momentary Strength Bandanna","items.html#Momentary Strength Bandanna"],["Spatial Pocket Ring","items.html#Spatial Pocket Ring"],["Discerning Eye","items.html#Discerning Eye"],["Venusdonoa","items.html#Venusdonoa"],["Evosferrum","items.html#Evosferrum"],["The Poisoner\u2019s Pillbox","items.html#The Poisoner\u2019s Pillbox"],["Flamberge","items.html#Flamberge"],["Malachite","items.html#Malachite"],["The Stake Pusher","items.html#The Stake Pusher"],["Cloak of Wandering","items.html#Cloak of Wandering"],["Scholar\u2019s Notebook","items.html#Scholar\u2019s Notebook"],["Woodcutter\u2019s Axe","items.html#Woodcutter\u2019s Axe"],["The Bowstaff","items.html#The Bowstaff"],["Ring of Maneuverability","items.html#Ring of Maneuverability"],["Magical Grenade (Blank)","items.html#Magical Grenade (Blank)"],["Magical Grenade (Filled)","items.html#Magical Grenade (Filled)"],["Magic Eater\u2019s Mask","items.html#Magic Eater\u2019s Mask"],["Protective Chain Collar","items.html#Protective Chain Collar"],["Chromatic Anklet","items.html#Chromatic Anklet"],["Ring of Very Minor Protection","items.html#Ring of Very Minor Protection"],["Band of the Brawler","items.html#Band of the Brawler"],["Manasteel Ingot","items.html#Manasteel Ingot"],["Bounce Back Sash","items.html#Bounce Back Sash"],["Musashi\u2019s Blades","items.html#Musashi\u2019s Blades"],["Heedless Hammer","items.html#Heedless Hammer"],["Lull","items.html#Lull"],["Mirror of Retaliation","items.html#Mirror of Retaliation"],["Grudge Orb","items.html#Grudge Orb"],["Boots of Sure Footing","items.html#Boots of Sure Footing"],["Pass-Through Blade","items.html#Pass-Through Blade"],["The Markless Stiletto","items.html#The Markless Stiletto"],["Robes of The Paranoid Mage","items.html#Robes of The Paranoid Mage"],["Abelheim\u2019s Instant Equipment","items.html#Abelheim\u2019s Instant Equipment"],["Commanding Crown","items.html#Commanding Crown"],["Ring of Eloquence","items.html#Ring of Eloquence"],["The Violin of Pacing","items.html#The Violin of Pacing"],["Brand of Retribution","items.html#Brand of Retribution"],["Token of Versatility","items.html#Token of Versatility"],["Contacts of Quick Reaction","items.html#Contacts of Quick Reaction"],["Rod of Seclusion","items.html#Rod of Seclusion"],["The Sheikah Slate","items.html#The Sheikah Slate"],["Spectacles of Spell Analyzation","items.html#Spectacles of Spell Analyzation"],["Meteorite","items.html#Meteorite"],["Sword of Mercy","items.html#Sword of Mercy"],["Sword of Judgement","items.html#Sword of Judgement"],["Handkerchief of Cleanliness","items.html#Handkerchief of Cleanliness"],["Ring of Skill: Distant Strike","items.html#Ring of Skill: Distant Strike"],["Void Link","items.html#Void Link"],["Giant Door Shield","items.html#Giant Door Shield"],["Tythalamos\u2019 Helm","items.html#Tythalamos\u2019 Helm"],["Ring of Crisis","items.html#Ring of Crisis"],["Luck\u2019s Shield","items.html#Luck\u2019s Shield"]],"keys":[["a familiar totem",152,0],["aarakocra",46,0],["aarakocra peaks",30,0],["aarakocra peaks kestren",30,1],["aasimar",59,0],["abelheim s instant equipment",205,0],["aberration",108,0],["aberrations",108,0],["adour",84,0],["adour",104,2],["agni",124,0],["agni the were chimera",124,0],["ambrosia",146,0],["amulet of nimble escape",151,0],["analyzation",214,3],["animos",122,0],["animos the twins of hatred",122,0],["anklet",191,1],["ankris",118,0],["ankris the conqueror",118,0],["ar or",126,0],["ar or the puppeteer",126,0],["archeptolemus",82,0],["areas",129,2],["armor conjuration",148,2],["armor of inversion",165,0],["arrigo",8,0],["arrigo",26,0],["arrigo erebos",8,0],["ave",93,0],["axe",184,2],["ayla",80,0],["back sash",195,1],["balor s power eye",140,0],["band of",193,0],["band of the brawler",193,0],["bandanna",173,2],["bear of encouragement",143,1],["beast",109,0],["beasts",109,0],["behemoth belt",137,0],["belt",137,1],["black glutton",120,2],["blade",168,1],["blade",202,2],["blades",196,2],["blank",187,2],["blasting chime",136,0],["boots",149,1],["boots of sure footing",201,0],["bounce back sash",195,0],["bow",154,1],["bow",167,1],["bow of piercing",142,0],["bowstaff",185,0],["bowstaff",185,1],["brand of retribution",209,0],["brawler",193,3],["bugbear",52,0],["bulus",10,0],["bulus erebos",10,0],["calatios",7,0],["calatios",24,0],["calatios erebos",7,0],["callicles",91,0],["cat s paws",144,0],["caves",27,1],["caves kestren",27,2],["celestia",133,0],["celestial",110,0],["celestials",110,0],["centaur",55,0],["chain collar",190,1],["chain of",171,0],["chain of the gravekeeper",171,0],["changeling",40,0],["changeling khoravar",40,0],["chime",136,1],["chimera",124,3],["chromatic anklet",191,0],["chyrillus",78,0],["chyrillus",106,2],["cleanliness",218,2],["cloak",161,1],["cloak of wandering",182,0],["cloud",6,0],["cloud",6,1],["coat of",172,0],["coat of the gravekeeper",172,0],["colimune",125,0],["colimune the mindless consumer",125,0],["collar",190,2],["colonies",23,1],["colonies piskus",23,2],["commanding crown",206,0],["conjuration",148,3],["conqueror",118,2],["constros",5,2],["constros",33,1],["constros",34,3],["constros",35,1],["constros",36,2],["construct",115,0],["constructs",115,0],["consumer",125,3],["contacts of quick reaction",211,0],["crisis",223,2],["crown",206,1],["deft bow",167,0],["demented razer",121,2],["demetriades",15,0],["demetriades erebos",15,0],["discerning eye",175,0],["disgraced",119,2],["distance",145,3],["distant strike",219,3],["door shield",221,1],["dragonborn",65,0],["drow",57,0],["drusque",11,0],["drusque erebos",11,0],["dust",160,1],["dwarf",41,0],["eater s mask",189,1],["einar",79,0],["elder tempest",123,2],["elemental",116,0],["elementally touched areas",129,0],["elementals",116,0],["elf",38,0],["elf",39,1],["elf khoravar",39,1],["ello constros",34,2],["eloquence",207,2],["encouragement",143,3],["equipment",205,3],["erebos",0,0],["erebos",7,1],["erebos",8,1],["erebos",9,1],["erebos",10,1],["erebos",11,1],["erebos",12,1],["erebos",13,1],["erebos",14,1],["erebos",15,1],["erebos",16,2],["erebos",17,1],["escape",151,3],["ethereal plane",134,0],["ethereal plane",134,1],["evosferrum",177,0],["eye",140,3],["eye",175,1],["faceless queen",128,2],["familiar totem",152,0],["familiar totem",152,1],["fey",113,0],["feywild",130,0],["feywild",130,1],["fiend",107,0],["fiends",107,0],["filled",188,2],["firbolg",60,0],["firbolg villages",20,0],["firbolg villages piskus",20,0],["firestarter gloves",155,0],["flamberge",179,0],["flame dust",160,0],["flower",147,1],["footing",201,3],["freeze pouch",153,1],["frozen flower",147,0],["galima",9,0],["galima erebos",9,0],["gemelo",34,0],["gemelo hem ello constros",34,0],["genasi",68,0],["giant",72,0],["giant caves",27,0],["giant caves kestren",27,1],["giant door shield",221,0],["gloves",155,1],["gloves",156,2],["glutton",120,3],["gnome",66,0],["goblin",51,0],["gods",73,1],["gods",73,2],["gods",87,1],["gods",87,2],["goliath",43,0],["goliath nomads",28,0],["goliath nomads kestren",28,1],["golmala",94,0],["goodberry wine",139,0],["gravekeeper",171,3],["gravekeeper",172,3],["gravekeeper s spade",170,0],["gravekeeper s tools",169,0],["gravity blade",168,0],["grenade",187,1],["grenade",188,1],["grenade blank",187,1],["grenade filled",188,1],["grudge orb",200,0],["gulkishar",92,0],["gun",141,0],["half elf",39,0],["half elf khoravar",39,0],["half orc",45,0],["halfling",67,0],["hammer",157,2],["hammer",197,1],["handkerchief of cleanliness",218,0],["handyman s hammer",157,0],["hatred",122,4],["haven town",32,0],["haven town kestren",32,0],["heedless hammer",197,0],["helm",222,1],["hem ello constros",34,1],["hobgoblin",50,0],["house of adour",104,0],["house of chyrillus",106,0],["house of kor",102,0],["house of nevaeh",103,0],["house of pyrin",101,0],["house of shaylare",105,0],["house of volkmer",100,0],["household magic",163,2],["houses",99,1],["human",37,0],["hurmut",97,0],["hybrid",71,1],["ice sculptor gloves",156,0],["ingot",194,1],["instant equipment",205,2],["inversion",165,2],["iosepha",90,0],["isles of constros",5,0],["judgement",217,2],["kalashtar",63,0],["kalistos",19,0],["kalistos orestes",19,0],["kasseiopia",13,0],["kasseiopia erebos",13,0],["kenku",47,0],["kenku valleys",31,0],["kenku valleys kestren",31,1],["kestren",3,0],["kestren",27,3],["kestren",28,3],["kestren",29,3],["kestren",30,3],["kestren",31,3],["kestren",32,2],["khoravar",39,2],["khoravar",40,1],["kingdom of lizael",22,0],["kingdom of lizael piskus",22,1],["kishori",12,0],["kishori",25,0],["kishori",36,1],["kishori constros",36,1],["kishori erebos",12,0],["knife of distance",145,1],["kobold",48,0],["kor",81,0],["kor",102,2],["link",220,1],["lizael",22,2],["lizael piskus",22,3],["lizardfolk",61,0],["lorelei",128,0],["lorelei the faceless queen",128,0],["loriana",89,0],["loxodon",54,0],["luck s shield",224,0],["lull",198,0],["mage",204,4],["magic",163,3],["magic eater s mask",189,0],["magical grenade",187,0],["magical grenade",188,0],["magical grenade blank",187,0],["magical grenade filled",188,0],["major gods",73,0],["major gods",73,1],["malachite",180,0],["manasteel ingot",194,0],["maneuverability",186,2],["marcella",35,0],["marcella constros",35,0],["markless stiletto",203,0],["markless stiletto",203,1],["mask",138,1],["mask",189,3],["material plane",135,0],["material plane",135,1],["megaera",18,0],["megaera orestes",18,0],["mercy",216,2],["meteorite",215,0],["mindless consumer",125,2],["minor gods",87,0],["minor gods",87,1],["minor protection",192,3],["minos",119,0],["minos the disgraced",119,0],["minotaur",56,0],["mirror of retaliation",199,0],["momentary strength bandanna",173,0],["monster",117,1],["monsters",117,1],["monstrositie",111,0],["monstrosities",111,0],["musashi s blades",196,0],["nardone",4,0],["nardone",16,1],["nardone erebos",16,1],["narrating storybook",158,0],["nechtu",88,0],["nevaeh",85,0],["nevaeh",103,2],["new kishori",36,0],["new kishori constros",36,0],["new nardone",16,0],["new nardone erebos",16,0],["ngana",33,0],["ngana constros",33,0],["nimble escape",151,2],["nomads",28,1],["nomads",29,1],["nomads kestren",28,2],["nomads kestren",29,2],["notebook",183,2],["nthanda",98,0],["of",150,1],["of",171,1],["of",172,1],["of",193,1],["of adour",104,1],["of armor conjuration",148,1],["of chyrillus",106,1],["of cleanliness",218,1],["of constros",5,1],["of crisis",223,1],["of distance",145,2],["of eloquence",207,1],["of encouragement",143,2],["of hatred",122,3],["of household magic",163,1],["of inversion",165,1],["of judgement",217,1],["of kor",102,1],["of lizael",22,1],["of lizael piskus",22,2],["of maneuverability",186,1],["of mercy",216,1],["of nevaeh",103,1],["of nimble escape",151,1],["of pacing",208,1],["of pacing",208,2],["of piercing",142,1],["of preparation",162,1],["of pyrin",101,1],["of quick reaction",211,1],["of repercussion",164,1],["of retaliation",199,1],["of retribution",209,1],["of seclusion",212,1],["of shaylare",105,1],["of skill distant strike",219,1],["of spell analyzation",214,1],["of sure footing",201,1],["of the brawler",193,1],["of the gravekeeper",171,1],["of the gravekeeper",172,1],["of the paranoid mage",204,1],["of the wind",150,1],["of versatility",210,1],["of very minor protection",192,1],["of volkmer",100,1],["of wandering",182,1],["or",126,1],["or the puppeteer",126,1],["orb",200,1],["orc",44,0],["orc",45,1],["orcish nomads",29,0],["orcish nomads kestren",29,1],["orestes",1,0],["orestes",18,1],["orestes",19,1],["pacing",208,2],["pacing",208,3],["paranoid mage",204,3],["pass through blade",202,0],["paws",144,2],["peaks",30,1],["peaks kestren",30,2],["pen of preparation",162,0],["phalanx shield",166,0],["piercing",142,2],["pillbox",178,2],["pillbox",178,3],["piskus",2,0],["piskus",20,2],["piskus",21,2],["piskus",22,4],["piskus",23,3],["piskus colonies",23,0],["piskus colonies piskus",23,1],["plane",132,1],["plane",132,2],["plane",134,1],["plane",134,2],["plane",135,1],["plane",135,2],["plant",112,0],["plants",112,0],["pocket ring",174,1],["poisoner s pillbox",178,0],["poisoner s pillbox",178,1],["pouch",153,2],["power eye",140,2],["preparation",162,2],["profiteer",127,2],["protection",192,4],["protective chain collar",190,0],["prothous",83,0],["puppeteer",126,3],["pusher",181,1],["pusher",181,2],["pyrin",76,0],["pyrin",101,2],["queen",128,3],["quick reaction",211,2],["quiro",95,0],["ralmong",121,0],["ralmong the demented razer",121,0],["razer",121,3],["reaction",211,3],["repercussion",164,2],["retaliation",199,2],["retribution",209,2],["ring",174,2],["ring of armor conjuration",148,0],["ring of crisis",223,0],["ring of eloquence",207,0],["ring of maneuverability",186,0],["ring of skill distant strike",219,0],["ring of very minor protection",192,0],["robes of the paranoid mage",204,0],["rod of seclusion",212,0],["rpd",159,0],["s axe",184,1],["s blades",196,1],["s hammer",157,1],["s instant equipment",205,1],["s mask",189,2],["s notebook",183,1],["s paws",144,1],["s pillbox",178,1],["s pillbox",178,2],["s power eye",140,1],["s shield",224,1],["s spade",170,1],["s tools",169,1],["sash",195,2],["satyr",70,0],["scholar s notebook",183,0],["sculptor gloves",156,1],["seclusion",212,2],["shadowfell",131,0],["shadowfell",131,1],["shaylare",77,0],["shaylare",105,2],["sheikah slate",213,0],["sheikah slate",213,1],["shield",166,1],["shield",221,2],["shield",224,2],["shield of repercussion",164,0],["shifter",53,0],["simic hybrid",71,0],["skill distant strike",219,2],["skulker bow",154,0],["slate",213,1],["slate",213,2],["sorcerous houses",99,0],["spade",170,2],["spartan boots",149,0],["spatial pocket ring",174,0],["spectacles of spell analyzation",214,0],["spell analyzation",214,2],["spirit plane",132,0],["spirit plane",132,1],["stake pusher",181,0],["stake pusher",181,1],["steps of",150,0],["steps of the wind",150,0],["stiletto",203,1],["stiletto",203,2],["storybook",158,1],["strength bandanna",173,1],["strike",219,4],["sure footing",201,2],["sword of judgement",217,0],["sword of mercy",216,0],["tabaxi",42,0],["teddy bear of encouragement",143,0],["temperate cloak",161,0],["tempest",123,3],["the aarakocra peaks kestren",30,0],["the black glutton",120,1],["the bowstaff",185,0],["the brawler",193,2],["the cloud",6,0],["the conqueror",118,1],["the demented razer",121,1],["the disgraced",119,1],["the elder tempest",123,1],["the ethereal plane",134,0],["the faceless queen",128,1],["the feywild",130,0],["the giant caves kestren",27,0],["the goliath nomads kestren",28,0],["the gravekeeper",171,2],["the gravekeeper",172,2],["the kenku valleys kestren",31,0],["the kingdom of lizael piskus",22,0],["the major gods",73,0],["the markless stiletto",203,0],["the material plane",135,0],["the mindless consumer",125,1],["the minor gods",87,0],["the orcish nomads kestren",29,0],["the paranoid mage",204,2],["the piskus colonies piskus",23,0],["the poisoner s pillbox",178,0],["the profiteer",127,1],["the puppeteer",126,2],["the shadowfell",131,0],["the sheikah slate",213,0],["the spirit plane",132,0],["the stake pusher",181,0],["the twins of hatred",122,1],["the violin of pacing",208,0],["the were chimera",124,1],["the wind",150,2],["thove",96,0],["through blade",202,1],["throwing knife of distance",145,0],["tiefling",58,0],["time freeze pouch",153,0],["tiryns",14,0],["tiryns erebos",14,0],["tiya",75,0],["token of versatility",210,0],["tools",169,2],["tortle",49,0],["tortle villages",21,0],["tortle villages piskus",21,0],["totem",152,1],["totem",152,2],["touched areas",129,1],["town",32,1],["town kestren",32,1],["tracker mask",138,0],["triton",62,0],["twins of hatred",122,2],["tyfonas",123,0],["tyfonas the elder tempest",123,0],["tythalamos helm",222,0],["undead",114,0],["unique monster",117,0],["unique monsters",117,0],["valleys",31,1],["valleys kestren",31,2],["vasileios",17,0],["vasileios erebos",17,0],["vedalken",69,0],["venusdonoa",176,0],["versatility",210,2],["very minor protection",192,2],["villages",20,1],["villages",21,1],["villages piskus",20,1],["villages piskus",21,1],["violin of pacing",208,0],["violin of pacing",208,1],["vito",127,0],["vito the profiteer",127,0],["void link",220,0],["volkmer",74,0],["volkmer",100,2],["wand of household magic",163,0],["wandering",182,2],["warforged",64,0],["were chimera",124,2],["wind",150,3],["wine",139,1],["woodcutter s axe",184,0],["yorqiroth",120,0],["yorqiroth the black glutton",120,0],["zethos",86,0]],"trigrams":{"  a":[8,26,30,46,59,80,82,84,93,108,118,122,124,126,146,151,152,165,205],"  b":[10,52,109,136,137,140,142,185,193,195,201,209],"  c":[6,7,24,40,55,78,91,110,115,125,133,144,171,172,182,191,206,211],"  d":[11,15,41,57,65,167,175],"  e":[0,38,79,116,129,134,177],"  f":[20,60,107,113,130,147,152,155,160,179],"  g":[9,27,28,34,43,51,66,68,72,92,94,139,141,168,169,170,200,221],"  h":[32,37,39,45,50,67,97,100,101,102,103,104,105,106,157,197,218],"  i":[5,90,156],"  k":[3,12,13,19,22,25,31,47,48,63,81],"  l":[54,61,89,128,198,224],"  m":[18,35,56,73,87,111,119,135,173,180,187,188,189,194,196,199,203,215],"  n":[4,16,33,36,85,88,98,158],"  o":[1,29,44],"  p":[2,23,76,83,112,162,166,178,190,202],"  q":[95],"  r":[121,148,159,186,192,204,207,212,219,223],"  s":[53,70,71,77,99,131,132,149,150,154,164,174,181,183,213,214,216,217],"  t":[6,14,21,22,23,27,28,29,30,31,42,49,58,62,73,75,87,96,123,130,131,132,134,135,138,143,145,153,161,178,181,185,203,208,210,213,222],"  u":[114,117],"  v":[17,69,74,127,176,208,220],"  w":[64,163,184],"  y":[120],"  z":[86]," a ":[152]," aa":[30,46,59]," ab":[108,205]," ad":[84,104]," ag":[124]," am":[146,151]," an":[118,122,191,214]," ar":[8,26,82,126,129,148,165]," av":[93]," ax":[184]," ay":[80]," ba":[140,173,193,195]," be":[109,137,143]," bl":[120,136,168,187,196,202]," bo":[142,149,154,167,185,195,201]," br":[193,209]," bu":[10,52]," ca":[7,24,27,91,144]," ce":[55,110,133]," ch":[40,78,106,124,136,171,190,191]," cl":[6,161,182,218]," co":[5,23,33,34,35,36,115,118,125,148,172,190,206,211]," cr":[206,223]," de":[15,121,167]," di":[119,145,175,219]," do":[221]," dr":[11,57,65]," du":[160]," dw":[41]," ea":[189]," ei":[79]," el":[34,38,39,116,123,129,207]," en":[143]," eq":[205]," er":[0,7,8,9,10,11,12,13,14,15,16,17]," es":[151]," et":[134]," ev":[177]," ey":[140,175]," fa":[128,152]," fe":[113,130]," fi":[20,60,107,155,188]," fl":[147,160,179]," fo":[201]," fr":[147,153]," ga":[9]," ge":[34,68]," gi":[27,72,221]," gl":[120,155,156]," gn":[66]," go":[28,43,51,73,87,94,139]," gr":[168,169,170,171,172,187,188,200]," gu":[92,141]," ha":[32,39,45,67,122,157,197,218]," he":[34,197,222]," ho":[50,99,100,101,102,103,104,105,106,163]," hu":[37,97]," hy":[71]," ic":[156]," in":[165,194,205]," io":[90]," is":[5]," ju":[217]," ka":[13,19,63]," ke":[3,27,28,29,30,31,32,47]," kh":[39,40]," ki":[12,22,25,36]," kn":[145]," ko":[48,81,102]," li":[22,61,220]," lo":[54,89,128]," lu":[198,224]," ma":[35,73,135,138,163,180,186,187,188,189,194,203,204]," me":[18,215,216]," mi":[56,87,119,125,192,199]," mo":[111,117,173]," mu":[196]," na":[4,16,158]," ne":[16,36,85,88,103]," ng":[33]," ni":[151]," no":[28,29,183]," nt":[98]," of":[5,22,100,101,102,103,104,105,106,122,142,143,145,148,150,151,162,163,164,165,171,172,182,186,192,193,199,201,204,207,208,209,210,211,212,214,216,217,218,219,223]," or":[1,18,19,29,44,45,126,200]," pa":[144,202,204,208]," pe":[30,162]," ph":[166]," pi":[2,20,21,22,23,142,178]," pl":[112,132,134,135]," po":[140,153,174,178]," pr":[83,127,162,190,192]," pu":[126,181]," py":[76,101]," qu":[95,128,211]," ra":[121]," re":[164,199,209,211]," ri":[148,174,186,192,207,219,223]," ro":[204,212]," rp":[159]," s ":[140,144,157,169,170,178,183,184,189,196,205,224]," sa":[70,195]," sc":[156,183]," se":[212]," sh":[53,77,105,131,164,166,213,221,224]," si":[71]," sk":[154,219]," sl":[213]," so":[99]," sp":[132,149,170,174,214]," st":[150,158,173,181,203,219]," su":[201]," sw":[216,217]," ta":[42]," te":[123,143,161]," th":[6,22,23,27,28,29,30,31,73,87,96,118,119,120,121,122,123,124,125,126,127,128,130,131,132,134,135,145,150,171,172,178,181,185,193,202,203,204,208,213]," ti":[14,58,75,153]," to":[21,32,49,129,152,169,210]," tr":[62,138]," tw":[122]," ty":[123,222]," un":[114,117]," va":[17,31]," ve":[69,176,192,210]," vi":[20,21,127,208]," vo":[74,100,220]," wa":[64,163,182]," we":[124]," wi":[139,150]," wo":[184]," yo":[120]," ze":[86],"a c":[33,35],"a e":[9,13],"a f":[152],"a o":[18],"a p":[30],"aar":[30,46],"aas":[59],"aba":[42],"abe":[108,205],"abi":[186],"ace":[119,128],"ach":[180],"aci":[208],"ack":[120,138,195],"acl":[214],"act":[211],"ad ":[114],"ade":[15,168,170,187,188,196,202],"ado":[84,104,131],"ads":[28,29],"aeh":[85,103],"ael":[22],"aer":[18],"aff":[185],"age":[20,21,143,204],"agi":[163,187,188,189],"agn":[124],"ago":[65],"ah ":[213],"ain":[171,190],"ajo":[73],"ak ":[161,182],"ake":[181],"ako":[30,46],"aks":[30],"al ":[110,116,134,135,174,187,188],"ala":[7,24,63,94,166,180,222],"alf":[39,45,67],"ali":[9,19,199],"alk":[69],"all":[31,91,129],"alm":[121],"alo":[140],"als":[110,116],"aly":[214],"amb":[146,179],"ame":[160],"ami":[152],"amm":[157,197],"amo":[222],"amu":[151],"an ":[37,149,157],"ana":[33,89,194,214],"anc":[145],"and":[98,157,163,173,182,193,206,209,218],"ane":[132,134,135,186],"ang":[40],"ani":[122],"ank":[118,187,191],"anl":[218],"ann":[173],"ano":[204],"ant":[27,72,112,205,219,221],"anx":[166],"ape":[151],"ar ":[39,40,52,59,63,79,92,126,143,152,183,190],"ara":[30,46,162,204],"arc":[35,82],"ard":[4,16,61],"are":[77,105,129],"arf":[41,64],"ark":[203],"arm":[148,165],"arr":[8,26,158],"art":[149,155],"ary":[173],"as ":[123,129],"ash":[63,195,196],"asi":[17,59,68],"ask":[138,189],"ass":[13,202],"ast":[109,136,194],"at ":[144,172],"ate":[135,161,189,213],"ath":[28,43],"ati":[7,24,108,148,158,162,174,191,199,210,214],"atr":[122],"aty":[70],"aur":[55,56],"ava":[39,40],"ave":[27,32,93,169,170,171,172],"avi":[168],"awl":[193],"aws":[144],"axe":[184],"axi":[42],"ayl":[77,80,105],"aze":[121],"bac":[195],"bal":[140],"ban":[173,193],"bax":[42],"bea":[52,109,143],"beh":[137],"bel":[137,205],"ber":[108,139,179],"bes":[204],"bgo":[50],"bil":[186],"bla":[120,136,168,187,196,202],"ble":[151],"bli":[50,51],"bol":[20,48,60],"boo":[149,158,183,201],"bor":[65],"bos":[0,7,8,9,10,11,12,13,14,15,16,17],"bou":[195],"bow":[142,154,167,185],"box":[178],"bra":[193,209],"bri":[71],"bro":[146],"bug":[52],"bul":[10],"but":[209],"c a":[191],"c e":[189],"c h":[71],"cal":[7,24,91,187,188],"cap":[151],"cat":[144],"cav":[27],"ce ":[145,156,195,207],"ced":[119],"cel":[35,110,128,133],"cen":[55],"cer":[99,175],"ch ":[153],"cha":[40,171,190],"che":[82,129],"chi":[124,136,180,218],"cho":[183],"chr":[191],"cht":[88],"chy":[78,106],"cin":[142,208],"cis":[29],"ck ":[120,195,211,224],"cke":[138,174],"cle":[91,214,218],"clo":[6,161,182],"clu":[212],"coa":[172],"col":[23,125,190],"com":[206],"con":[5,33,34,35,36,115,118,125,148,211],"cou":[143],"cra":[30,46],"cri":[223],"cro":[206],"ct ":[115],"cta":[214],"cti":[190,192,211],"cts":[115,211],"cul":[156],"cus":[164],"cut":[184],"cy ":[216],"d a":[129],"d l":[220],"d m":[163,204],"d o":[163,164,193,209,212,216,217],"d r":[121],"da ":[98],"dal":[69],"dan":[173],"dbe":[139],"dcu":[184],"ddy":[143],"de ":[168,170,187,188,202],"dea":[114],"def":[167],"dem":[15,121],"der":[123,182],"des":[15,196],"dfo":[61],"dge":[200,217],"din":[206],"dis":[119,145,175,219],"dke":[218],"dle":[125,197],"dom":[22],"don":[4,16,54,176],"doo":[221],"dou":[84,104],"dow":[131],"dra":[65],"dro":[57],"dru":[11],"ds ":[28,29,73,87,107],"dus":[160],"dwa":[41],"dy ":[143],"dym":[157],"e a":[30],"e b":[120,185,187,193,195],"e c":[6,118,124,161,190],"e d":[119,121,160],"e e":[11,16,123,134,151],"e f":[128,130,153,188,201],"e g":[27,28,171,172],"e k":[22,31],"e m":[73,87,117,125,135,203],"e o":[29,100,101,102,103,104,105,106,145,200],"e p":[23,126,127,153,178,181,204],"e s":[131,132,156,181,213],"e t":[122,125],"e v":[21,208],"e w":[124,150],"eac":[211],"ead":[114],"eak":[30],"eal":[134],"ean":[218],"ear":[52,143],"eas":[109,129],"eat":[189],"ebo":[0,7,8,9,10,11,12,13,14,15,16,17,183],"ech":[88],"ecl":[212],"ect":[190,192,214],"ed ":[64,119,121,122,129,188],"eda":[69],"edd":[143],"edl":[197],"eed":[197],"eel":[194],"een":[128],"eep":[169,170,171,172],"eer":[126,127],"eez":[153],"ef ":[218],"efl":[58],"eft":[167],"ega":[18],"eh ":[85,103],"ehe":[137],"eho":[163],"ei ":[128],"eik":[213],"eim":[205],"ein":[79],"eio":[13,17],"eke":[169,170,171,172],"el ":[22,194],"eld":[123,164,166,221,224],"ele":[110,116,128,129,133],"elf":[38,39],"elh":[205],"eli":[40],"ell":[34,35,131,214],"elm":[222],"elo":[34,207],"elt":[137],"em ":[34,152],"eme":[15,34,116,121,129,143,217],"emo":[137],"emp":[123,161],"emu":[82],"en ":[3,27,28,29,30,31,32,69,128,147,162,210],"ena":[68,187,188],"enc":[143,207],"end":[107],"eng":[173],"enk":[31,47],"ent":[55,116,121,129,143,173,205,217],"enu":[176],"eor":[215],"epa":[162],"epe":[164,169,170,171,172],"eph":[90],"eps":[150],"ept":[82],"equ":[205],"er ":[53,74,100,117,121,123,125,126,127,138,140,147,154,155,157,169,170,171,172,178,181,184,189,193,197],"era":[18,124,161,186],"erc":[142,164,216,218],"ere":[0,7,8,9,10,11,12,13,14,15,16,17,124,134],"erg":[179],"eri":[135,182],"ern":[175],"ero":[99,118],"err":[108,139,177],"ers":[117,165,210],"ery":[192],"es ":[1,5,15,18,19,20,21,23,27,91,99,111,155,156,196,204,214],"esc":[151],"ess":[125,128,197,203,218],"est":[1,3,18,19,27,28,29,30,31,32,110,123,133,155],"et ":[151,174,191],"eta":[199],"ete":[126,215],"eth":[86,134],"etr":[15,209],"ett":[203],"euv":[186],"eva":[85,103],"evo":[177],"ew ":[16,36],"ey ":[113],"eye":[140,175],"eys":[31],"eyw":[130],"eze":[153],"f a":[104,148],"f c":[5,106,218,223],"f d":[145],"f e":[39,143,207],"f h":[122,163],"f i":[165],"f j":[217],"f k":[39,102],"f l":[22],"f m":[186,216],"f n":[103,151],"f o":[45,218],"f p":[101,142,162,208],"f q":[211],"f r":[164,199,209],"f s":[105,201,212,214,219],"f t":[150,171,172,193,204],"f v":[100,192,210],"f w":[182],"fac":[128],"fam":[152],"fe ":[145],"fel":[131],"fer":[177],"fey":[113,130],"ff ":[185],"fie":[107],"fil":[188],"fir":[20,60,155],"fit":[127],"fla":[160,179],"fli":[58,67],"flo":[147],"fol":[61],"fon":[123],"foo":[201],"for":[64],"fre":[153],"fro":[147],"ft ":[167],"fte":[53],"g c":[136,206],"g e":[175],"g k":[40,145],"g o":[148,186,192,207,219,223],"g s":[158],"g t":[121],"g v":[20],"gae":[18],"gal":[9],"gan":[33],"gbe":[52],"gdo":[22],"ge ":[179,200,204],"ged":[64],"gel":[40],"gem":[34,143,217],"gen":[68],"ges":[20,21],"gh ":[202],"gia":[27,72,221],"gic":[163,187,188,189],"glo":[155,156],"glu":[120],"gni":[124],"gno":[66],"go ":[8,26],"gob":[50,51],"god":[73,87],"gol":[28,43,94],"gon":[65],"goo":[139],"got":[194],"gra":[119,168,169,170,171,172],"gre":[187,188],"gru":[200],"gth":[173],"gul":[92],"gun":[141],"h b":[137,173,202],"h n":[28,29],"h s":[213],"h t":[120],"ha ":[90],"had":[131],"hai":[171,190],"hal":[39,45,67,166,222],"ham":[157,197],"han":[40,98,157,218],"har":[92],"hat":[122],"hav":[32],"hay":[77,105],"he ":[6,22,23,27,28,29,30,31,73,87,118,119,120,121,122,123,124,125,126,127,128,130,131,132,134,135,150,171,172,178,181,185,193,203,204,208,213],"hed":[129],"hee":[197],"hei":[205,213],"hel":[222],"hem":[34,137],"hep":[82],"her":[134,181],"hi ":[196],"hie":[164,166,218,221,224],"hif":[53],"him":[124,136],"hit":[180],"hob":[50],"hol":[163,183],"hor":[12,25,36,39,40],"hos":[86],"hou":[83,99,100,101,102,103,104,105,106,163],"hov":[96],"hro":[145,191,202],"hta":[63],"htu":[88],"hum":[37],"hur":[97],"hyb":[71],"hyr":[78,106],"i c":[36],"i e":[12],"i s":[196],"i t":[124,128],"ia ":[13,133,146],"iad":[15],"ial":[110,135,174],"ian":[27,72,89,221],"iar":[152],"iat":[28,43,199],"ibu":[209],"ic ":[71,163,189,191],"ica":[187,188],"ice":[156],"ick":[211],"icl":[91],"id ":[71,204,220],"ie ":[111],"ief":[58,218],"iel":[164,166,221,224],"ien":[107],"ier":[142],"ies":[23,111],"ife":[145],"ift":[53],"igo":[8,26],"ika":[213],"ike":[219],"ild":[130],"ile":[17,203],"ili":[152,186,210],"ill":[20,21,78,106,178,188,219],"im ":[205],"ima":[9,59],"imb":[151],"ime":[124,136,153],"imi":[71],"imo":[122],"imu":[125],"in ":[50,51,76,101,171,190,208],"ina":[79],"ind":[125,150],"ine":[139,218],"ing":[22,40,58,67,136,142,145,148,158,174,175,182,186,192,194,201,206,207,208,219,223],"ink":[220],"ino":[56,87,119,192],"ins":[122,205],"inv":[165],"iol":[208],"ion":[108,148,162,164,165,192,199,209,211,212,214],"iop":[13],"ios":[7,17,24,90],"ipm":[205],"iqu":[117],"irb":[20,60],"ire":[155],"iri":[132],"iro":[95,120],"irr":[199],"iry":[14],"is ":[118,223],"isc":[175],"isg":[119],"ish":[12,25,29,36,92],"isi":[223],"isk":[2,20,21,22,23],"isl":[5],"iso":[178],"ist":[19,145,219],"it ":[132],"ite":[127,180,215],"iti":[111],"ito":[62,127],"ity":[168,186,210],"ive":[190],"iya":[75],"iza":[22,61],"jor":[73],"jud":[217],"jur":[148],"k g":[120],"k o":[182],"k r":[211],"k s":[195,224],"kah":[213],"kal":[19,63],"kas":[13],"ke ":[181,219],"kee":[169,170,171,172],"ken":[31,47,69,210],"ker":[138,154,218],"kes":[3,27,28,29,30,31,32],"ket":[174],"kho":[39,40],"kil":[219],"kin":[22],"kis":[12,25,36,92],"kle":[191,203],"kme":[74,100],"kni":[145],"kob":[48],"koc":[30,46],"kor":[81,102],"kri":[118],"ks ":[30],"ku ":[31,47],"kul":[154],"kus":[2,20,21,22,23],"l a":[214],"l d":[219],"l g":[187,188],"l i":[194],"l p":[22,134,135,174],"la ":[35,80,94],"lac":[120,180],"lad":[168,196,202],"lag":[20,21],"lam":[160,179,222],"lan":[112,132,134,135,166,187],"lar":[77,105,183,190],"las":[63,136],"lat":[7,24,213],"lbo":[178],"ld ":[48,130,163,164,166,221,224],"lde":[123],"le ":[21,49,151],"lea":[218],"led":[188],"lei":[17,128],"lem":[82,116,129],"ler":[193],"les":[5,91,110,125,128,133,197,203,214],"let":[151,191,203],"ley":[31],"lf ":[38,39,45],"lfl":[67],"lg ":[20,60],"lhe":[205],"lia":[28,43,152,199],"lic":[91],"lim":[9,125],"lin":[40,50,51,58,67,208,218,220],"lis":[19],"lit":[186,210],"liz":[22,61],"lk ":[61],"lke":[69,154],"lki":[92],"lkm":[74,100],"ll ":[131,198,214,219],"lla":[20,21,35,190],"llb":[178],"lle":[31,188],"lli":[91],"llo":[34],"llu":[78,106],"lly":[129],"lm ":[222],"lma":[94],"lmo":[121],"lo ":[34],"loa":[161,182],"lon":[23],"loq":[207],"lor":[89,128,140],"lou":[6],"lov":[155,156],"low":[147],"lox":[54],"lpt":[156],"ls ":[110,116,169],"lt ":[137],"luc":[224],"lul":[198],"lus":[10,78,106,212],"lut":[120],"ly ":[129],"lyz":[214],"m e":[34],"m o":[22],"m s":[205],"ma ":[9],"mad":[28,29],"mag":[163,187,188,189,204],"maj":[73],"mal":[94,180],"man":[37,157,186,194,206],"mar":[35,59,203],"mas":[138,189],"mat":[135,191],"mbe":[179],"mbl":[151],"mbr":[146],"me ":[66,136,153,160],"meg":[18],"mel":[34],"men":[116,121,129,143,173,205,217],"mer":[74,100,124,125,157,197,216],"met":[15,215],"mic":[71],"mil":[152],"min":[56,87,119,125,192],"mir":[199],"mma":[206],"mme":[157,197],"mom":[173],"mon":[111,117,121],"mor":[148,165],"mos":[122,222],"mot":[137],"mpe":[123,161],"mul":[151],"mun":[125],"mus":[82,196],"mut":[97],"n b":[149],"n c":[190],"n f":[147],"n k":[32],"n o":[162,171,208,210],"n s":[157],"n t":[32],"na ":[33,89,173],"nad":[187,188],"nal":[214],"nar":[4,16,79,158],"nas":[68,123,194],"nbo":[65],"nce":[145,195,207],"nco":[143],"nd ":[107,150,163,193,209],"nda":[98,173],"nde":[114,182],"ndi":[206],"ndk":[218],"ndl":[125],"nds":[107],"ndy":[157],"ne ":[4,16,125,132,134,135,139],"nec":[88],"ner":[178],"nes":[218],"neu":[186],"nev":[85,103],"new":[16,36],"ng ":[40,58,67,121,136,142,145,148,158,174,175,182,186,192,201,206,207,208,219,223],"nga":[33],"ngd":[22],"nge":[40],"ngo":[194],"ngt":[173],"ni ":[124],"nie":[23],"nif":[145],"nim":[122,151],"nin":[175],"niq":[117],"nju":[148],"nk ":[187,220],"nkl":[191],"nkr":[118],"nku":[31,47],"nli":[218],"nna":[173],"noa":[176],"noi":[204],"nom":[28,29,66],"nor":[87,192],"nos":[119],"not":[56,183],"nqu":[118],"ns ":[14,108,122],"nst":[5,33,34,35,36,111,115,117,205],"nsu":[125],"nt ":[27,72,112,143,205,217,219,221],"nta":[55,116,129,173,211],"nte":[121],"nth":[98],"nts":[112],"nus":[176],"nve":[165],"nx ":[166],"o c":[34],"o e":[8],"o h":[34],"o t":[127],"oa ":[176],"oak":[161,182],"oat":[172],"obe":[204],"obg":[50],"obl":[50,51],"obo":[48],"ock":[174],"ocr":[30,46],"od ":[212],"odb":[139],"odc":[184],"odo":[54],"ods":[73,87],"of ":[5,22,100,101,102,103,104,105,106,122,142,143,145,148,150,151,162,163,164,165,171,172,182,186,192,193,199,201,204,207,208,209,210,211,212,214,216,217,218,219,223],"ofi":[127],"oid":[204,220],"ois":[178],"ok ":[158,183],"oke":[210],"ola":[183],"old":[48,163],"ole":[82],"olg":[20,60],"oli":[28,43,125,208],"olk":[61,74,100],"oll":[190],"olm":[94],"olo":[23],"ols":[169],"om ":[22],"oma":[28,29,191],"ome":[66,173],"omm":[206],"on ":[54,62,108,120,148,162,164,165,192,199,209,211,212,214],"ona":[123],"onb":[65],"one":[4,16,178],"ong":[121],"oni":[23],"onj":[148],"ono":[176],"onq":[118],"ons":[5,33,34,35,36,108,111,115,117,125],"ont":[211],"ood":[139,184],"ook":[158,183],"ool":[169],"oor":[221],"oot":[149,201],"opi":[13],"oqu":[207],"or ":[73,81,87,102,118,126,140,148,156,165,192,199,221],"ora":[39,40],"orb":[200],"orc":[29,44,45,99],"ord":[216,217],"ore":[1,18,19,128],"org":[64],"ori":[12,25,36,89,215],"orn":[65],"orq":[120],"ort":[21,49],"ory":[158],"os ":[0,5,7,8,9,10,11,12,13,14,15,16,17,19,24,33,34,35,36,86,119,122,222],"ose":[90],"osf":[177],"osi":[111,146],"ot ":[194],"ota":[56],"ote":[152,183,190,192],"oth":[83,120,137],"oti":[201],"ots":[149,201],"ouc":[129,153],"oud":[6],"oug":[202],"oun":[195],"our":[84,104,143],"ous":[83,99,100,101,102,103,104,105,106,163],"ove":[96,155,156],"ow ":[57,142,154,167],"owe":[140,147],"owf":[131],"owi":[145],"own":[32,206],"ows":[185],"ox ":[178],"oxo":[54],"oze":[147],"pac":[208],"pad":[170],"par":[149,162,204],"pas":[202],"pat":[174],"paw":[144],"pd ":[159],"pe ":[151],"pea":[30],"pec":[214],"pel":[214],"pen":[162],"per":[161,164,169,170,171,172],"pes":[123],"pet":[126],"pha":[90,166],"pia":[13],"pie":[142],"pil":[178],"pir":[132],"pis":[2,20,21,22,23],"pla":[112,132,134,135],"pme":[205],"poc":[174],"poi":[178],"pou":[153],"pow":[140],"ppe":[126],"pre":[162],"pro":[83,127,190,192],"ps ":[150],"pto":[82,156],"pup":[126],"pus":[181],"pyr":[76,101],"qir":[120],"que":[11,117,118,128,207],"qui":[95,205,211],"r b":[154],"r c":[148],"r e":[140],"r g":[73,87,155,156],"r m":[138],"r o":[126,143,165,199],"r p":[192],"r s":[140,169,170,178,183,184,189,221],"r t":[123,126,152],"ra ":[18,30,46,124],"rab":[186],"rac":[119,138],"rag":[65,143],"rak":[30,46],"ral":[121],"ran":[204,209],"rat":[108,148,158,161,162],"rav":[39,40,168,169,170,171,172],"raw":[193],"raz":[121],"rb ":[200],"rbo":[20,60],"rc ":[44,45],"rce":[35,99],"rch":[82,218],"rci":[29,142],"rcu":[164],"rcy":[216],"rd ":[216,217],"rdf":[61],"rdo":[4,16],"re ":[77,105,124,201],"rea":[129,134,211],"reb":[0,7,8,9,10,11,12,13,14,15,16,17],"red":[122],"ree":[153],"rel":[128],"ren":[3,27,28,29,30,31,32,173,187,188],"rep":[162,164],"res":[1,18,19,155],"ret":[199,209],"rf ":[41],"rfo":[64],"rge":[64,179],"ri ":[12,25,36],"ria":[15,89,135],"rib":[209],"rid":[71],"rig":[8,26],"rik":[219],"ril":[78,106],"rin":[76,101,148,174,182,186,192,207,219,223],"ris":[118,223],"rit":[62,132,215],"rkl":[203],"rmo":[148,165],"rmu":[97],"rn ":[65],"rni":[175],"ro ":[95],"rob":[204],"rod":[212],"rof":[127],"rom":[191],"ror":[118,199],"ros":[5,33,34,35,36,111,146],"rot":[83,120,190,192],"rou":[99,202],"row":[57,145,206],"roz":[147],"rpd":[159],"rqi":[120],"rra":[108,158],"rri":[8,26],"rro":[199],"rru":[177],"rry":[139],"rs ":[117],"rsa":[210],"rsi":[165],"rta":[149],"rte":[155],"rtl":[21,49],"ruc":[115],"rud":[200],"rum":[177],"rus":[11],"ry ":[139,173,192],"ryb":[158],"ryn":[14],"s a":[184],"s b":[196],"s c":[23,125],"s e":[7,10,14,15,17],"s h":[99,157,197,222],"s i":[205],"s k":[27,28,29,30,31],"s m":[189],"s n":[183],"s o":[5,19,122,150,201,204,211,214],"s p":[20,21,23,140,144,178],"s q":[128],"s s":[170,203,224],"s t":[118,119,122,123,169,202],"sas":[195,196],"sat":[70,210],"sca":[151],"sce":[175],"sch":[183],"scu":[156],"sdo":[176],"se ":[100,101,102,103,104,105,106],"sec":[212],"seh":[163],"sei":[13],"sep":[90],"ses":[99],"sfe":[177],"sgr":[119],"sh ":[29,195],"sha":[77,92,105,131],"she":[181,213],"shi":[53,164,166,196,221,224],"sho":[12,25,36],"sht":[63],"si ":[68],"sia":[146],"sil":[17],"sim":[59,71],"sio":[164,165,212],"sis":[223],"sit":[111],"sk ":[138,189],"ski":[219],"sku":[2,20,21,22,23,154],"sla":[213],"sle":[5],"son":[178],"sor":[99],"spa":[149,170,174],"spe":[214],"spi":[132],"squ":[11],"ss ":[125,128,197,202,203,218],"sse":[13],"ssi":[164],"st ":[109,123,160],"sta":[145,155,181,185,205,219],"ste":[1,18,19,117,150,194],"sti":[110,133,136,203],"sto":[19,158],"str":[3,5,27,28,29,30,31,32,33,34,35,36,111,115,173,219],"sts":[109],"sum":[125],"sur":[201],"swo":[216,217],"t b":[167],"t c":[27],"t d":[221],"t e":[205],"t o":[151,172],"t p":[132],"t r":[174],"t s":[144,219],"tab":[42],"tac":[211,214],"taf":[185],"tak":[181],"tal":[116,129,199],"tan":[145,149,205,219],"tar":[63,155,173],"tau":[55,56],"te ":[161,180,213,215],"teb":[183],"tec":[190,192],"ted":[121,143],"tee":[126,127,194],"tem":[123,152,161],"teo":[215],"tep":[150],"ter":[53,117,135,155,184,189],"tes":[1,18,19],"th ":[28,43,120,137,173],"tha":[98,222],"the":[6,22,23,27,28,29,30,31,73,87,118,119,120,121,122,123,124,125,126,127,128,130,131,132,134,135,150,171,172,178,181,185,193,203,204,208,213],"tho":[83,86,96],"thr":[145,202],"tia":[110,133,174],"tic":[191],"tie":[58,111],"til":[203,210],"tim":[153],"tin":[136,158,201],"tio":[7,24,108,148,162,192,199,209,211,214],"tir":[14],"tiv":[190],"tiy":[75],"tle":[21,49],"to ":[127,203],"tok":[210],"tol":[82],"ton":[62,120],"too":[169],"tor":[21,49,156,158],"tos":[19],"tot":[152],"tou":[129],"tow":[32],"tra":[138],"tre":[3,27,28,29,30,31,32,122,173],"tri":[15,62,209,219],"tro":[5,33,34,35,36,111],"tru":[115],"ts ":[109,112,115,149,201,211],"tte":[184],"tto":[120,203],"tu ":[88],"twi":[122],"ty ":[168,186,210],"tyf":[123],"tyr":[70],"tyt":[222],"u v":[31],"uch":[129,153],"uck":[224],"uct":[115],"ud ":[6],"udg":[200,217],"ue ":[11,117],"uee":[128],"uen":[207],"uer":[118],"ugb":[52],"ugh":[202],"uic":[211],"uip":[205],"uir":[95],"ule":[151],"ulk":[92,154],"ull":[198],"ulp":[156],"ulu":[10],"um ":[177],"uma":[37],"ume":[125],"un ":[141],"unc":[195],"und":[114],"une":[125],"uni":[117],"upp":[126],"ur ":[55,56,84,104],"ura":[143,148],"ure":[201],"urm":[97],"us ":[2,10,20,21,22,23,78,82,83,99,106],"usa":[196],"usd":[176],"use":[99,100,101,102,103,104,105,106,163],"ush":[181],"usi":[212],"usq":[11],"uss":[164],"ust":[160],"ut ":[97],"uti":[209],"utt":[120,184],"uve":[186],"vae":[85,103],"val":[31],"var":[39,40],"vas":[17],"ve ":[93,96,190],"ved":[69],"vek":[169,170,171,172],"ven":[32,176],"ver":[165,186,192,210],"ves":[27,155,156],"vil":[20,21],"vio":[208],"vit":[127,168],"voi":[220],"vol":[74,100],"vos":[177],"w k":[36],"w n":[16],"w o":[142],"wan":[163,182],"war":[41,64],"wer":[124,140,147],"wfe":[131],"wil":[130],"win":[122,139,145,150],"wle":[193],"wn ":[32,206],"woo":[184],"wor":[216,217],"ws ":[144],"wst":[185],"x s":[166],"xe ":[184],"xi ":[42],"xod":[54],"y b":[143,168],"y m":[192],"y s":[173],"y t":[129],"y w":[139],"ya ":[75],"ybo":[158],"ybr":[71],"ye ":[140,175],"yfo":[123],"yla":[77,80,105],"yma":[157],"yns":[14],"yor":[120],"yr ":[70],"yri":[76,78,101,106],"ys ":[31],"yth":[222],"ywi":[130],"yza":[214],"zae":[22],"zar":[61],"zat":[214],"ze ":[153],"zen":[147],"zer":[121],"zet":[86]}};
+// searchIndex is written by Website.write_js in main.py:
+//   terms: [name, link] of every term
+//   keys: [key, term, word] sorted by key, one for every word each name can be searched from
+//   trigrams: trigram -> terms whose names contain it, for queries with typos
+// The full text of the pages is indexed separately in js/text_index, written by Website.write_text_index:
+//   sections.json: [link, title] of every section
+//   <initial>.json: [word, postings] sorted by word, postings being [section delta, count, position deltas...]
+// Shards are only fetched once a query needs them
+
+var maxSuggestions = 8;
+var maxTextMatches = 5;
+var trigramCounts = null;
+var textSections = null;
+var textShards = {};
+
+// Latin letters that have no decomposition to strip accents from, spelled the way unidecode does
+var transliterations = {
+    "æ": "ae", "ð": "d", "ø": "o", "þ": "th", "ß": "ss", "đ": "d", "ħ": "h", "ı": "i", "ĳ": "ij",
+    "ĸ": "k", "ŀ": "l", "ł": "l", "ŉ": "'n", "ŋ": "ng", "œ": "oe", "ŧ": "t", "ſ": "s"
+};
+
+function normalize(text) {
+    // Matches search_key in main.py for the letters of Latin-1 and Latin Extended-A. Symbols and other
+    // scripts, which unidecode spells out, are dropped here instead, so names using them can't be found
+    return text.normalize("NFD").replace(/[\u0300-\u036f]/g, "").toLowerCase()
+        .replace(/[æðøþßđħıĳĸŀłŉŋœŧſ]/g, function(letter) { return transliterations[letter]; })
+        .replace(/[^a-z0-9]+/g, " ").trim();
+}
+
+function trigrams(key) {
+    var padded = "  " + key + " ";
+    var grams = [];
+    for (var i = 0; i < padded.length - 2; i++) {
+        grams.push(padded.substring(i, i + 3));
+    }
+    return grams;
+}
+
+function lowerBound(keys, query) {
+    var low = 0, high = keys.length;
+    while (low < high) {
+        var middle = (low + high) >> 1;
+        if (keys[middle][0] < query) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return low;
+}
+
+function prefixMatches(query) {
+    // Exact names first, then names starting with the query, then names with a later word starting with it
+    var keys = searchIndex.keys, scores = {};
+    for (var i = lowerBound(keys, query); i < keys.length && keys[i][0].startsWith(query); i++) {
+        var term = keys[i][1];
+        var score = keys[i][2] > 0 ? 1 : (keys[i][0] === query ? 3 : 2);
+        scores[term] = Math.max(scores[term] || 0, score);
+    }
+    return scores;
+}
+
+function fuzzyMatches(query) {
+    // Dice coefficient between the trigrams of the query and of each term's names
+    if (trigramCounts === null) {
+        trigramCounts = {};
+        for (var gram in searchIndex.trigrams) {
+            searchIndex.trigrams[gram].forEach(function(term) {
+                trigramCounts[term] = (trigramCounts[term] || 0) + 1;
+            });
         }
     }
+
+    var grams = trigrams(query), shared = {}, scores = {};
+    grams.forEach(function(gram) {
+        (searchIndex.trigrams[gram] || []).forEach(function(term) {
+            shared[term] = (shared[term] || 0) + 1;
+        });
+    });
+    for (var term in shared) {
+        var score = 2 * shared[term] / (grams.length + trigramCounts[term]);
+        if (score >= 0.3) {
+            scores[term] = score;
+        }
+    }
+    return scores;
+}
+
+function suggest(input) {
+    var query = normalize(input);
+    if (query.length === 0) {
+        return [];
+    }
+
+    var ranked = [], seen = {};
+    function add(scores) {
+        var terms = Object.keys(scores).filter(function(term) { return !seen[term]; });
+        terms.sort(function(a, b) {
+            return scores[b] - scores[a] || searchIndex.terms[a][0].length - searchIndex.terms[b][0].length;
+        });
+        terms.forEach(function(term) {
+            seen[term] = true;
+            ranked.push({name: searchIndex.terms[term][0], link: searchIndex.terms[term][1]});
+        });
+    }
+
+    add(prefixMatches(query));
+    if (ranked.length < maxSuggestions && query.length >= 3) {
+        add(fuzzyMatches(query));
+    }
+    return ranked.slice(0, maxSuggestions);
+}
+
+function fetchJSON(url) {
+    return fetch(url).then(function(response) {
+        return response.ok ? response.json() : [];
+    }).catch(function() {
+        return [];
+    });
+}
+
+function loadShard(initial) {
+    if (!(initial in textShards)) {
+        textShards[initial] = fetchJSON("../js/text_index/" + initial + ".json");
+    }
+    return textShards[initial];
+}
+
+function decodePostings(encoded) {
+    var postings = {}, section = 0;
+    for (var i = 0; i < encoded.length; i += 2 + encoded[i + 1]) {
+        section += encoded[i];
+        var positions = [], position = 0;
+        for (var j = 0; j < encoded[i + 1]; j++) {
+            position += encoded[i + 2 + j];
+            positions.push(position);
+        }
+        postings[section] = positions;
+    }
+    return postings;
+}
+
+function wordPostings(shard, word, prefix) {
+    // The last word of the query is still being typed, so it matches every word it starts
+    var merged = {};
+    for (var i = lowerBound(shard, word); i < shard.length; i++) {
+        if (prefix ? !shard[i][0].startsWith(word) : shard[i][0] !== word) {
+            break;
+        }
+        var postings = decodePostings(shard[i][1]);
+        for (var section in postings) {
+            merged[section] = (merged[section] || []).concat(postings[section]);
+        }
+    }
+    return merged;
+}
+
+function textMatches(input) {
+    // Sections containing every word of the query, ranked by occurrences, with a bonus for words in sequence
+    var words = normalize(input).split(" ").filter(function(word) { return word.length > 1; });
+    if (words.join("").length < 3) {
+        return Promise.resolve([]);
+    }
+    if (textSections === null) {
+        textSections = fetchJSON("../js/text_index/sections.json");
+    }
+
+    var shards = words.map(function(word) { return loadShard(word[0]); });
+    return Promise.all([textSections].concat(shards)).then(function(loaded) {
+        var sections = loaded[0], scores = null, previous = {};
+        words.forEach(function(word, i) {
+            var postings = wordPostings(loaded[i + 1], word, i === words.length - 1);
+            var next = {};
+            for (var section in postings) {
+                if (scores !== null && !(section in scores)) {
+                    continue;
+                }
+                var before = previous[section] || [];
+                var adjacent = postings[section].filter(function(p) { return before.indexOf(p - 1) >= 0; });
+                next[section] = (scores === null ? 0 : scores[section]) + postings[section].length + 5 * adjacent.length;
+            }
+            scores = next;
+            previous = postings;
+        });
+
+        var ranked = Object.keys(scores).sort(function(a, b) { return scores[b] - scores[a] || a - b; });
+        return ranked.slice(0, maxTextMatches).map(function(section) {
+            return {name: sections[section][1], link: sections[section][0], text: true};
+        });
+    });
+}
+
+function showSuggestions(list, suggestions, selected) {
+    list.innerHTML = "";
+    suggestions.forEach(function(suggestion, i) {
+        var item = document.createElement("li");
+        var link = document.createElement("a");
+        link.href = suggestion.link;
+        link.textContent = suggestion.name;
+        item.className = (suggestion.text ? "text " : "") + (i === selected ? "selected" : "");
+        item.appendChild(link);
+        list.appendChild(item);
+    });
+    list.style.display = suggestions.length > 0 ? "block" : "none";
 }
 
 function init() {
     var searchBar = document.getElementById('searchbar');
+    var list = document.createElement("ul");
+    list.id = "suggestions";
+    searchBar.parentNode.insertBefore(list, searchBar.nextSibling);
+    searchBar.setAttribute("autocomplete", "off");
+
+    var suggestions = [], selected = 0;
+    searchBar.addEventListener("input", function() {
+        var query = searchBar.value;
+        suggestions = suggest(query);
+        selected = 0;
+        showSuggestions(list, suggestions, selected);
+
+        // Full-text matches follow the terms once their shards have loaded, unless the query changed
+        textMatches(query).then(function(matches) {
+            if (searchBar.value !== query) {
+                return;
+            }
+            var links = suggestions.map(function(suggestion) { return suggestion.link; });
+            suggestions = suggestions.concat(matches.filter(function(match) { return links.indexOf(match.link) < 0; }));
+            showSuggestions(list, suggestions, selected);
+        });
+    });
 
-    searchBar.addEventListener("keyup", function(event) {
-        if (event.keyCode === 13) {  // check if user has pressed enter
-            search(searchBar.value.toLowerCase());
+    searchBar.addEventListener("keydown", function(event) {
+        if (suggestions.length === 0) {
+            return;
         }
+        if (event.key === "ArrowDown" || event.key === "ArrowUp") {
+            event.preventDefault();
+            var step = event.key === "ArrowDown" ? 1 : suggestions.length - 1;
+            selected = (selected + step) % suggestions.length;
+            showSuggestions(list, suggestions, selected);
+        } else if (event.key === "Enter") {
+            window.location.href = suggestions[selected].link;
+        } else if (event.key === "Escape") {
+            showSuggestions(list, [], 0);
+        }
+    });
+
+    // Hide the list after a click on a suggestion has had time to land
+    searchBar.addEventListener("blur", function() {
+        setTimeout(function() { list.style.display = "none"; }, 150);
     });
 }
 
@@ -0,0 +1,87 @@
+// Viewer for the slippy-map tiles written by world_map.export_pyramid
+// Only the tiles inside the visible part of the current zoom level are requested
+
+function TileViewer(container) {
+    this.container = container;
+    this.src = container.dataset.src;
+    this.width = Number(container.dataset.width);
+    this.height = Number(container.dataset.height);
+    this.tileSize = Number(container.dataset.tileSize);
+    this.maxZoom = Number(container.dataset.maxZoom);
+
+    this.plane = document.createElement('div');
+    this.plane.className = 'plane';
+    container.appendChild(this.plane);
+
+    // start at the first level at least as wide as the viewer
+    this.zoom = 0;
+    while (this.zoom < this.maxZoom && this.levelWidth() < container.clientWidth) {
+        this.zoom++;
+    }
+
+    var viewer = this;
+    container.addEventListener('scroll', function() { viewer.render(); });
+    container.addEventListener('wheel', function(event) {
+        event.preventDefault();
+        viewer.setZoom(viewer.zoom + (event.deltaY < 0 ? 1 : -1));
+    });
+    this.setZoom(this.zoom);
+}
+
+TileViewer.prototype.scale = function() {
+    return Math.pow(2, this.maxZoom - this.zoom);
+};
+
+TileViewer.prototype.levelWidth = function() {
+    return Math.ceil(this.width / this.scale());
+};
+
+TileViewer.prototype.levelHeight = function() {
+    return Math.ceil(this.height / this.scale());
+};
+
+TileViewer.prototype.setZoom = function(zoom) {
+    zoom = Math.max(0, Math.min(this.maxZoom, zoom));
+    var container = this.container;
+    var centerX = (container.scrollLeft + container.clientWidth / 2) / Math.max(this.levelWidth(), 1);
+    var centerY = (container.scrollTop + container.clientHeight / 2) / Math.max(this.levelHeight(), 1);
+
+    this.zoom = zoom;
+    this.tiles = {};
+    this.plane.innerHTML = '';
+    this.plane.style.width = this.levelWidth() + 'px';
+    this.plane.style.height = this.levelHeight() + 'px';
+
+    container.scrollLeft = centerX * this.levelWidth() - container.clientWidth / 2;
+    container.scrollTop = centerY * this.levelHeight() - container.clientHeight / 2;
+    this.render();
+};
+
+TileViewer.prototype.render = function() {
+    var container = this.container, size = this.tileSize;
+    var columns = Math.ceil(this.levelWidth() / size), rows = Math.ceil(this.levelHeight() / size);
+    var left = Math.floor(container.scrollLeft / size);
+    var top = Math.floor(container.scrollTop / size);
+    var right = Math.min(columns - 1, Math.floor((container.scrollLeft + container.clientWidth) / size));
+    var bottom = Math.min(rows - 1, Math.floor((container.scrollTop + container.clientHeight) / size));
+
+    for (var x = left; x <= right; x++) {
+        for (var y = top; y <= bottom; y++) {
+            var key = x + '/' + y;
+            if (!(key in this.tiles)) {
+                var tile = document.createElement('img');
+                tile.src = this.src + '/' + this.zoom + '/' + key + '.png';
+                tile.alt = '';
+                tile.style.left = x * size + 'px';
+                tile.style.top = y * size + 'px';
+                this.plane.appendChild(tile);
+                this.tiles[key] = tile;
+            }
+        }
+    }
+};
+
+var tileMaps = document.getElementsByClassName('tilemap');
+for (var i = 0; i < tileMaps.length; i++) {
+    new TileViewer(tileMaps[i]);
+}
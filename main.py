@@ -1,8 +1,22 @@
 import re
+import io
 import os
-from bs4 import BeautifulSoup as bs
+import sys
+import time
+from html import unescape
+import shutil
+import argparse
+import hashlib
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import json
 from unidecode import unidecode
+from PIL import Image
+import instrument
+from tiles import export_pyramid
 
 
 class Page:
@@ -24,47 +38,42 @@ class Page:
 
         self.navigation_bar = []
         self.vocab = []
+        self.list_headings = []
         self.header_text = ""
         self.main_text = ""
 
         if auto_images:
             self.add_images(self.title.lower(), img_class=img_class)
 
+    maintenance_tags = re.compile('</ul>|<em>|</em>')
+    maintenance_replacements = {'</ul>': '</ul><p><br /></p>', '<em>': '@', '</em>': '$'}
+
     def maintenance(self):
-        self.main_text = self.main_text.replace('</ul>', '</ul><p><br /></p>')
-        self.main_text = self.main_text.replace('<em>', '@')
-        self.main_text = self.main_text.replace('</em>', '$')
+        self.main_text = self.maintenance_tags.sub(
+            lambda match: self.maintenance_replacements[match.group()], self.main_text
+        )
 
         for term in self.vocab:
             term.link = f'{self.full_url}#{term.long}'
             Website.vocab.append(term)
 
-    def cross_reference(self, other_page):
-        if self == other_page:
-            return
-
-        term_map = {}
-        for word in sorted(other_page.vocab, key=lambda term: len(term.short), reverse=True):
-            for word2 in self.vocab:
-                if word.short in word2.short:
-                    term_encoding = str(hash(word2.short))
-                    term_map[word2.short] = term_encoding
-                    self.main_text = self.main_text.replace(word2.short, term_encoding)
-
-            self.add_links(word)
-
-        for term in term_map:
-            self.main_text = self.main_text.replace(term_map[term], term)
+    @instrument.timed()
+    def cross_reference(self, term_index):
+        # No other term gets linked inside this page's own terms
+        linked = []
+        self.insert_links(term_index, exclude=self.vocab, linked=linked)
+        instrument.count('links', len(linked))
+        return linked
 
+    @instrument.timed()
     def write(self):
-        self.main_text = self.main_text.replace('@', '<em>')
-        self.main_text = self.main_text.replace('$', '</em>')
+        self.main_text = self.main_text.translate({ord('@'): '<em>', ord('$'): '</em>'})
 
-        src = HTML_String()
+        src = HTML_Writer()
 
         # Head
         src.write(f'<title>Pyrrhos - {self.tab}</title>')
-        src.write('<meta charset="UTF-8">')
+        src.write('<meta charset="utf-8">')
 
         # Title
         src.write('</head><body><div id="rectangle">')
@@ -86,9 +95,7 @@ class Page:
         if len(self.vocab) > 0:
             src.write('<toc class="header"><strong>Contents</strong></toc><toc><ol>')
             if self.url == 'religion':
-                toc_terms = [self.vocab[0]]
-                for term in re.findall("</ul>(.*?)<ul>", self.main_text.replace('\n', '')):
-                    toc_terms.append(Term(re.search("<strong>(.*)</strong>", term).group(1)))
+                toc_terms = [self.vocab[0]] + self.list_headings
             else:
                 toc_terms = self.vocab
 
@@ -110,60 +117,52 @@ class Page:
 
         src.finish()
 
-        with open('html/' + self.full_url, 'w', encoding='UTF-8') as f:
-            f.write(src.prettify())
+        html = src.prettify()
+        write_if_changed('html/' + self.full_url, html)
+        return html
 
-    def add_images(self, image_folder, img_class='character'):
+    def add_images(self, image_folder, img_class='character', tile_viewers={}):
+        # Images named in tile_viewers are shown through the viewer of their tile folder, once exported
         file_path = './images/' + image_folder
-        files = sorted(os.listdir(file_path))
-        images = [f for f in files if (f.endswith('.png') or f.endswith('.jpg'))]
-        descriptions = [f for f in files if f.endswith('.txt')]
+        images, captions = image_assets.folder(file_path)
 
+        tiled = {
+            source
+            for source, folder in tile_viewers.items()
+            if source in images and os.path.exists(f'./images/{folder}/tiles.json')
+        }
+        variants = image_assets.variants(
+            [f'{file_path}/{source}' for source in images if source not in tiled]
+        )
         for source in images:
-            self.main_text += f'<img class="{img_class}" src=".{file_path}/{source}" alt="pic">'
-            desc = os.path.splitext(source)[0] + '.txt'
-            if desc in descriptions:
-                with open(file_path + '/' + desc) as f:
-                    self.main_text += f'<cap>{f.readlines()[0]}</cap>'
+            if source in tiled:
+                self.add_tile_viewer(tile_viewers[source])
+            else:
+                self.main_text += image_assets.html(variants[f'{file_path}/{source}'], img_class)
+            if source in captions:
+                self.main_text += f'<cap>{captions[source]}</cap>'
+
+    def add_tile_viewer(self, tile_folder):
+        # tiles are written by tiles.export_pyramid, which also records their layout
+        file_path = './images/' + tile_folder
+        if not os.path.exists(file_path + '/tiles.json'):
+            return
+
+        with open(file_path + '/tiles.json') as f:
+            layout = json.load(f)
+        self.main_text += (
+            f'<div class="tilemap" data-src=".{file_path}" data-width="{layout["width"]}" '
+            f'data-height="{layout["height"]}" data-tile-size="{layout["tile_size"]}" '
+            f'data-max-zoom="{layout["max_zoom"]}"></div>'
+        )
+        self.main_text += '<script src="../js/tiles.js"></script>'
 
     def add_links(self, term):
-        for v in [
-            term.short,
-            term.short + 's',
-            term.short + 'n',
-            term.short[:-2] + 'an',
-            term.short[:-2] + 'ans',
-            term.short + 'ish',
-            term.short[:-1] + 'ves',
-            term.short[:-1] + 'ven',
-            term.short[:-4] + 'ian',
-            term.short[:-1] + 'ish',
-        ]:
+        self.insert_links(LinkEngine([term]))
 
-            for w in [v, v.lower()]:
-                for x in [
-                    ' ' + w + ' ',
-                    ' ' + w + ',',
-                    ' ' + w + '.',
-                    ' ' + w + '!',
-                    ' ' + w + ')',
-                    ' ' + w + "’",
-                    ' ' + w + '?',
-                    ' ' + w + '/',
-                    '/' + w + ')',
-                    '/' + w + '/',
-                    '(' + w + '/',
-                    '(' + w + ' ',
-                    '(' + w + ',',
-                    ' ' + w + '-',
-                    '@' + w + '$',
-                    ' ' + w + '\n',
-                    ' ' + w + '’',
-                ]:
-
-                    replacement = x[0] + f'<a href="{term.link}">{w}</a>' + x[-1]
-                    self.header_text = self.header_text.replace(x, replacement)
-                    self.main_text = self.main_text.replace(x, replacement)
+    def insert_links(self, engine, exclude=(), linked=None):
+        self.header_text = engine.insert(self.header_text, exclude, linked)
+        self.main_text = engine.insert(self.main_text, exclude, linked)
 
     def add_wiki(self, base_link, separator="_"):
         for term in self.vocab:
@@ -172,93 +171,436 @@ class Page:
             self.main_text = self.main_text.replace(term.long + ' -', replacement)
 
 
-class HTML_String:
-    def __init__(self):
-        self.raw_string = "<!DOCTYPE html><html><head>"
-        self.raw_string += (
-            '<link rel="stylesheet" href="../css/header.css">'
-            '<link rel="stylesheet" href="../css/body.css">'
+class ImageAssets:
+    """
+    Downscaled WebP variants of the site's images, written to images/variants and named by a hash
+    of the source, so an image is only processed again when its content changes.
+    Sources are only read again when their size or mtime changed since the last build, and the
+    variants of a source that changed or went away are deleted. Folder listings and captions are
+    cached alongside, so they are only read again when the folder or the caption changed.
+    The sources themselves stay the fallback, since re-encoding their quantized PNGs only grew them
+    """
+
+    widths = [320, 640, 1280]
+
+    # Rendered width of each image class, as set in body.css
+    sizes = {'character': '30vw', 'map': '70vw', 'cover': '70vw'}
+
+    def __init__(
+        self, directory='images/variants', cache_file='cache/images.json', workers=os.cpu_count()
+    ):
+        self.directory = directory
+        self.cache_file = cache_file
+        self.workers = workers
+        self.cache, self.folders = {}, {}
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r') as f:
+                cache = json.load(f)
+            self.cache, self.folders = cache.get('images', {}), cache.get('folders', {})
+
+    def folder(self, path):
+        """
+        Returns the images in the folder at path, sorted, and the first line of the caption of each
+        image that has a .txt file of the same name
+        """
+        mtime = os.stat(path).st_mtime
+        listing = self.folders.get(path)
+        if listing is None or listing['mtime'] != mtime:
+            files = sorted(os.listdir(path))
+            images = [f for f in files if (f.endswith('.png') or f.endswith('.jpg'))]
+            if listing is not None:
+                for image in set(listing['images']) - set(images):
+                    self.remove(f'{path}/{image}')
+            listing = {'mtime': mtime, 'images': images, 'captions': {}}
+            for image in images:
+                if os.path.splitext(image)[0] + '.txt' in files:
+                    listing['captions'][image] = {'mtime': None, 'text': None}
+            self.folders[path] = listing
+
+        captions = {}
+        for image, caption in listing['captions'].items():
+            desc = f'{path}/{os.path.splitext(image)[0]}.txt'
+            mtime = os.stat(desc).st_mtime
+            if caption['mtime'] != mtime:
+                with open(desc) as f:
+                    caption.update(mtime=mtime, text=f.readlines()[0])
+            captions[image] = caption['text']
+        return listing['images'], captions
+
+    @instrument.timed()
+    def variants(self, paths):
+        # PIL releases the GIL while resizing and encoding, so threads are enough to spread the work
+        with ThreadPoolExecutor(self.workers) as executor:
+            entries = list(executor.map(self.get, paths))
+
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w') as f:
+            json.dump({'images': self.cache, 'folders': self.folders}, f, indent=1)
+        return dict(zip(paths, entries))
+
+    def get(self, path):
+        stat = os.stat(path)
+        entry = self.cache.get(path)
+        stale = entry is None or (entry['mtime'], entry['size']) != (stat.st_mtime, stat.st_size)
+        if stale or not all(os.path.exists(variant) for variant in self.files(entry)):
+            old = entry
+            entry = self.create(path, stat)
+            self.cache[path] = entry
+            if old is not None:
+                self.remove_files(set(self.files(old)) - set(self.files(entry)))
+        return entry
+
+    def remove(self, path):
+        # The source went away, so its variants are no longer referenced by any page
+        entry = self.cache.pop(path, None)
+        if entry is not None:
+            self.remove_files(self.files(entry))
+
+    def remove_files(self, variants):
+        for variant in variants:
+            if os.path.exists(variant):
+                os.remove(variant)
+
+    def files(self, entry):
+        return [f'{entry["stem"]}-{width}.webp' for width in entry['widths']]
+
+    def create(self, path, stat):
+        with open(path, 'rb') as f:
+            data = f.read()
+        image = Image.open(io.BytesIO(data))
+        image = image.convert('RGBA' if image.mode in ['P', 'LA', 'RGBA'] else 'RGB')
+        width, height = image.size
+
+        folder = os.path.join(self.directory, os.path.basename(os.path.dirname(path)))
+        os.makedirs(folder, exist_ok=True)
+        name = os.path.splitext(os.path.basename(path))[0]
+        entry = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'source': os.path.normpath(path),
+            'stem': f'{folder}/{name}-{hashlib.sha1(data).hexdigest()[:12]}',
+            'widths': sorted({w for w in self.widths if w < width} | {width}),
+            'width': width,
+            'height': height,
+        }
+
+        instrument.count('image variants', len(entry['widths']))
+        for w, variant in zip(entry['widths'], self.files(entry)):
+            if not os.path.exists(variant):
+                resized = (
+                    image if w == width else image.resize((w, round(height * w / width)), Image.LANCZOS)
+                )
+                resized.save(variant, quality=80, method=6)
+        return entry
+
+    def html(self, entry, img_class):
+        srcset = ', '.join(
+            f'../{variant} {w}w' for w, variant in zip(entry['widths'], self.files(entry))
+        )
+        sizes = self.sizes.get(img_class, '100vw')
+        # The cover is at the top of the home page, where lazy loading would only delay it
+        loading = 'eager' if img_class == 'cover' else 'lazy'
+        return (
+            f'<picture><source type="image/webp" srcset="{srcset}" sizes="{sizes}">'
+            f'<img class="{img_class}" src="../{entry["source"]}" width="{entry["width"]}" '
+            f'height="{entry["height"]}" loading="{loading}" alt="pic"></picture>'
         )
 
+
+image_assets = ImageAssets()
+
+
+class LinkEngine:
+    """
+    Links every term in one regex pass per text, as replacing each context of each
+    inflection of each term in turn did, except that the longest word starting at a
+    place wins rather than the one whose term came first
+    """
+
+    # (before, after) characters a term must sit between to be linked, in order of priority
+    contexts = [
+        (' ', ' '),
+        (' ', ','),
+        (' ', '.'),
+        (' ', '!'),
+        (' ', ')'),
+        (' ', "’"),
+        (' ', '?'),
+        (' ', '/'),
+        ('/', ')'),
+        ('/', '/'),
+        ('(', '/'),
+        ('(', ' '),
+        ('(', ','),
+        (' ', '-'),
+        ('@', '$'),
+        (' ', '\n'),
+        (' ', '’'),
+    ]
+
+    @instrument.timed('LinkEngine')
+    def __init__(self, terms):
+        # terms for every (before, word, after), one per time the replacement would have run
+        self.terms = {}
+        self.source_terms = list(terms)
+        words = set()
+        for term in terms:
+            for v in term.inflections():
+                for w in [v, v.lower()]:
+                    words.add(w)
+                    for before, after in self.contexts:
+                        self.terms.setdefault((before, w, after), []).append(term)
+
+        alternation = trie_pattern(words)
+        branches = []
+        for before in dict.fromkeys(b for b, _ in self.contexts):
+            after = ''.join(dict.fromkeys(a for b, a in self.contexts if b == before))
+            branches.append(f'(?<={re.escape(before)})(?:{alternation})(?=[{re.escape(after)}])')
+        self.pattern = re.compile('|'.join(branches))
+        self.exclude_patterns = {}
+
+    def rebind(self, terms):
+        # Points the engine at equal terms from a later build, as exclusion compares terms by identity
+        replacements = {id(old): new for old, new in zip(self.source_terms, terms)}
+        self.terms = {
+            key: [replacements[id(term)] for term in value] for key, value in self.terms.items()
+        }
+        self.source_terms, self.exclude_patterns = list(terms), {}
+        return self
+
+    def excluded_spans(self, text, exclude):
+        if not exclude:
+            return []
+        key = tuple(exclude)
+        if key not in self.exclude_patterns:
+            self.exclude_patterns[key] = re.compile(trie_pattern({term.short for term in exclude}))
+        return [match.span() for match in self.exclude_patterns[key].finditer(text)]
+
+    def insert(self, text, exclude=(), linked=None):
+        result, last = [], 0
+        previous = None
+        spans, span_index = self.excluded_spans(text, exclude), 0
+        for match in self.pattern.finditer(text):
+            start, end = match.span()
+            while span_index < len(spans) and spans[span_index][1] < end:
+                span_index += 1
+            if span_index < len(spans) and spans[span_index][0] <= start:
+                continue
+            key = (text[start - 1], match.group(), text[end])
+
+            # str.replace consumed the delimiter shared by two adjacent identical matches,
+            # so each replacement only linked every other one of a run of them
+            if previous and previous[0] == key and previous[1] == start - 1:
+                run_index = previous[2] + 1
+            else:
+                run_index = 0
+            previous = (key, end, run_index)
+
+            # Excluded terms were never replaced at all, so the others take their turns
+            terms = self.terms[key]
+            if exclude:
+                terms = [term for term in terms if term not in exclude]
+            if run_index % 2 < len(terms):
+                term = terms[run_index % 2]
+                result.append(text[last:start])
+                result.append(f'<a href="{term.link}">{match.group()}</a>')
+                last = end
+                if linked is not None:
+                    linked.append(term)
+
+        result.append(text[last:])
+        return ''.join(result)
+
+
+class HTML_Writer:
+    """
+    Buffers a page, then lays it out one tag per line with one space of indentation per level,
+    as BeautifulSoup's prettify did, but keeps <a> and <em> inline with the text around them
+    """
+
+    inline_tags = {'a', 'em'}
+    void_tags = {
+        'area',
+        'base',
+        'br',
+        'col',
+        'embed',
+        'hr',
+        'img',
+        'input',
+        'link',
+        'meta',
+        'source',
+        'wbr',
+    }
+
+    token = re.compile(
+        r"<!--.*?-->|<![^>]*>|<(/?)([a-zA-Z][^\s/>]*)((?:\"[^\"]*\"|'[^']*'|[^'\">])*)>", re.S
+    )
+    attribute = re.compile(r"([^\s=/>]+)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s>]*))?")
+
+    def __init__(self):
+        self.chunks = [
+            "<!DOCTYPE html><html><head>",
+            '<link rel="stylesheet" href="../css/header.css">',
+            '<link rel="stylesheet" href="../css/body.css">',
+        ]
+
     def write(self, s):
-        self.raw_string += s
+        self.chunks.append(s)
 
     def write_list(self, lst):
-        self.raw_string += ''.join(lst)
+        self.chunks.extend(lst)
 
     def finish(self):
         self.write('</body></html>\n')
-        self.sub_tags()
-
-    # By default, prettify starts a newline for all tags, which messes up links and formatting
-    # To solve, some tags are substituted for hashes, then prettify is executed
-    # And then the hashes are substituted back into tags
-    # Somehow the < and > characters are getting converted to '&gt;' and '&lt;'
-    # To do: investigate this issue
-
-    def sub_tags(self):
-        self.raw_string = self.raw_string.replace('<a', str(hash('<a')))
-        self.raw_string = self.raw_string.replace('</a>', str(hash('</a>')))
-        self.raw_string = self.raw_string.replace('<em', str(hash('<em')))
-        self.raw_string = self.raw_string.replace('</em>', str(hash('</em>')))
-
-    def resub_tags(self, string):
-        string = string.replace(str(hash('<a')), '<a')
-        string = string.replace(str(hash('</a>')), '</a>')
-        string = string.replace(str(hash('<em')), '<em')
-        string = string.replace(str(hash('</em>')), '</em>')
-        string = string.replace('&gt;', '>')  # what is causing this?
-        string = string.replace('&lt;', '<')  # what is causing this?
-        return string
 
     def prettify(self):
-        soup = bs(self.raw_string, features="html.parser")
-        return self.resub_tags(soup.prettify())
+        raw = ''.join(self.chunks)
+        out = io.StringIO()
+        text, open_tags = [], []
+
+        def write_line(line):
+            out.write(' ' * len(open_tags) + line + '\n')
+
+        def flush_text():
+            line = escape_text(''.join(text)).strip()
+            text.clear()
+            if line:
+                write_line(line)
+
+        last = 0
+        for match in self.token.finditer(raw):
+            text.append(raw[last : match.start()])
+            last = match.end()
+            closing, name, attributes = match.groups()
+
+            if name is not None and name.lower() in self.inline_tags:
+                text.append(match.group())
+                continue
+
+            flush_text()
+            if name is None:
+                write_line(match.group())
+                continue
+
+            name = name.lower()
+            if closing:
+                # Like html.parser, close everything opened since the tag, and ignore stray end tags
+                if name in open_tags:
+                    while open_tags:
+                        tag = open_tags.pop()
+                        write_line(f'</{tag}>')
+                        if tag == name:
+                            break
+            elif name in self.void_tags:
+                write_line(f'<{name}{self.format_attributes(attributes)}/>')
+            else:
+                write_line(f'<{name}{self.format_attributes(attributes)}>')
+                if attributes.rstrip().endswith('/'):
+                    write_line(f'</{name}>')
+                else:
+                    open_tags.append(name)
+
+        text.append(raw[last:])
+        flush_text()
+        while open_tags:
+            write_line(f'</{open_tags.pop()}>')
+
+        return out.getvalue()
+
+    def format_attributes(self, source):
+        attributes = {}
+        for name, value in self.attribute.findall(source):
+            if value[:1] in ['"', "'"]:
+                value = value[1:-1]
+            attributes[name.lower()] = escape_text(value)
+
+        formatted = ''
+        for name, value in sorted(attributes.items()):
+            if '"' not in value:
+                formatted += f' {name}="{value}"'
+            elif "'" not in value:
+                formatted += f" {name}='{value}'"
+            else:
+                value = value.replace('"', '&quot;')
+                formatted += f' {name}="{value}"'
+        return formatted
 
 
 class Website:
     vocab = []
 
-    def __init__(self, page_titles=[], source=''):
+    def __init__(self, page_titles=[], source='', link_engines=None):
         self.pages, self.page_titles, self.page_index = [], page_titles, 0
         self.source = source
+        self.link_engines = link_engines
         for page_title in self.page_titles:
             self.pages.append(Page(page_title, source=source))
 
-    def read_source(self, source_file):
-        with open('src_files/' + source_file, 'r') as f:
-            lines = f.readlines()
-            current_page = self.pages[self.page_index]
+    # Patterns for scanning the source docs, compiled once
+    block_tag = re.compile('<strong|<ol|<em|<ul')
+    strong_tag = re.compile('<strong>(.*)</strong>')
+    list_tag = re.compile('</?ul>')
+
+    def scan_source(self, text):
+        """
+        Splits a source doc into page breaks, terms and lines of header or body text in one pass.
+        Terms in the body are flagged when they are the first heading after a list
+        """
+        header_feed, after_list = True, False
+        for line in text.splitlines(keepends=True):
+            if header_feed and self.block_tag.search(line):
+                header_feed = False
+
+            if '<strong>' in line:
+                if ' -' not in line:
+                    for title in self.page_titles:
+                        if title in line:
+                            header_feed, after_list = True, False
+                            yield 'page', None
 
-            header_feed = True
-            for line in lines:
-                line = line.replace('e`', 'è')
-                if header_feed and True in [t in line for t in ['<strong', '<ol', '<em', '<ul']]:
-                    header_feed = False
+                term = self.strong_tag.search(line)
+                if term is not None:
+                    yield 'term', (term.group(1), after_list and not header_feed)
+                    after_list = False
 
-                if '<strong>' in line:
-                    for title in self.page_titles:
-                        if title in line and ' -' not in line:
-                            self.page_index += 1
-                            current_page = self.pages[self.page_index]
-                            header_feed = True
-
-                    if current_page.url != 'home':
-                        term = re.search("<strong>(.*)</strong>", line)
-                        if term is not None:
-                            remove_s = False
-                            if current_page.url == 'monsters':
-                                remove_s = True
-                            vocab_word = Term(term.group(1), remove_s)
-                            current_page.main_text += f'<a name="{vocab_word.long}"></a>'
-                            if vocab_word.long not in self.page_titles:
-                                current_page.vocab.append(vocab_word)
-
-                if header_feed:
-                    current_page.header_text += line
-                else:
-                    current_page.main_text += line
+            lists = self.list_tag.findall(line)
+            if lists:
+                after_list = lists[-1] == '</ul>'
 
+            yield ('header' if header_feed else 'body'), line
+
+    @instrument.timed()
+    def read_source(self, source_file):
+        with open('src_files/' + source_file, 'r') as f:
+            text = f.read().replace('e`', 'è')
+
+        current_page = self.pages[self.page_index]
+        parts = {}
+        for kind, value in self.scan_source(text):
+            header, body = parts.setdefault(self.page_index, ([], []))
+            if kind == 'page':
+                self.page_index += 1
+                current_page = self.pages[self.page_index]
+            elif kind == 'term' and current_page.url != 'home':
+                name, after_list = value
+                vocab_word = Term(name, remove_s=current_page.url == 'monsters')
+                body.append(f'<a name="{vocab_word.long}"></a>')
+                if vocab_word.long not in self.page_titles:
+                    current_page.vocab.append(vocab_word)
+                if after_list:
+                    current_page.list_headings.append(vocab_word)
+            elif kind == 'header':
+                header.append(value)
+            elif kind == 'body':
+                body.append(value)
+
+        for index, (header, body) in parts.items():
+            self.pages[index].header_text += ''.join(header)
+            self.pages[index].main_text += ''.join(body)
+
+    @instrument.timed()
     def insert_external_links(self):
         external_links = {
             'Greco': 'https://en.wikipedia.org/wiki/Greece',
@@ -333,32 +675,49 @@ class Website:
             spell = '-'.join(spell_name.lower().split())
             external_links[spell_name] = 'http://dnd5e.wikidot.com/spell:' + spell
 
+        terms = []
+        for word in external_links:
+            term = Term(word)
+            term.link = external_links[word]
+            terms.append(term)
+        engine = self.link_engine('external', terms)
+
         for page in self.pages:
             page.maintenance()
-            for word in external_links:
-                term = Term(word)
-                term.link = external_links[word]
-                page.add_links(term)
+            page.insert_links(engine)
 
+    @instrument.timed()
     def write_js(self):
-        code = []
+        # The first line of search.js holds the index, the rest is the search code
         with open('js/search.js', 'r') as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines):
-                if line == ']\n':
-                    code = lines[i + 1 :]
-                    break
-        with open('js/search.js', 'w') as f:
-            f.write("var searchTerms = [\n\t")
-            for i, term in enumerate(Website.vocab):
-                f.write("`")
-                f.write(json.dumps(term.__dict__))
-                if i < len(Website.vocab) - 1:
-                    f.write("`,\n\t")
-                else:
-                    f.write("`\n")
-            f.write("]\n")
-            f.writelines(code)
+            code = f.readlines()[1:]
+        index = json.dumps(search_index(Website.vocab), separators=(',', ':'))
+        write_if_changed('js/search.js', f'var searchIndex = {index};\n' + ''.join(code))
+
+    @instrument.timed()
+    def write_text_index(self, directory='js/text_index'):
+        # One shard per initial character, so the browser only fetches those its query needs
+        sections, shards = text_index(self.pages)
+        os.makedirs(directory, exist_ok=True)
+        write_if_changed(f'{directory}/sections.json', json.dumps(sections, separators=(',', ':')))
+
+        for name in os.listdir(directory):
+            if name != 'sections.json' and name[:-5] not in shards:
+                os.remove(f'{directory}/{name}')
+        for initial, words in shards.items():
+            write_if_changed(f'{directory}/{initial}.json', json.dumps(words, separators=(',', ':')))
+
+    def link_engine(self, name, terms):
+        # Builds sharing link_engines keep an engine by name, reused while its terms are unchanged
+        if self.link_engines is None:
+            return LinkEngine(terms)
+        key = content_hash([[term.long, term.short, term.link] for term in terms])
+        cached = self.link_engines.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1].rebind(terms)
+        engine = LinkEngine(terms)
+        self.link_engines[name] = (key, engine)
+        return engine
 
     def navigation(self):
         for page1 in self.pages:
@@ -368,14 +727,91 @@ class Website:
                 else:
                     page1.navigation_bar.append(f'<a href="{page2.url + ".html"}">{page2.tab}</a> ')
 
-    def build(self):
+    def build(self, manifest=None, jobs=1):
         self.insert_external_links()
         self.write_js()
         self.navigation()
-        for page1 in self.pages:
-            for page2 in self.pages:
-                page1.cross_reference(page2)
-            page1.write()
+
+        # Longest terms first, so a term contained in another is only linked on its own
+        term_index = self.link_engine(
+            'vocab', sorted(Website.vocab, key=lambda term: len(term.short), reverse=True)
+        )
+        stale = []
+        for page in self.pages:
+            source = content_hash(page.tab, page.navigation_bar, page.header_text, page.main_text)
+            linked = page.cross_reference(term_index)
+            if manifest is None:
+                stale.append((page, None, None))
+                continue
+
+            vocab = content_hash(
+                [t.long for t in page.vocab], sorted({(t.short, t.link) for t in linked})
+            )
+            if not manifest.is_current(page.full_url, source, vocab):
+                stale.append((page, source, vocab))
+
+        self.write_text_index()
+
+        # Linked pages no longer depend on each other, so worker processes render copies of them
+        pages = [page for page, _, _ in stale]
+        instrument.count('pages rendered', len(pages))
+        instrument.count('pages skipped', len(self.pages) - len(pages))
+        with instrument.stage('render'):
+            if jobs > 1 and len(pages) > 1:
+                with ProcessPoolExecutor(min(jobs, len(pages))) as executor:
+                    outputs = list(executor.map(Page.write, pages))
+            else:
+                outputs = [page.write() for page in pages]
+
+        if manifest is not None:
+            for (page, source, vocab), html in zip(stale, outputs):
+                manifest.record(page.full_url, source, vocab, html)
+            manifest.save()
+        return pages
+
+
+class BuildManifest:
+    """
+    Hashes of each page's source text, the terms linked from it and the HTML written for it,
+    so that an incremental build only renders pages whose inputs changed since the last one.
+    Without a path, the manifest is only kept in memory
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.pages = {}
+
+        # Any change to the builder itself could change every page
+        with open(__file__, 'rb') as f:
+            self.builder = hashlib.sha1(f.read()).hexdigest()
+
+        if path is not None and os.path.exists(path):
+            with open(path, 'r') as f:
+                manifest = json.load(f)
+            if manifest['builder'] == self.builder:
+                self.pages = manifest['pages']
+
+    def is_current(self, url, source, vocab):
+        entry = self.pages.get(url)
+        if entry is None or entry['source'] != source or entry['vocab'] != vocab:
+            return False
+
+        # The last output must also still be on disk, untouched
+        path = 'html/' + url
+        if not os.path.exists(path):
+            return False
+        with open(path, 'r', encoding='UTF-8') as f:
+            return content_hash(f.read()) == entry['output']
+
+    def record(self, url, source, vocab, html):
+        self.pages[url] = {'source': source, 'vocab': vocab, 'output': content_hash(html)}
+
+    def save(self):
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'builder': self.builder, 'pages': self.pages}, f, indent=1)
 
 
 class Term:
@@ -386,6 +822,20 @@ class Term:
     def get_long(self, term):
         return term.replace(' -', '').replace('<u>', '').replace('</u>', '').rstrip()
 
+    def inflections(self):
+        return [
+            self.short,
+            self.short + 's',
+            self.short + 'n',
+            self.short[:-2] + 'an',
+            self.short[:-2] + 'ans',
+            self.short + 'ish',
+            self.short[:-1] + 'ves',
+            self.short[:-1] + 'ven',
+            self.short[:-4] + 'ian',
+            self.short[:-1] + 'ish',
+        ]
+
     def get_short(self, term, remove_s):
         if remove_s and term[-1] == 's':
             term = term[:-1]
@@ -394,8 +844,130 @@ class Term:
         return unidecode(remove_articles(remove_parens(term)))
 
 
+def trie_pattern(words):
+    # Alternation of the words sharing common prefixes, trying longer words first
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def pattern(node):
+        ends = '' in node
+        branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        group = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends:
+            group = group + '?' if len(branches) == 1 and len(branches[0]) == 1 else f'(?:{group})?'
+        return group
+
+    return pattern(trie)
+
+
+def search_key(text):
+    # Matches normalize() in search.js: ASCII, lower case, words separated by single spaces.
+    # search.js only transliterates the letters unidecode spells out from Latin-1 and Latin Extended-A
+    return ' '.join(re.sub('[^a-z0-9]+', ' ', unidecode(text).lower()).split())
+
+
+def search_index(terms):
+    """
+    Search data for js/search.js: each term's name and link, the sorted keys starting at
+    every word of every name for prefix lookup, and the terms containing each trigram
+    of their names for misspelled queries
+    """
+    keys, trigrams = set(), {}
+    for i, term in enumerate(terms):
+        for name in {term.short, term.long}:
+            words = search_key(name).split()
+            for j in range(len(words)):
+                keys.add((' '.join(words[j:]), i, j))
+
+            padded = '  ' + ' '.join(words) + ' '
+            for k in range(len(padded) - 2):
+                trigrams.setdefault(padded[k : k + 3], set()).add(i)
+
+    return {
+        'terms': [[term.long, term.link] for term in terms],
+        'keys': [list(key) for key in sorted(keys)],
+        'trigrams': {gram: sorted(postings) for gram, postings in sorted(trigrams.items())},
+    }
+
+
+def text_index(pages):
+    """
+    Inverted index of the words in every page, after links are inserted. Pages are split into
+    sections at their anchors, and each word maps to a flat array of
+    [section delta, count, position delta, ...] for each section it appears in,
+    with positions counted in words from the start of the section.
+    Words are grouped into shards by their first character and sorted within them.
+    """
+    sections, postings = [], {}
+    for page in pages:
+        parts = re.split(r'<a name="([^"]*)"></a>', page.main_text)
+        texts = [(page.full_url, page.tab, page.header_text + parts[0])]
+        texts += [
+            (f'{page.full_url}#{anchor}', f'{page.tab}: {anchor}', text)
+            for anchor, text in zip(parts[1::2], parts[2::2])
+        ]
+
+        for link, title, text in texts:
+            words = section_words(text)
+            if not words:
+                continue
+            section = len(sections)
+            sections.append([link, title])
+            for position, word in enumerate(words):
+                if len(word) > 1:
+                    postings.setdefault(word, {}).setdefault(section, []).append(position)
+
+    shards = {}
+    for word in sorted(postings):
+        encoded, last_section = [], 0
+        for section, positions in postings[word].items():
+            encoded += [section - last_section, len(positions)]
+            encoded += [b - a for a, b in zip([0] + positions, positions)]
+            last_section = section
+        shards.setdefault(word[0], []).append([word, encoded])
+
+    return sections, shards
+
+
+@lru_cache(maxsize=4096)
+def section_words(text):
+    # Cached, as rebuilds in watch mode mostly index the same sections again
+    return search_key(unescape(re.sub('<[^>]*>', ' ', text))).split()
+
+
+def escape_text(text):
+    # Entities are decoded, and only & is escaped again so inline tags stay as they are
+    return unescape(text).replace('&', '&amp;')
+
+
+def content_hash(*parts):
+    return hashlib.sha1(json.dumps(parts, ensure_ascii=False).encode('UTF-8')).hexdigest()
+
+
+def write_if_changed(path, text):
+    # Leaves files that already hold the text alone, keeping their mtimes and deploy diffs minimal
+    if os.path.exists(path):
+        with open(path, 'r', encoding='UTF-8') as f:
+            if f.read() == text:
+                return
+    # Written aside and moved into place, so the preview server never serves half a file
+    with open(path + '.tmp', 'w', encoding='UTF-8') as f:
+        f.write(text)
+    os.replace(path + '.tmp', path)
+
+
+square_brackets = re.compile(r'\[.*?\]')
+parens = re.compile(r'\([^()|\[\]]*\)')
+
+
 def remove_parens(term):
-    return re.sub(r'\[.*?\]', '', re.sub(r'\([^()|\[\]]*\)', '', term)).rstrip()
+    return square_brackets.sub('', parens.sub('', term)).rstrip()
 
 
 def remove_articles(term):
@@ -406,29 +978,75 @@ def remove_articles(term):
         return term
 
 
-def download_source(download_fresh=False):
+@instrument.timed()
+def download_source(download_fresh=False, offline=None):
+    # Each .docx is hashed, and only converted again when it differs from the one its .html came from
+    # With offline set, the docs are read from that directory instead, as .docx or converted .html
+    hash_file = 'src_files/sources.json'
+
     def doc_to_html(doc_id, name):
-        url = 'https://docs.google.com/document/export?format=docx&id=' + doc_id
         raw_doc = 'src_files/' + name + '.docx'
         raw_html = 'src_files/' + name + '.html'
-        gdown.download(url, raw_doc, quiet=True)
-        pypandoc.convert_file(raw_doc, 'html', outputfile=raw_html)
+
+        if offline is not None:
+            if not os.path.exists(os.path.join(offline, name + '.docx')):
+                shutil.copyfile(os.path.join(offline, name + '.html'), raw_html)
+                return name, None
+            shutil.copyfile(os.path.join(offline, name + '.docx'), raw_doc)
+        else:
+            import gdown
+
+            url = 'https://docs.google.com/document/export?format=docx&id=' + doc_id
+            gdown.download(url, raw_doc, quiet=True)
+
+        with open(raw_doc, 'rb') as f:
+            doc_hash = hashlib.sha1(f.read()).hexdigest()
+        if doc_hash != hashes.get(name) or not os.path.exists(raw_html):
+            import pypandoc
+
+            pypandoc.convert_file(raw_doc, 'html', outputfile=raw_html)
+        return name, doc_hash
 
     if 'src_files' not in os.listdir('.'):
         os.makedirs('src_files')
         download_fresh = True
 
-    if download_fresh:
-        import gdown
-        import pypandoc
+    if download_fresh or offline is not None:
+        hashes = {}
+        if os.path.exists(hash_file):
+            with open(hash_file, 'r') as f:
+                hashes = json.load(f)
+
+        docs = {
+            'pyrrhos': '10zOwNbnFIhr0NnuXhmXsRoRdr_eq7BBZ2lnI3Hb8Gw0',
+            'wanderer': '1chN4NrMKjeri804bMwmTY-Cn7i7RVJ7z9voxhNNwZ10',
+        }
+        with ThreadPoolExecutor(len(docs)) as executor:
+            for name, doc_hash in executor.map(doc_to_html, docs.values(), docs.keys()):
+                hashes[name] = doc_hash
 
-        doc_to_html('10zOwNbnFIhr0NnuXhmXsRoRdr_eq7BBZ2lnI3Hb8Gw0', 'pyrrhos')
-        doc_to_html('1chN4NrMKjeri804bMwmTY-Cn7i7RVJ7z9voxhNNwZ10', 'wanderer')
+        with open(hash_file, 'w') as f:
+            json.dump(hashes, f, indent=1)
 
 
-def main():
-    download_source(True)
+@instrument.timed()
+def export_map_tiles(source, directory):
+    # Exports the tile pyramid of source again whenever it is newer than the last export
+    layout = os.path.join(directory, 'tiles.json')
+    if not os.path.exists(source):
+        return
+    if os.path.exists(layout) and os.path.getmtime(layout) >= os.path.getmtime(source):
+        return
+
+    if os.path.isdir(directory):
+        shutil.rmtree(directory)
+    with Image.open(source) as image:
+        export_pyramid(image, directory)
 
+
+def create_website(link_engines=None):
+    # Every page of the site, read from the converted source docs
+    Website.vocab = []
     website = Website(
         page_titles=[
             'Home Page',
@@ -442,13 +1060,16 @@ def main():
             'The Wanderer’s Wares',
         ],
         source='https://github.com/aneziac/pyrrhos',
+        link_engines=link_engines,
     )
 
     website.pages[0].add_images('world', 'cover')
     website.read_source('pyrrhos.html')
     website.read_source('wanderer.html')
 
-    world_map = Page('Map', auto_images=True, img_class='map')
+    export_map_tiles('images/map/world_map.png', 'images/tiles')
+    world_map = Page('Map')
+    world_map.add_images('map', img_class='map', tile_viewers={'world_map.png': 'tiles'})
     players = Page('Players', auto_images=True)
     npcs = Page('NPCs', auto_images=True)
 
@@ -471,7 +1092,153 @@ def main():
     website.pages[3].add_wiki('https://d-n-d5e.fandom.com/wiki')
     website.pages[5].add_wiki('https://www.5esrd.com/gamemastering/monsters-foes/monsters-by-type')
 
-    website.build()
+    return website
+
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """
+    Serves the site with an ETag for each file made from its mtime and size, which builds only
+    change by rewriting it, answering requests for unchanged files with 304 Not Modified
+    """
+
+    def send_head(self):
+        self.etag = None
+        path = self.translate_path(self.path)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            tags = [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]
+            if self.etag in tags or '*' in tags:
+                self.send_response(304)
+                self.end_headers()
+                return None
+        return super().send_head()
+
+    def end_headers(self):
+        if getattr(self, 'etag', None) is not None:
+            self.send_header('ETag', self.etag)
+            # Browsers check back on every load, so edits show up on the next refresh
+            self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
+
+class DevServer:
+    """
+    Serves the site locally and rebuilds it whenever the source docs or images change.
+    Rebuilds share an in-memory manifest, so only pages whose sources or linked terms changed
+    are rendered again, and reuse the link engines while the vocabulary stays the same.
+    Stylesheets and scripts are served as they are, so changes to them only need a refresh
+    """
+
+    watched = ['src_files', 'images', 'css', 'js']
+    # Written by builds themselves, so they never start one
+    generated = tuple(
+        os.path.normpath(path)
+        for path in ['images/variants', 'images/tiles', 'js/text_index', 'js/search.js']
+    )
+
+    def __init__(self, port=8000, interval=0.2, jobs=1):
+        self.port, self.interval, self.jobs = port, interval, jobs
+        self.manifest = BuildManifest(None)
+        self.link_engines = {}
+        self.files = self.snapshot()
+
+    def snapshot(self):
+        files = {}
+        for folder in self.watched:
+            for root, _, names in os.walk(folder):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    files[path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def changes(self):
+        files = self.snapshot()
+        changed = [
+            p for p in sorted(files.keys() | self.files.keys()) if files.get(p) != self.files.get(p)
+        ]
+        self.files = files
+        return [path for path in changed if not path.startswith(self.generated)]
+
+    def rebuild(self):
+        start = time.perf_counter()
+        try:
+            pages = create_website(self.link_engines).build(self.manifest, jobs=self.jobs)
+        except Exception:
+            # A doc caught halfway through being saved should not stop the server
+            traceback.print_exc()
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f'Rendered {", ".join(page.tab for page in pages) or "no pages"} in {elapsed:.0f} ms')
+
+    def watch(self):
+        while True:
+            time.sleep(self.interval)
+            changed = self.changes()
+            if not changed:
+                continue
+            print('Changed: ' + ', '.join(changed))
+
+            for path in changed:
+                if path.endswith('.docx') and os.path.exists(path):
+                    import pypandoc
+
+                    pypandoc.convert_file(path, 'html', outputfile=path[:-5] + '.html')
+            if any(path.startswith('images') or path.endswith('.html') for path in changed):
+                self.rebuild()
+
+    def serve_forever(self):
+        self.rebuild()
+        server = ThreadingHTTPServer(
+            ('localhost', self.port), partial(PreviewHandler, directory=os.getcwd())
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f'Serving the site at http://localhost:{self.port}/html/home.html', file=sys.stderr)
+        try:
+            self.watch()
+        except KeyboardInterrupt:
+            server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Builds the Pyrrhos website')
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='only render pages whose sources or linked terms changed',
+    )
+    parser.add_argument(
+        '--offline',
+        metavar='DIRECTORY',
+        help='read the source docs from this directory instead of downloading',
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count(),
+        help='number of processes rendering pages in parallel',
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='serve the site locally, rebuilding it as the source docs and images change',
+    )
+    parser.add_argument('--port', type=int, default=8000, help='port the site is served on with --watch')
+    args = parser.parse_args()
+
+    download_source(True, offline=args.offline)
+
+    if args.watch:
+        DevServer(args.port, jobs=args.jobs).serve_forever()
+        return
+
+    website = create_website()
+    website.build(BuildManifest('cache/manifest.json') if args.incremental else None, jobs=args.jobs)
 
 
-main()
+if __name__ == '__main__':
+    main()
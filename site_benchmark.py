@@ -0,0 +1,252 @@
+import os
+import sys
+import json
+import math
+import random
+import shutil
+import argparse
+import subprocess
+import time
+
+# Terms per page in the real docs, which a scale of 1 reproduces
+page_terms = {
+    'A Geographical Overview of Pyrrhos': 7,
+    'Political Overview of Pyrrhos': 30,
+    'The Races of Pyrrhos': 36,
+    'Religion': 34,
+    'Monsters': 11,
+    'Demons': 11,
+    'Cosmology': 7,
+    'The Wanderer’s Wares': 89,
+}
+syllables = 'ar bel cor dra e` fen gal hy is ka lor mir nar os pis quo res sta thal ur vor zan'.split()
+words = (
+    'the of and to in a is that for it as with was on are by this be from or an they which at have one '
+    'their had not were but all some people there when can been more many other into who most these '
+    'city island gods war sea trade empire ancient magic temple ruins coast king queen guild faith '
+    'known called old new great small often never always north south east west across beyond against'
+).split()
+
+
+class SourceGenerator:
+    """
+    Writes pandoc-style stand-ins for the two source docs, with scale times the terms and text of
+    the real ones: page title headings, term headings (followed by lists on the religion page),
+    lists, <em> and cross-references between terms, in the shape Website.read_source expects
+    """
+
+    def __init__(self, scale=1, seed=0, paragraphs=3, sentence_words=12):
+        self.rng = random.Random(seed)
+        self.scale, self.paragraphs, self.sentence_words = scale, paragraphs, sentence_words
+        self.names = set()
+        self.terms = {
+            title: [self.name() for _ in range(count * scale)] for title, count in page_terms.items()
+        }
+        self.vocab = [term for terms in self.terms.values() for term in terms]
+
+    def name(self):
+        while True:
+            name = ''.join(
+                self.rng.choice(syllables) for _ in range(self.rng.randint(2, 3))
+            ).capitalize()
+            form = self.rng.random()
+            if form < 0.1:
+                name = 'Isles of ' + name
+            elif form < 0.2:
+                name = 'The ' + name
+            elif form < 0.25:
+                name = name + ' (' + self.rng.choice(words) + ')'
+            if name not in self.names:
+                self.names.add(name)
+                return name
+
+    def sentence(self):
+        sentence = []
+        for _ in range(self.sentence_words):
+            roll = self.rng.random()
+            if roll < 0.08:
+                sentence.append(self.rng.choice(self.vocab).split(' (')[0])
+            elif roll < 0.1:
+                sentence.append('<em>' + self.rng.choice(words) + '</em>')
+            else:
+                sentence.append(self.rng.choice(words))
+        return ' '.join(sentence).capitalize() + '.'
+
+    def paragraph(self):
+        return ' '.join(self.sentence() for _ in range(self.rng.randint(2, 4)))
+
+    def page(self, title):
+        lines = [f'<p><strong><u>{title}</u></strong></p>\n', f'<p>{self.paragraph()}</p>\n']
+        for n, term in enumerate(self.terms[title]):
+            if title == 'Monsters':
+                term += 's'
+            if title == 'Religion':
+                lines.append(f'<p><strong>{term} -</strong></p>\n<ul>\n')
+                lines += [f'<li><p>{self.paragraph()}</p></li>\n' for _ in range(self.paragraphs)]
+                lines.append('</ul>\n')
+                continue
+
+            lines.append(f'<p><strong>{term} -</strong> {self.paragraph()}</p>\n')
+            lines += [f'<p>{self.paragraph()}</p>\n' for _ in range(self.paragraphs - 1)]
+            if n % 4 == 1:
+                items = ''.join(f'<li><p>{self.sentence()}</p></li>\n' for _ in range(2))
+                lines.append(f'<ul>\n{items}</ul>\n')
+        return lines
+
+    def write(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        home = ['<p><strong><u>Pyrrhos</u></strong></p>\n']
+        home += [f'<p>{self.paragraph()}</p>\n' for _ in range(10 * self.scale)]
+        docs = {
+            'pyrrhos': home + [line for title in list(page_terms)[:-1] for line in self.page(title)],
+            'wanderer': self.page('The Wanderer’s Wares'),
+        }
+        for name, lines in docs.items():
+            with open(os.path.join(directory, name + '.html'), 'w') as f:
+                f.writelines(lines)
+
+
+root = os.path.dirname(os.path.abspath(__file__))
+
+
+def copy_site(directory):
+    for folder in ['css', 'js', 'html', 'images']:
+        shutil.copytree(os.path.join(root, folder), os.path.join(directory, folder), dirs_exist_ok=True)
+
+
+def build(directory, sources, jobs=1):
+    """
+    Runs the full main.py pipeline offline from the sources in a copy of the site at directory,
+    returning the instrument report of the build
+    """
+    copy_site(directory)
+    profile = os.path.abspath(os.path.join(directory, 'cache', 'profile'))
+    env = dict(os.environ, PYRRHOS_PROFILE='timing', PYRRHOS_PROFILE_DIR=profile)
+    command = [sys.executable, os.path.join(root, 'main.py'), '--offline', os.path.abspath(sources)]
+    subprocess.run(command + ['--jobs', str(jobs)], cwd=directory, env=env, check=True)
+
+    with open(os.path.join(profile, 'report.json')) as f:
+        return json.load(f)
+
+
+def site_scaling(scales=(1, 10, 100), jobs=1, directory='cache/site_benchmark'):
+    """
+    Builds the site from generated sources at each scale, printing the time of each stage and its
+    growth exponent from the previous scale, where 1 is linear and anything well above it is not
+    """
+    work = os.path.join(directory, 'site')
+    reports = {}
+    for scale in [min(scales)] + list(scales):
+        # The first build is a warm-up, creating the image variants every later build reuses
+        sources = os.path.join(directory, 'sources', f'{scale}x')
+        SourceGenerator(scale).write(sources)
+        reports[scale] = build(work, sources, jobs)
+        print(f'{scale}x: {reports[scale]["seconds"]:.2f} s', file=sys.stderr)
+
+    with open(os.path.join(directory, 'results.json'), 'w') as f:
+        json.dump({str(scale): report for scale, report in reports.items()}, f, indent=1)
+
+    stages = sorted(
+        {name for report in reports.values() for name in report['stages']},
+        key=lambda name: -reports[max(scales)]['stages'].get(name, {}).get('seconds', 0),
+    )
+    rows = [
+        (name, {s: r['stages'].get(name, {}).get('seconds') for s, r in reports.items()})
+        for name in stages
+    ]
+    rows.append(('total', {s: r['seconds'] for s, r in reports.items()}))
+
+    print(f'{"stage":>36}' + ''.join(f'{str(s) + "x (s)":>12}{"growth":>8}' for s in scales))
+    for name, times in rows:
+        line, previous = f'{name:>36}', None
+        for scale in scales:
+            seconds, growth = times[scale], ''
+            if previous is not None and seconds and times[previous]:
+                growth = f'{math.log(seconds / times[previous]) / math.log(scale / previous):.2f}'
+            line += (f'{seconds:>12.3f}' if seconds is not None else f'{"-":>12}') + f'{growth:>8}'
+            previous = scale
+        print(line)
+
+
+def items_layout(directory='cache/site_benchmark', sources=None, repeat=20):
+    """
+    Best time of rendering items.html, the longest page, through HTML_Writer, next to laying out
+    the same page with BeautifulSoup's prettify, which the build used before, when bs4 is installed.
+    The site is built in this process from sources, or from generated docs at a scale of 1
+    """
+    if sources is None:
+        sources = os.path.join(directory, 'sources', '1x')
+        SourceGenerator(1).write(sources)
+    sources, work = os.path.abspath(sources), os.path.join(directory, 'site')
+    copy_site(work)
+
+    cwd = os.getcwd()
+    sys.path.insert(0, root)
+    import main as site
+
+    try:
+        os.chdir(work)
+        site.download_source(offline=sources)
+        website = site.create_website()
+        website.build()
+        items = next(page for page in website.pages if page.url == 'items')
+
+        timings = {'HTML_Writer': best_time(items.write, repeat)}
+        try:
+            from bs4 import BeautifulSoup
+
+            html = items.write()
+            timings['BeautifulSoup prettify'] = best_time(
+                lambda: BeautifulSoup(html, 'html.parser').prettify(), repeat
+            )
+        except ImportError:
+            print('bs4 is not installed, so only HTML_Writer is timed', file=sys.stderr)
+    finally:
+        os.chdir(cwd)
+
+    print(f'items.html, {len(items.main_text) / 1e3:.0f} kB of text')
+    for name, seconds in timings.items():
+        print(f'{name:>24}{seconds * 1e3:>10.1f} ms')
+
+
+def best_time(f, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmarks building the site from generated source docs'
+    )
+    parser.add_argument(
+        '--scales', type=int, nargs='+', default=[1, 10, 100], help='multiples of the real docs'
+    )
+    parser.add_argument(
+        '--layout', action='store_true', help='only time laying out items.html with HTML_Writer'
+    )
+    parser.add_argument(
+        '--sources', metavar='DIRECTORY', help='source docs to lay out, instead of generated ones'
+    )
+    parser.add_argument('--jobs', type=int, default=1, help='processes rendering pages in parallel')
+    parser.add_argument(
+        '--directory', default='cache/site_benchmark', help='where sources and the site go'
+    )
+    parser.add_argument(
+        '--generate', metavar='DIRECTORY', help='only write sources at the first scale here'
+    )
+    args = parser.parse_args()
+
+    if args.generate:
+        SourceGenerator(args.scales[0]).write(args.generate)
+    elif args.layout:
+        items_layout(args.directory, args.sources)
+    else:
+        site_scaling(sorted(set(args.scales)), args.jobs, args.directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import os
+
+from PIL import Image
+
+from main import ImageAssets, LinkEngine, Page, Term
+
+
+def urquo_pages():
+    # politics defines Urquo and religion The Urquo, which share the short form Urquo
+    politics, religion = Page('Political Overview of Pyrrhos'), Page('Religion')
+    urquo, the_urquo = Term('Urquo'), Term('The Urquo')
+    urquo.link, the_urquo.link = 'politics.html#Urquo', 'religion.html#The Urquo'
+    politics.vocab, religion.vocab = [urquo], [the_urquo]
+    return politics, religion, LinkEngine([urquo, the_urquo])
+
+
+def test_own_term_falls_through_to_other_page():
+    politics, religion, engine = urquo_pages()
+    politics.main_text = 'the urquoish, and Urquo rules. '
+    linked = politics.cross_reference(engine)
+
+    assert politics.main_text == 'the <a href="religion.html#The Urquo">urquoish</a>, and Urquo rules. '
+    assert linked == religion.vocab
+
+
+def test_fall_through_keeps_every_other_match():
+    politics, religion, engine = urquo_pages()
+    politics.main_text = 'x urquo urquo urquo '
+    politics.cross_reference(engine)
+
+    link = '<a href="religion.html#The Urquo">urquo</a>'
+    assert politics.main_text == f'x {link} urquo {link} '
+
+
+def test_both_terms_link_alternately_elsewhere():
+    _, _, engine = urquo_pages()
+    text = engine.insert('x urquo urquo ')
+
+    assert (
+        text == 'x <a href="politics.html#Urquo">urquo</a> <a href="religion.html#The Urquo">urquo</a> '
+    )
+
+
+def test_replaced_and_removed_images_lose_their_variants(tmp_path):
+    folder = tmp_path / 'players'
+    folder.mkdir()
+    Image.new('RGB', (400, 200), 'red').save(folder / 'a.png')
+    Image.new('RGB', (400, 200), 'blue').save(folder / 'b.png')
+    (folder / 'a.txt').write_text('Red\n')
+    assets = ImageAssets(str(tmp_path / 'variants'), str(tmp_path / 'images.json'), workers=1)
+
+    images, captions = assets.folder(str(folder))
+    entries = assets.variants([f'{folder}/{image}' for image in images])
+    old = assets.files(entries[f'{folder}/a.png'])
+    assert captions == {'a.png': 'Red\n'}
+
+    Image.new('RGB', (400, 200), 'green').save(folder / 'a.png')
+    os.utime(folder / 'a.png', (0, 0))
+    os.remove(folder / 'b.png')
+    assets = ImageAssets(str(tmp_path / 'variants'), str(tmp_path / 'images.json'), workers=1)
+    images, _ = assets.folder(str(folder))
+    new = assets.files(assets.variants([f'{folder}/{image}' for image in images])[f'{folder}/a.png'])
+
+    assert images == ['a.png']
+    assert all(os.path.exists(variant) for variant in new)
+    assert sorted(os.listdir(tmp_path / 'variants' / 'players')) == sorted(map(os.path.basename, new))
+    assert not any(os.path.exists(variant) for variant in old)
@@ -0,0 +1,63 @@
+import numpy as np
+from opensimplex import OpenSimplex
+import os
+import pickle
+from PIL import Image
+from tiles import export_pyramid
+from world_map import BigIsland, GridSimplex, NoiseMap, SharedImageMap
+
+
+def test_grid_simplex_matches_opensimplex():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-300, 300, size=(2, 2000))
+    scalar = OpenSimplex(1234)
+    expected = np.array([scalar.noise2d(a, b) for a, b in zip(x, y)])
+
+    assert np.abs(GridSimplex(1234).noise2d(x, y) - expected).max() < 1e-12
+
+
+def test_vectorized_noise_map_matches_scalar_path():
+    vectorized = NoiseMap((48, 32), seed=7).map
+    scalar = NoiseMap((48, 32), vectorized=False, seed=7).map
+
+    assert vectorized.shape == scalar.shape == (32, 48)
+    assert np.abs(vectorized - scalar).max() < 1e-12
+    assert abs(vectorized.mean() - scalar.mean()) < 1e-12
+    assert abs(vectorized.std() - scalar.std()) < 1e-12
+
+
+def test_partial_island_cache_is_a_miss(tmp_path):
+    island = BigIsland((64, 64), seed=3, cache_dir=str(tmp_path))
+    os.remove(os.path.join(island.cache_path, 'shape.npy'))
+
+    rebuilt = BigIsland((64, 64), seed=3, cache_dir=str(tmp_path))
+    assert not rebuilt.cached
+    assert np.array_equal(rebuilt.terrain.map, island.terrain.map)
+    assert os.path.exists(os.path.join(rebuilt.cache_path, 'shape.npy'))
+    assert BigIsland((64, 64), seed=3, cache_dir=str(tmp_path)).cached
+
+
+def test_pyramid_edge_tiles_of_grey_and_rgba_images(tmp_path):
+    grey = np.arange(300 * 200, dtype=np.uint32).reshape(200, 300).astype(np.uint8)
+    export_pyramid(grey, str(tmp_path / 'grey'), tile_size=256)
+    edge = np.asarray(Image.open(tmp_path / 'grey' / '1' / '1' / '0.png'))
+    assert edge.shape == (256, 256, 4)
+    assert np.array_equal(edge[:200, :44, 0], grey[:, 256:])
+    assert (edge[:200, :44, 3] == 255).all() and (edge[200:, :, 3] == 0).all()
+
+    rgba = np.zeros((200, 300, 4), dtype=np.uint8)
+    rgba[..., 3] = 128
+    export_pyramid(Image.fromarray(rgba, 'RGBA'), str(tmp_path / 'rgba'), tile_size=256)
+    left = np.asarray(Image.open(tmp_path / 'rgba' / '1' / '0' / '0.png'))
+    edge = np.asarray(Image.open(tmp_path / 'rgba' / '1' / '1' / '0.png'))
+    assert (left[:200, :, 3] == 128).all() and (edge[:200, :44, 3] == 128).all()
+
+
+def test_texturize_workers_share_the_map():
+    terrain = BigIsland((64, 64), seed=0).terrain.resize((160, 160))
+    serial = np.asarray(terrain.texturize(seed=1, tile_size=64))
+    parallel = np.asarray(terrain.texturize(seed=1, tile_size=64, workers=2))
+    assert np.array_equal(serial, parallel)
+    shared = SharedImageMap(terrain)
+    assert len(pickle.dumps(shared.texturize_tile)) < 10000
+    shared.release()
@@ -0,0 +1,69 @@
+"""
+Slippy-map tile pyramids of large images, for the tile viewer in js/tiles.js.
+Only needs numpy and Pillow, so the site build can export tiles without the map generator
+"""
+
+import os
+import json
+import numpy as np
+from PIL import Image
+
+
+def export_pyramid(image, directory, tile_size=256):
+    """
+    Writes image (a PIL image, or a uint8 array of grey, RGB or RGBA pixels) as slippy-map tiles
+    directory/z/x/y.png, where z = 0 fits the whole image in one tile. The deepest level is full
+    resolution and every level above is a 2x box downsample of the one below, made right after
+    that level's tiles are written. Edge tiles are padded with transparency, keeping any alpha
+    the image has. Sizes go to directory/tiles.json
+    """
+    # Tiles are RGB, or RGBA when the image has transparency
+    if isinstance(image, Image.Image):
+        transparent = 'A' in image.getbands() or 'transparency' in image.info
+        image = image.convert('RGBA' if transparent else 'RGB')
+    level = np.atleast_3d(np.asarray(image))
+    if level.shape[2] == 1:
+        level = np.repeat(level, 3, axis=2)
+    height, width = level.shape[:2]
+    max_zoom = max(0, int(np.ceil(np.log2(max(height, width) / tile_size))))
+
+    for zoom in range(max_zoom, -1, -1):
+        for x in range(-(-level.shape[1] // tile_size)):
+            os.makedirs(os.path.join(directory, str(zoom), str(x)), exist_ok=True)
+            for y in range(-(-level.shape[0] // tile_size)):
+                tile = level[y * tile_size : (y + 1) * tile_size, x * tile_size : (x + 1) * tile_size]
+                save_tile(tile, os.path.join(directory, str(zoom), str(x), f'{y}.png'), tile_size)
+        if zoom > 0:
+            level = box_downsample(level)
+
+    with open(os.path.join(directory, 'tiles.json'), 'w') as f:
+        json.dump({'width': width, 'height': height, 'tile_size': tile_size, 'max_zoom': max_zoom}, f)
+
+
+def save_tile(tile, path, tile_size):
+    if tile.shape[:2] == (tile_size, tile_size):
+        Image.fromarray(tile).save(path)
+        return
+    padded = np.zeros([tile_size, tile_size, 4], dtype=np.uint8)
+    padded[: tile.shape[0], : tile.shape[1], :3] = tile[:, :, :3]
+    padded[: tile.shape[0], : tile.shape[1], 3] = tile[:, :, 3] if tile.shape[2] == 4 else 255
+    Image.fromarray(padded, 'RGBA').save(path)
+
+
+def box_downsample(level, strip_rows=512):
+    """
+    Halves a uint8 image by averaging 2x2 blocks, strip_rows rows at a time;
+    odd edges are averaged with themselves
+    """
+    height, width = level.shape[:2]
+    result = np.empty(((height + 1) // 2, (width + 1) // 2) + level.shape[2:], dtype=np.uint8)
+
+    for i in range(0, height, strip_rows):
+        strip = level[i : i + strip_rows].astype(np.float32)
+        if strip.shape[0] % 2:
+            strip = np.concatenate([strip, strip[-1:]])
+        if width % 2:
+            strip = np.concatenate([strip, strip[:, -1:]], axis=1)
+        blocks = strip.reshape(strip.shape[0] // 2, 2, strip.shape[1] // 2, 2, *strip.shape[2:])
+        result[i // 2 : i // 2 + blocks.shape[0]] = np.round(blocks.mean(axis=(1, 3)))
+    return result
@@ -1,8 +1,22 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
 from PIL import Image, ImageColor
 import numpy as np
 import matplotlib.pyplot as plt
 from opensimplex import OpenSimplex
 import skimage.transform as tf
+import instrument
+from tiles import export_pyramid  # noqa: F401
+
+
+# OpenSimplex 2D constants, mirrored from the opensimplex package
+STRETCH_CONSTANT_2D = -0.211324865405187
+SQUISH_CONSTANT_2D = 0.366025403784439
+NORM_CONSTANT_2D = 47
+GRADIENTS_2D = np.array([5, 2, 2, 5, -5, 2, -2, 5, 5, -2, 2, -5, -5, -2, -2, -5], dtype=np.float64)
 
 
 class ImageMap:
@@ -27,40 +41,18 @@ class ImageMap:
         result.normalize()
         return result
 
-    def apply_circular_mask(self, weight, n=1.25):
-        interpolation = lambda x: x ** n
-        mask = np.outer(
-            self.create_gradient(self.height, f=interpolation, two_dir=True),
-            self.create_gradient(self.width, f=interpolation, two_dir=True),
+    def apply_circular_mask(self, weight, n=1.25, dtype=np.float64):
+        return self.apply_mask(
+            create_mask((self.height, self.width), 'circular', n, dtype=dtype), weight
         )
 
-        return self.apply_mask(mask, weight)
-
-    def apply_square_mask(self, weight, edge_size):
-        mask = np.ones([self.height, self.width])
-        gradient = self.create_gradient(edge_size)
-
-        for i in range(self.height):
-            mask[i, :edge_size] *= gradient
-            mask[i, self.width - edge_size :] *= gradient[::-1]
-        for i in range(self.width):
-            mask[:edge_size, i] *= gradient
-            mask[self.height - edge_size :, i] *= gradient[::-1]
-
-        return self.apply_mask(mask, weight)
+    def apply_square_mask(self, weight, edge_size, dtype=np.float64):
+        return self.apply_mask(
+            create_mask((self.height, self.width), 'square', edge_size, dtype=dtype), weight
+        )
 
     def create_gradient(self, size, f=lambda x: x, two_dir=False):
-        """
-        f : [0, 1] -> [0, 1]
-        """
-        gradient = np.zeros([size])
-        if two_dir:
-            size = size // 2
-        for i in range(size):
-            gradient[i] = f(i / size)
-            if two_dir:
-                gradient[-i - 1] = f(i / size)
-        return gradient
+        return create_gradient(size, f, two_dir)
 
     def resize(self, new_dims):
         return ImageMap(tf.resize(self.map, new_dims), self.mapping)
@@ -69,7 +61,21 @@ class ImageMap:
         self.map -= np.min(self.map)
         self.map /= np.max(self.map)
 
+    @instrument.timed()
     def colorize(self):
+        """
+        Colors every pixel by the first mapping whose upper bound it falls under.
+        Uncovered pixels stay black, as in scalar_colorize.
+        """
+        # the first mapping with upper_bound >= value is also the first index where the
+        # running maximum of the bounds reaches value, and that running maximum is sorted
+        bounds = np.maximum.accumulate([m.upper_bound for m in self.mapping])
+        palette = np.array([m.color for m in self.mapping] + [(0, 0, 0)], dtype=np.uint8)
+
+        classes = np.searchsorted(bounds, self.map, side='left')
+        return Image.fromarray(palette[classes], 'RGB')
+
+    def scalar_colorize(self):
         colorized = Image.new('RGB', (self.width, self.height))
         for i in range(self.height):
             for j in range(self.width):
@@ -79,111 +85,586 @@ class ImageMap:
                         break
         return colorized
 
-    def texturize(self, blend_factor=0.08):
-        texturized = np.zeros([self.height, self.width, 3])
+    def tiles(self, tile_size=None):
+        """
+        (rows, cols) slices covering the map in tile_size squares, or in one tile if None
+        """
+        if tile_size is None:
+            tile_size = max(self.height, self.width)
+        for i in range(0, self.height, tile_size):
+            for j in range(0, self.width, tile_size):
+                yield slice(i, min(i + tile_size, self.height)), slice(j, min(j + tile_size, self.width))
+
+    def bands(self, count):
+        """
+        (rows, cols) slices splitting the map into count full-width bands
+        """
+        edges = np.linspace(0, self.height, min(count, self.height) + 1).astype(int)
+        return [(slice(i, j), slice(0, self.width)) for i, j in zip(edges[:-1], edges[1:])]
+
+    def tile(self, rows, cols):
+        return self.map[rows, cols].astype(np.float64)
+
+    @instrument.timed()
+    def texturize(self, blend_factor=0.08, workers=1, tile_size=256, seed=None):
+        """
+        Textures are coordinate-addressed, so tiles can be spread over workers processes
+        and the result only depends on seed, not on workers or tile_size
+        """
+        blend_ranges = self.blend_ranges(blend_factor)
+        if seed is None:
+            seed = int(np.random.default_rng().integers(1e5))
+
+        result = ImageMap(np.zeros([self.height, self.width, 3], dtype=np.float32))
+        tiles = list(self.tiles(tile_size))
+        source = SharedImageMap(self) if workers > 1 else self
+        try:
+            fill_tiles(
+                result.map,
+                tiles,
+                source.texturize_tile,
+                blend_factor,
+                blend_ranges,
+                seed,
+                workers=workers,
+            )
+        finally:
+            if source is not self:
+                source.release()
+        return result.read_rgb()
+
+    def texturize_tile(self, rows, cols, blend_factor, blend_ranges, seed):
+        """
+        Composites the layers of one tile. Pixel values are sorted once, so the pixels each layer
+        reaches are a contiguous run found from its bounds; only those get weights, and texture is
+        only synthesized over their bounding box
+        """
+        values = self.tile(rows, cols).ravel()
+        width = cols.stop - cols.start
+        order = np.argsort(values, kind='stable')
+        ordered = values[order]
+
+        texturized = np.zeros([values.size, 3], dtype=np.float32)
+        divisor = np.zeros(values.size, dtype=np.float32)
+
+        for i, m in enumerate(self.mapping):
+            low, high = self.layer_support(i, blend_factor)
+            start = np.searchsorted(ordered, low, side='left')
+            stop = np.searchsorted(ordered, high, side='right')
+
+            weight = self.layer_mask(ordered[start:stop], i, blend_factor, blend_ranges[i])
+            index = order[start:stop][weight != 0]
+            weight = weight[weight != 0].astype(np.float32)
+            if index.size == 0:
+                continue
+
+            i_pixel, j_pixel = np.divmod(index, width)
+            top, left = i_pixel.min(), j_pixel.min()
+            box_rows = slice(rows.start + top, rows.start + i_pixel.max() + 1)
+            box_cols = slice(cols.start + left, cols.start + j_pixel.max() + 1)
+            layer = m.texture.make_tile(box_rows, box_cols, seed + i)
+
+            texturized[index] += weight[:, None] * layer[i_pixel - top, j_pixel - left]
+            divisor[index] += weight
+
+        texturized /= divisor[:, None]
+        return texturized.reshape(rows.stop - rows.start, width, 3)
+
+    def layer_support(self, i, blend_factor):
+        """
+        Range of values given a nonzero weight by layer_mask for layer i
+        """
+        m = self.mapping[i]
+        if not self.blends(i, blend_factor):
+            return m.lower_bound, m.upper_bound
+        lower_bound = m.lower_bound - blend_factor if i >= self.no_blend_count() + 1 else m.lower_bound
+        return lower_bound, m.upper_bound + blend_factor
+
+    def texturize_tile_by_layer(self, rows, cols, blend_factor, blend_ranges, seed):
+        """
+        Reference compositing with full-tile masks and textures for every layer
+        """
+        values = self.tile(rows, cols)
+        texturized = np.zeros(values.shape + (3,))
         divisor = np.zeros_like(texturized)
-        no_blend_count = sum([int(not m.blend) for m in self.mapping])
 
         for i, m in enumerate(self.mapping):
-            mask = (m.upper_bound >= self.map).astype(int)
-            mask *= (self.map >= m.lower_bound).astype(int)
-            if i >= no_blend_count and blend_factor != 0:
-
-                # generate boolean mask of edges
-
-                # special cases: firsst and last layer
-                if i < len(self.mapping):
-                    blend_mask = (m.upper_bound + blend_factor >= self.map).astype(int)
-                else:
-                    blend_mask = np.ones_like(mask)
-                if i >= no_blend_count + 1:
-                    blend_mask *= (self.map >= (m.lower_bound - blend_factor)).astype(int)
-                else:
-                    blend_mask *= (self.map >= m.lower_bound).astype(int)
-
-                blend_mask -= mask
-
-                # make mask relative to edges
-                blend_mask = blend_mask.astype(float)
-                blend_mask *= self.map
-                blend_mask[blend_mask != 0] -= (m.lower_bound + m.upper_bound) / 2
-                blend_mask = abs(blend_mask)
-
-                # normalize mask and transform 0s to 1s and 1s to 0s
-                blend_mask[blend_mask != 0] -= np.min(blend_mask[blend_mask != 0])
-                blend_mask /= np.max(blend_mask)
-                blend_mask[blend_mask != 0] -= 1
-                blend_mask *= -1
-
-                mask = mask.astype(float)
-                mask += blend_mask
-
-            layer = m.texture.make_composite((self.height, self.width)).map
+            mask = self.layer_mask(values, i, blend_factor, blend_ranges[i])
+            if not mask.any():
+                continue
+            layer = m.texture.make_tile(rows, cols, seed + i)
             texturized += layer * mask[:, :, None]
             divisor += mask[:, :, None]
 
-        result = ImageMap(texturized)
-        result.map /= divisor
-        return result.read_rgb()
+        return texturized / divisor
+
+    def blend_ranges(self, blend_factor):
+        """
+        (min, max) edge distance of every blended layer's band, gathered over all tiles
+        """
+        low, high = [np.inf] * len(self.mapping), [-np.inf] * len(self.mapping)
+        for rows, cols in self.tiles():
+            values = self.tile(rows, cols)
+            for i in range(len(self.mapping)):
+                if self.blends(i, blend_factor):
+                    distance = self.blend_distance(values, i, blend_factor)
+                    if distance.any():
+                        low[i] = min(low[i], np.min(distance[distance != 0]))
+                        high[i] = max(high[i], np.max(distance))
+        return list(zip(low, high))
+
+    def layer_mask(self, values, i, blend_factor, blend_range=None):
+        """
+        Weight of mapping layer i at each of values: 1 inside its bounds, fading to 0
+        across blend_factor beyond them for blended layers.
+        blend_range is the (min, max) edge distance of the blend band, taken from values if None
+        """
+        m = self.mapping[i]
+        mask = ((m.upper_bound >= values) & (values >= m.lower_bound)).astype(float)
+        if not self.blends(i, blend_factor):
+            return mask
+
+        distance = self.blend_distance(values, i, blend_factor)
+        band = distance != 0
+        if blend_range is None:
+            blend_range = (np.min(distance[band]), np.max(distance[band]))
+
+        # normalize distances and transform 0s to 1s and 1s to 0s
+        low, high = blend_range
+        blend_mask = (distance[band] - low) / (high - low)
+        blend_mask[blend_mask != 0] = 1 - blend_mask[blend_mask != 0]
+        mask[band] += blend_mask
+        return mask
+
+    def no_blend_count(self):
+        return sum([int(not m.blend) for m in self.mapping])
+
+    def blends(self, i, blend_factor):
+        return i >= self.no_blend_count() and blend_factor != 0
+
+    def blend_distance(self, values, i, blend_factor):
+        """
+        Distance from the center of layer i for pixels in its blend band, 0 elsewhere
+        """
+        m = self.mapping[i]
+
+        # the first blended layer only blends upwards
+        lower_bound = m.lower_bound - blend_factor if i >= self.no_blend_count() + 1 else m.lower_bound
+        band = (m.upper_bound + blend_factor >= values) & (values >= lower_bound)
+        band &= ~((m.upper_bound >= values) & (values >= m.lower_bound))
+        band &= values != 0
+
+        distance = np.zeros(values.shape)
+        distance[band] = abs(values[band] - (m.lower_bound + m.upper_bound) / 2)
+        return distance
+
+    def threshold(self, level):
+        return ImageMap((self.map > level).astype(int), self.mapping)
+
+    def multiply(self, other):
+        return ImageMap(self.map * other.map, self.mapping)
 
     def blank_like(self):
         return ImageMap(np.ones([self.height, self.width]))
 
 
+def create_gradient(size, f=lambda x: x, two_dir=False):
+    """
+    f : [0, 1] -> [0, 1], applied to the whole array of positions at once
+    With two_dir, the gradient is mirrored about the center, which is left 0 for odd sizes
+    """
+    gradient = np.zeros([size])
+    steps = size // 2 if two_dir else size
+    if steps == 0:
+        return gradient
+
+    values = np.broadcast_to(f(np.arange(steps) / steps), [steps])
+    gradient[:steps] = values
+    if two_dir:
+        gradient[-steps:] = values[::-1]
+    return gradient
+
+
+def edge_profile(size, edge_size):
+    """
+    1 in the middle, ramping down linearly over edge_size at both ends
+    """
+    profile = np.ones([size])
+    gradient = create_gradient(edge_size)
+    profile[:edge_size] *= gradient
+    profile[size - edge_size :] *= gradient[::-1]
+    return profile
+
+
+def create_mask(shape, kind, *params, dtype=np.float64):
+    """
+    Separable masks, built by broadcasting 1D profiles
+        'circular', n: radial-ish falloff x ** n from the center
+        'square', edge_size: linear ramps over edge_size at every border
+        'falloff', f, two_dir: the gradient of f along both axes
+    """
+    height, width = shape
+    if kind == 'circular':
+        interpolation = lambda x: x ** params[0]
+        rows = create_gradient(height, f=interpolation, two_dir=True)
+        cols = create_gradient(width, f=interpolation, two_dir=True)
+    elif kind == 'square':
+        rows, cols = edge_profile(height, params[0]), edge_profile(width, params[0])
+    elif kind == 'falloff':
+        rows = create_gradient(height, f=params[0], two_dir=params[1])
+        cols = create_gradient(width, f=params[0], two_dir=params[1])
+    else:
+        raise ValueError(f'Unknown mask kind {kind}')
+
+    mask = (rows[:, None] * cols[None, :]).astype(dtype)
+    return mask
+
+
+class SharedImageMap(ImageMap):
+    """
+    Copy of an ImageMap in shared memory, pickled by the name of its block,
+    so worker processes attach to the map instead of each receiving a copy of it
+    """
+
+    def __init__(self, image_map):
+        self.__dict__.update(image_map.__dict__)
+        self.buffer = shared_memory.SharedMemory(create=True, size=max(image_map.map.nbytes, 1))
+        self.map = np.ndarray(image_map.map.shape, image_map.map.dtype, buffer=self.buffer.buf)
+        self.map[...] = image_map.map
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(map=None, buffer=self.buffer.name, shape=self.map.shape, dtype=self.map.dtype)
+        return state
+
+    def __setstate__(self, state):
+        shape, dtype = state.pop('shape'), state.pop('dtype')
+        self.__dict__.update(state)
+        self.buffer = shared_memory.SharedMemory(name=state['buffer'])
+        self.map = np.ndarray(shape, dtype, buffer=self.buffer.buf)
+
+    def release(self):
+        # Only the process that created the block frees it, once no array uses it
+        self.map = None
+        self.buffer.close()
+        self.buffer.unlink()
+
+
 class Texture:
-    def __init__(self, path, block_size, copy_overlap=1):
+    """
+    With a cache_dir, the sliced blocks are saved there as .npy and reused
+    while they are newer than the source image
+    """
+
+    def __init__(self, path, block_size, copy_overlap=1, seed=None, cache_dir=None):
         self.name = path.split('/')[-1].replace('.png', '')
         self.path = path
-        self.original = ImageMap(self.path)
         self.block_size = block_size
-        self.blocks = self._get_blocks(copy_overlap)
+        self.blocks = self._load_blocks(copy_overlap, cache_dir)
+        self.rng = np.random.default_rng(seed)
+
+        # synthesis state, reused across composites
+        self.piece_cache = {}
+        self.divisor_cache = {}
 
     def make_composite(self, size, paste_overlap=2):
         return ImageMap(self._create(size, paste_overlap))
 
-    def _get_blocks(self, overlap_factor):
-        blocks = []
-        block_inc = int(self.block_size / overlap_factor)
-        for i in range(0, self.original.height - self.block_size, block_inc):
-            for j in range(0, self.original.width - self.block_size, block_inc):
-                blocks.append(
-                    self.original.map[i : i + self.block_size, j : j + self.block_size].astype(
-                        np.float64
-                    )
-                )
+    @property
+    def original(self):
+        return ImageMap(self.path)
+
+    def _load_blocks(self, overlap_factor, cache_dir):
+        if cache_dir is None:
+            return self._get_blocks(overlap_factor)
+
+        path = os.path.join(cache_dir, f'{self.name}_{self.block_size}_{overlap_factor}.npy')
+        if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(self.path):
+            return np.load(path)
+
+        blocks = self._get_blocks(overlap_factor)
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(path, blocks)
         return blocks
 
+    def _get_blocks(self, overlap_factor):
+        """
+        Every block_size square of the source, every block_size / overlap_factor pixels,
+        as one contiguous (blocks, block_size, block_size, 3) array
+        """
+        size = self.block_size
+        original = self.original.map.astype(np.float32)
+        block_inc = int(size / overlap_factor)
+        windows = np.lib.stride_tricks.sliding_window_view(original, (size, size), axis=(0, 1))
+        windows = windows[: original.shape[0] - size : block_inc, : original.shape[1] - size : block_inc]
+        return np.ascontiguousarray(windows.transpose(0, 1, 3, 4, 2).reshape(-1, size, size, 3))
+
     def random_sample(self):
-        return self.blocks[int(np.random.rand() * len(self.blocks))]
+        return self.blocks[int(self.rng.random() * len(self.blocks))]
 
+    @instrument.timed()
     def _create(self, img_size, overlap_factor):
-        img_size = [x + 2 for x in img_size]
-        block_overlap = int(self.block_size / overlap_factor)
-        img = np.zeros((img_size[0], img_size[1], 3))
-        window = np.outer(np.hanning(self.block_size), np.hanning(self.block_size))
-        divisor = np.zeros_like(img) + 1e-10
-
-        def set_pixels(coords, incs, end):
-            adj_window = window[: end[0], : end[1], None]
-            adj_block = block[: end[0], : end[1]]
-            img[coords[0] : coords[0] + incs[0], coords[1] : coords[1] + incs[1]] += (
-                adj_window * adj_block
+        step = int(self.block_size / overlap_factor)
+
+        # the image is padded by one pixel on each side, with a cell every step pixels
+        cells = [-(-(x + 2) // step) for x in img_size]
+        choices = (self.rng.random(cells) * len(self.blocks)).astype(int)
+        return self.synthesize(choices, step)[1 : img_size[0] + 1, 1 : img_size[1] + 1]
+
+    def make_tile(self, rows, cols, seed, overlap_factor=2):
+        """
+        Composite covering the global pixel window (rows, cols), given as slices.
+        Blocks sit on a fixed grid offset like in _create, and each cell's block is picked by
+        hashing the cell with seed, so adjacent tiles share their border blocks
+        """
+        step = int(self.block_size / overlap_factor)
+
+        # grid cells whose block overlaps the window, cell (k, l) starts at (k * step - 1, l * step - 1)
+        first_row = max(0, (rows.start + 1 - self.block_size) // step + 1)
+        first_col = max(0, (cols.start + 1 - self.block_size) // step + 1)
+        cell_rows = np.arange(first_row, rows.stop // step + 1)
+        cell_cols = np.arange(first_col, cols.stop // step + 1)
+        choices = hash_cells(seed, cell_rows, cell_cols) % len(self.blocks)
+
+        top, left = rows.start - (first_row * step - 1), cols.start - (first_col * step - 1)
+        return self.synthesize(choices, step)[
+            top : top + rows.stop - rows.start, left : left + cols.stop - cols.start
+        ]
+
+    def synthesize(self, choices, step, chunk_rows=32):
+        """
+        Hanning-windowed blocks chosen by the index grid choices, placed every step pixels
+        from the top left corner of the output, and normalized by the summed window.
+        Blocks are cut into step x step pieces, so each piece offset is one strided add
+        over the whole grid, done chunk_rows grid rows at a time
+        """
+        pieces, window_pieces = self.pieces(step)
+        per_block = pieces.shape[0]
+        rows, cols = choices.shape
+        shape = ((rows + per_block - 1) * step, (cols + per_block - 1) * step, 3)
+
+        img = np.zeros(shape, dtype=np.float32)
+
+        for p in range(per_block):
+            for q in range(per_block):
+                for k in range(0, rows, chunk_rows):
+                    k_end = min(k + chunk_rows, rows)
+                    view = img[(k + p) * step : (k_end + p) * step, q * step : (q + cols) * step]
+                    view = view.reshape(k_end - k, step, cols, step, 3)
+                    view += pieces[p, q][choices[k:k_end]].transpose(0, 2, 1, 3, 4)
+
+        img /= self.divisor(rows, cols, step, window_pieces)
+        return img
+
+    def pieces(self, step):
+        """
+        Window-weighted blocks as float32 step x step pieces, indexed [p, q, block],
+        along with the matching pieces of the window itself
+        """
+        if step not in self.piece_cache:
+            per_block = -(-self.block_size // step)
+            size = per_block * step
+            window = np.zeros([size, size], dtype=np.float32)
+            window[: self.block_size, : self.block_size] = np.outer(
+                np.hanning(self.block_size), np.hanning(self.block_size)
             )
-            divisor[coords[0] : coords[0] + incs[0], coords[1] : coords[1] + incs[1]] += adj_window
 
-        for i in range(0, img_size[1], block_overlap):
-            for j in range(0, img_size[0], block_overlap):
-                block = self.blocks[int(np.random.rand() * len(self.blocks))]
+            blocks = np.zeros([len(self.blocks), size, size, 3], dtype=np.float32)
+            blocks[:, : self.block_size, : self.block_size] = self.blocks
+            blocks *= window[None, :, :, None]
+
+            pieces = blocks.reshape(len(self.blocks), per_block, step, per_block, step, 3)
+            pieces = np.ascontiguousarray(pieces.transpose(1, 3, 0, 2, 4, 5))
+            window_pieces = window.reshape(per_block, step, per_block, step).transpose(0, 2, 1, 3)
+            self.piece_cache[step] = (pieces, window_pieces)
+        return self.piece_cache[step]
+
+    # Largest divisor kept between calls, enough for map tiles but not whole composites,
+    # since textures are shared process-wide through the registry
+    divisor_cache_bytes = 2 ** 22
+
+    def divisor(self, rows, cols, step, window_pieces):
+        key = (rows, cols, step)
+        if key not in self.divisor_cache:
+            per_block = window_pieces.shape[0]
+            divisor = np.zeros(
+                [(rows + per_block - 1) * step, (cols + per_block - 1) * step], np.float32
+            )
+            for p in range(per_block):
+                for q in range(per_block):
+                    view = divisor[p * step : (p + rows) * step, q * step : (q + cols) * step]
+                    view.reshape(rows, step, cols, step)[...] += window_pieces[p, q][None, :, None, :]
+            divisor += 1e-10
+            if divisor.nbytes > self.divisor_cache_bytes:
+                return divisor[:, :, None]
+
+            # only the most recent shape is kept, as tiles of a map mostly share one shape
+            self.divisor_cache = {key: divisor[:, :, None]}
+        return self.divisor_cache[key]
 
-                # if on the bottom or right edges of the image, block must be cropped
-                if i > img_size[1] - self.block_size or j > img_size[0] - self.block_size:
-                    gap = [min(img_size[1] - i, self.block_size), min(img_size[0] - j, self.block_size)]
-                    set_pixels([i, j], gap, gap)
 
-                else:
-                    set_pixels([i, j], [self.block_size] * 2, [self.block_size] * 2)
+def hash_cells(seed, rows, cols):
+    """
+    Well-mixed 64-bit hash of (seed, row, col) for every cell of the rows x cols grid
+    """
+    h = np.full(1, seed, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    h = h ^ (np.asarray(rows, dtype=np.uint64)[:, None] * np.uint64(0xBF58476D1CE4E5B9))
+    h = h ^ (np.asarray(cols, dtype=np.uint64)[None, :] * np.uint64(0x94D049BB133111EB))
 
-        return (img / divisor)[1:-1, 1:-1]
+    # splitmix64 finalizer
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def fill_tiles(out, tiles, function, *args, workers=1):
+    """
+    Writes function(rows, cols, *args) into out[rows, cols] for every tile.
+    With several workers, tiles are computed in a process pool writing straight into shared memory,
+    or into the file of out if it is a memmap. Each tile only depends on its own coordinates,
+    so the result is the same for any number of workers
+    """
+    tiles = list(tiles)
+    instrument.count('tiles', len(tiles))
+    if workers == 1:
+        for rows, cols in tiles:
+            out[rows, cols] = function(rows, cols, *args)
+        return out
+
+    if isinstance(out, np.memmap):
+        buffer, target = None, out.filename
+    else:
+        buffer = shared_memory.SharedMemory(create=True, size=max(out.nbytes, 1))
+        target = buffer.name
+
+    try:
+        initargs = (target, buffer is None, out.shape, out.dtype, function, args)
+        with ProcessPoolExecutor(workers, initializer=_init_tile_worker, initargs=initargs) as pool:
+            list(pool.map(_fill_tile, tiles))
+        if buffer is not None:
+            out[...] = np.ndarray(out.shape, out.dtype, buffer=buffer.buf)
+    finally:
+        if buffer is not None:
+            buffer.close()
+            buffer.unlink()
+    return out
+
+
+_tile_worker = {}
+
+
+def _init_tile_worker(target, on_disk, shape, dtype, function, args):
+    if on_disk:
+        out = np.lib.format.open_memmap(target, mode='r+')
+    else:
+        _tile_worker['buffer'] = shared_memory.SharedMemory(name=target)
+        out = np.ndarray(shape, dtype, buffer=_tile_worker['buffer'].buf)
+    _tile_worker.update(out=out, function=function, args=args)
+
+
+def _fill_tile(tile):
+    rows, cols = tile
+    _tile_worker['out'][rows, cols] = _tile_worker['function'](rows, cols, *_tile_worker['args'])
+
+
+class GridSimplex:
+    """
+    Evaluates OpenSimplex 2D noise over whole coordinate arrays at once.
+    The permutation is taken from an OpenSimplex instance with the same seed,
+    so noise2d returns the same values as OpenSimplex.noise2d, element-wise.
+    """
+
+    def __init__(self, seed):
+        self.scalar = OpenSimplex(seed)
+        perm = np.array(self.scalar._perm)
+
+        # gradient index for every (xsb & 0xFF, ysb & 0xFF) pair
+        index = perm[(perm[:, None] + np.arange(256)) & 0xFF] & 0x0E
+        self.grad_x = GRADIENTS_2D[index]
+        self.grad_y = GRADIENTS_2D[index + 1]
+
+    def contribution(self, xsb, ysb, dx, dy):
+        attn = np.maximum(2 - dx * dx - dy * dy, 0)
+        attn *= attn
+        xsb, ysb = xsb & 0xFF, ysb & 0xFF
+        return attn * attn * (self.grad_x[xsb, ysb] * dx + self.grad_y[xsb, ysb] * dy)
+
+    def noise2d(self, x, y):
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+        S = SQUISH_CONSTANT_2D
+
+        # place input coordinates onto grid and find the rhombus super-cell origin
+        stretch_offset = (x + y) * STRETCH_CONSTANT_2D
+        xs = x + stretch_offset
+        ys = y + stretch_offset
+        xsb = np.floor(xs).astype(np.int64)
+        ysb = np.floor(ys).astype(np.int64)
+        squish_offset = (xsb + ysb) * S
+        xins = xs - xsb
+        yins = ys - ysb
+        in_sum = xins + yins
+        dx0 = x - (xsb + squish_offset)
+        dy0 = y - (ysb + squish_offset)
+
+        # contributions (1, 0) and (0, 1)
+        value = self.contribution(xsb + 1, ysb, dx0 - 1 - S, dy0 - S)
+        value += self.contribution(xsb, ysb + 1, dx0 - S, dy0 - 1 - S)
+
+        # choose the extra vertex, one case per branch of the scalar implementation
+        lower = in_sum <= 1
+        x_greater = xins > yins
+        lower_near = lower & ((1 - in_sum > xins) | (1 - in_sum > yins))
+        upper_near = ~lower & ((2 - in_sum < xins) | (2 - in_sum < yins))
+        cases = [
+            lower_near & x_greater,
+            lower_near & ~x_greater,
+            lower & ~lower_near,
+            upper_near & x_greater,
+            upper_near & ~x_greater,
+        ]
+        xsv_ext = np.select(cases, [xsb + 1, xsb - 1, xsb + 1, xsb + 2, xsb], xsb)
+        ysv_ext = np.select(cases, [ysb - 1, ysb + 1, ysb + 1, ysb, ysb + 2], ysb)
+        dx_ext = np.select(cases, [dx0 - 1, dx0 + 1, dx0 - 1 - 2 * S, dx0 - 2 - 2 * S, dx0 - 2 * S], dx0)
+        dy_ext = np.select(cases, [dy0 + 1, dy0 - 1, dy0 - 1 - 2 * S, dy0 - 2 * S, dy0 - 2 - 2 * S], dy0)
+
+        # contribution (0, 0) or (1, 1)
+        upper = (~lower).astype(np.int64)
+        value += self.contribution(
+            xsb + upper, ysb + upper, dx0 - upper * (1 + 2 * S), dy0 - upper * (1 + 2 * S)
+        )
+        value += self.contribution(xsv_ext, ysv_ext, dx_ext, dy_ext)
+
+        return value / NORM_CONSTANT_2D
+
+
+@lru_cache(maxsize=64)
+def grid_simplex(seed):
+    return GridSimplex(seed)
+
+
+def simplex_octave(seed, frequency, rows, cols):
+    """
+    One octave of noise rescaled to [0, 1] at the global pixel coordinates rows x cols
+    """
+    rand = grid_simplex(seed).noise2d(frequency * rows[:, None], frequency * cols[None, :])
+    return (rand + 1) / 2
+
+
+def fractal_noise(rows, cols, seeds, flatness=1):
+    """
+    Octaves of noise summed over the global pixel window (rows, cols), one octave per seed
+    """
+    tile = np.zeros([rows.stop - rows.start, cols.stop - cols.start])
+    divisor = 0
+    for n, seed in enumerate(seeds):
+        frequency = 2 ** n / 1e2
+        amplitude = 1 / frequency
+        divisor += amplitude
+        octave = simplex_octave(
+            seed, frequency, np.arange(rows.start, rows.stop), np.arange(cols.start, cols.stop)
+        )
+        tile += octave * amplitude
+    return (tile / divisor) ** flatness
 
 
 class NoiseMap(ImageMap):
@@ -194,7 +675,16 @@ class NoiseMap(ImageMap):
     https://www.redblobgames.com/maps/terrain-from-noise/
     """
 
-    def __init__(self, dimensions, flatness=1, octaves=None, show_components=False):
+    def __init__(
+        self,
+        dimensions,
+        flatness=1,
+        octaves=None,
+        show_components=False,
+        vectorized=True,
+        workers=1,
+        seed=None,
+    ):
         self.width = dimensions[0]
         self.height = dimensions[1]
 
@@ -207,24 +697,38 @@ class NoiseMap(ImageMap):
         if self.show_components:
             self.layers = [Image.new('L', (self.width, self.height)) for _ in range(self.octaves)]
 
+        self.vectorized = vectorized
+        self.workers = workers
+        self.rng = np.random.default_rng(seed)
+        self.seeds = [int(x) for x in self.rng.integers(1e5, size=self.octaves)]
         self.generate_noise_map(flatness)
 
+    @instrument.timed('NoiseMap')
     def generate_noise_map(self, flatness):
         self.map = np.zeros([self.height, self.width])
         divisor = 0
 
-        for n in range(self.octaves):
-            simplex = OpenSimplex(int(np.random.rand() * 1e5))
+        if self.workers > 1 and self.vectorized and not self.show_components:
+            fill_tiles(
+                self.map, self.bands(4 * self.workers), fractal_noise, self.seeds, workers=self.workers
+            )
+            self.map = self.map ** flatness
+            self.normalize()
+            return
+
+        for n, seed in enumerate(self.seeds):
             frequency = 2 ** n / 1e2
             amplitude = 1 / frequency
             divisor += amplitude
 
-            for i in range(self.height):
-                for j in range(self.width):
-                    rand = simplex.noise2d(x=frequency * i, y=frequency * j)
-                    self.map[i, j] += ((rand + 1) / 2) * amplitude
-                    if self.show_components:
-                        self.layers[n].putpixel((j, i), int(255 * ((rand + 1) / 2)))
+            if self.vectorized:
+                octave = self.octave(seed, frequency)
+            else:
+                octave = self.scalar_octave(seed, frequency)
+            self.map += octave * amplitude
+
+            if self.show_components:
+                self.layers[n] = Image.fromarray((255 * octave).astype('uint8'), 'L')
 
         if self.show_components:
             for x in self.layers:
@@ -235,38 +739,259 @@ class NoiseMap(ImageMap):
         self.map = self.map ** flatness
         self.normalize()
 
+    def octave(self, seed, frequency):
+        """
+        One octave of noise rescaled to [0, 1], evaluated over the whole grid at once
+        """
+        return simplex_octave(seed, frequency, np.arange(self.height), np.arange(self.width))
+
+    def scalar_octave(self, seed, frequency):
+        simplex = OpenSimplex(seed)
+        octave = np.zeros([self.height, self.width])
+        for i in range(self.height):
+            for j in range(self.width):
+                octave[i, j] = (simplex.noise2d(x=frequency * i, y=frequency * j) + 1) / 2
+        return octave
+
+
+class TiledMap(ImageMap):
+    """
+    Disk-backed map stored as a .npy memmap and processed tile by tile, so peak memory
+    depends on tile_size rather than on the size of the map.
+    Operations modify the map in place and return it, to chain like ImageMap's.
+    """
+
+    def __init__(self, path, shape, tile_size=512, mapping=None, dtype=np.float32):
+        self.path = path
+        self.map = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=tuple(shape))
+        self.height = self.map.shape[0]
+        self.width = self.map.shape[1]
+        self.tile_size = tile_size
+        self.mapping = mapping
+
+    def __getstate__(self):
+        # pickled by path, so worker processes open the memmap instead of copying it
+        state = self.__dict__.copy()
+        state['map'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.map = np.lib.format.open_memmap(self.path, mode='r+')
+
+    def tiles(self, tile_size=None):
+        return super().tiles(tile_size or self.tile_size)
+
+    def normalize(self):
+        low = min(np.min(self.map[rows, cols]) for rows, cols in self.tiles())
+        high = max(np.max(self.map[rows, cols]) for rows, cols in self.tiles())
+        for rows, cols in self.tiles():
+            self.map[rows, cols] = (self.tile(rows, cols) - low) / (high - low)
+
+    def apply_mask(self, mask, weight):
+        """
+        mask is either a full-size array (possibly a memmap) or a function of (rows, cols)
+        """
+        for rows, cols in self.tiles():
+            tile_mask = mask(rows, cols) if callable(mask) else mask[rows, cols]
+            if len(self.map.shape) == 3:
+                tile_mask = tile_mask[:, :, None]
+            self.map[rows, cols] = self.tile(rows, cols) * (1 - weight) + tile_mask * weight
+        self.normalize()
+        return self
+
+    def apply_circular_mask(self, weight, n=1.25):
+        interpolation = lambda x: x ** n
+        row_gradient = self.create_gradient(self.height, f=interpolation, two_dir=True)
+        col_gradient = self.create_gradient(self.width, f=interpolation, two_dir=True)
+        return self.apply_mask(
+            lambda rows, cols: np.outer(row_gradient[rows], col_gradient[cols]), weight
+        )
+
+    def threshold(self, level):
+        for rows, cols in self.tiles():
+            self.map[rows, cols] = self.map[rows, cols] > level
+        return self
+
+    def multiply(self, other):
+        for rows, cols in self.tiles():
+            self.map[rows, cols] *= other.map[rows, cols]
+        return self
+
+    @instrument.timed()
+    def texturize(self, path, blend_factor=0.08, seed=None, workers=1):
+        """
+        Texturizes tile by tile into a new TiledMap at path, using coordinate-addressed
+        texture tiles so that neighbouring tiles blend seamlessly
+        """
+        result = TiledMap(path, (self.height, self.width, 3), self.tile_size)
+        if seed is None:
+            seed = int(np.random.default_rng().integers(1e5))
+        blend_ranges = self.blend_ranges(blend_factor)
+        tiles = list(self.tiles())
+        fill_tiles(
+            result.map, tiles, self.texturize_tile, blend_factor, blend_ranges, seed, workers=workers
+        )
+        return result
+
+    def save_tiles(self, directory):
+        """
+        Writes each tile as directory/<row>_<col>.png, indexed by tile position
+        """
+        os.makedirs(directory, exist_ok=True)
+        mode = 'RGB' if len(self.map.shape) == 3 else 'L'
+        for rows, cols in self.tiles():
+            tile = Image.fromarray((self.map[rows, cols] * 255).astype('uint8'), mode)
+            tile.save(
+                os.path.join(
+                    directory, f'{rows.start // self.tile_size}_{cols.start // self.tile_size}.png'
+                )
+            )
+
+
+class TiledNoiseMap(TiledMap):
+    """
+    NoiseMap generated tile by tile. Octaves are coordinate-addressed,
+    so every tile continues seamlessly from its neighbours
+    """
+
+    def __init__(self, path, dimensions, flatness=1, octaves=None, tile_size=512, workers=1, seed=None):
+        super().__init__(path, (dimensions[1], dimensions[0]), tile_size)
+
+        if octaves is None:
+            self.octaves = int(np.log2(self.width))
+        else:
+            self.octaves = octaves
+        self.rng = np.random.default_rng(seed)
+        self.seeds = [int(x) for x in self.rng.integers(1e5, size=self.octaves)]
+
+        fill_tiles(self.map, list(self.tiles()), fractal_noise, self.seeds, flatness, workers=workers)
+        self.normalize()
+
+
+class TextureRegistry:
+    """
+    Biome textures by name, loaded the first time they are used and shared from then on
+    """
+
+    # name: (block_size, copy_overlap)
+    biomes = {
+        'desert': (10, 1.5),
+        'grass': (10, 1.5),
+        'snow': (10, 1.5),
+        'stone': (10, 1.5),
+        'coast': (10, 1.5),
+        'hills': (15, 1),
+        'forest': (15, 1),
+        'ocean': (50, 1),
+    }
+
+    def __init__(self, directory='images/samples', cache_dir=None):
+        self.directory = directory
+        self.cache_dir = cache_dir
+        self.textures = {}
+
+    def get(self, name):
+        if name not in self.textures:
+            block_size, copy_overlap = self.biomes[name]
+            path = self.directory + '/' + name + '.png'
+            self.textures[name] = Texture(path, block_size, copy_overlap, cache_dir=self.cache_dir)
+        return self.textures[name]
 
-class Mapping:
-    biomes = None
 
+textures = TextureRegistry()
+
+
+class Mapping:
     def __init__(self, lower_bound, upper_bound, color, name, blend=True):
-        if not Mapping.biomes:
-            Mapping.biomes = self.create_biomes()
         self.lower_bound = lower_bound
         self.upper_bound = upper_bound
         self.name = name
         self.blend = blend
         self.color = color if type(color) == tuple else ImageColor.getrgb(color)
-        for b in Mapping.biomes:
-            if b.name == name:
-                self.texture = b
-                break
 
-    def create_biomes(self):
-        biomes = []
-        for biome in ['desert', 'grass', 'snow', 'stone', 'coast']:
-            biomes.append(Texture('images/samples/' + biome + '.png', 10, copy_overlap=1.5))
-        for biome in ['hills', 'forest']:
-            biomes.append(Texture('images/samples/' + biome + '.png', 15))
-        biomes.append(Texture('images/samples/ocean.png', 50))
-        return biomes
+    @property
+    def texture(self):
+        return textures.get(self.name)
 
 
 class GeneratedIsland:
-    def __init__(self, size, flatness):
+    """
+    With a directory, maps are generated in tiles of tile_size and stored there as .npy memmaps.
+    With a seed and a cache_dir, in-memory maps are saved to cache_dir once generated
+    and memory-mapped back on later runs with the same parameters
+    """
+
+    cached_maps = ['terrain', 'moisture']
+
+    def __init__(
+        self,
+        size,
+        flatness,
+        directory=None,
+        tile_size=512,
+        workers=1,
+        seed=None,
+        octaves=None,
+        cache_dir=None,
+    ):
         self.size = size
-        self.terrain = NoiseMap(size, flatness=flatness)
-        self.moisture = NoiseMap(size)
+        self.directory = directory
+        self.tile_size = tile_size
+        self.workers = workers
+        self.octaves = int(np.log2(size[0])) if octaves is None else octaves
+        self.seed_sequence = np.random.SeedSequence(seed)
+
+        self.cache_path = None
+        if cache_dir is not None and seed is not None and directory is None:
+            key = f'{type(self).__name__}_{size[0]}x{size[1]}_f{flatness}_o{self.octaves}_s{seed}'
+            self.cache_path = os.path.join(cache_dir, key)
+
+        self.cached = self.load_cache()
+        if not self.cached:
+            self.terrain = self.noise_map('terrain', flatness=flatness)
+            self.moisture = self.noise_map('moisture')
+
+    def noise_map(self, name, flatness=1):
+        # each map draws from its own child of the island's seed
+        seed = self.seed_sequence.spawn(1)[0]
+        if self.directory is None:
+            return NoiseMap(
+                self.size, flatness=flatness, octaves=self.octaves, workers=self.workers, seed=seed
+            )
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name + '.npy')
+        return TiledNoiseMap(
+            path,
+            self.size,
+            flatness=flatness,
+            octaves=self.octaves,
+            tile_size=self.tile_size,
+            workers=self.workers,
+            seed=seed,
+        )
+
+    def load_cache(self):
+        if self.cache_path is None:
+            return False
+        paths = [os.path.join(self.cache_path, name + '.npy') for name in self.cached_maps]
+        if not all(os.path.exists(path) for path in paths):
+            return False
+        for name, path in zip(self.cached_maps, paths):
+            setattr(self, name, ImageMap(np.load(path, mmap_mode='c')))
+        return True
+
+    def save_cache(self):
+        if self.cache_path is None:
+            return
+        # Written aside and moved into place whole, so an interrupted run leaves no partial entry
+        temporary = f'{self.cache_path}.{os.getpid()}.tmp'
+        os.makedirs(temporary, exist_ok=True)
+        for name in self.cached_maps:
+            np.save(os.path.join(temporary, name + '.npy'), getattr(self, name).map)
+        if os.path.isdir(self.cache_path):
+            shutil.rmtree(self.cache_path)
+        os.replace(temporary, self.cache_path)
 
     def create_mapping(self, mapping):
         self.terrain.mapping = []
@@ -284,16 +1009,30 @@ class GeneratedIsland:
 
 
 class BigIsland(GeneratedIsland):
-    def __init__(self, size, flatness=0.5):
-        super().__init__(size, flatness)
-        self.shape = NoiseMap(size)
-
-        self.shape = self.shape.apply_circular_mask(0.75)
-        self.shape.map = (self.shape.map > 0.3).astype(int)  # convert into boolean array
-
-        self.terrain = self.terrain.apply_circular_mask(0.4)
-        self.terrain = self.terrain.apply_mask(self.moisture.map, 0.3)
-        self.terrain.map *= self.shape.map
+    cached_maps = ['terrain', 'moisture', 'shape']
+
+    def __init__(
+        self,
+        size,
+        flatness=0.5,
+        directory=None,
+        tile_size=512,
+        workers=1,
+        seed=None,
+        octaves=None,
+        cache_dir=None,
+    ):
+        super().__init__(size, flatness, directory, tile_size, workers, seed, octaves, cache_dir)
+        if not self.cached:
+            self.shape = self.noise_map('shape')
+
+            self.shape = self.shape.apply_circular_mask(0.75)
+            self.shape = self.shape.threshold(0.3)  # convert into boolean array
+
+            self.terrain = self.terrain.apply_circular_mask(0.4)
+            self.terrain = self.terrain.apply_mask(self.moisture.map, 0.3)
+            self.terrain = self.terrain.multiply(self.shape)
+            self.save_cache()
 
         super().create_mapping(
             [
@@ -309,11 +1048,23 @@ class BigIsland(GeneratedIsland):
 
 
 class SmallIsland(GeneratedIsland):
-    def __init__(self, size, flatness=0.7):
-        super().__init__(size, flatness)
-        self.terrain = self.terrain.apply_circular_mask(0.75)
-        self.moisture = self.moisture.apply_circular_mask(0.4)
-        self.terrain = self.terrain.apply_mask(self.moisture.map, 0.4)
+    def __init__(
+        self,
+        size,
+        flatness=0.7,
+        directory=None,
+        tile_size=512,
+        workers=1,
+        seed=None,
+        octaves=None,
+        cache_dir=None,
+    ):
+        super().__init__(size, flatness, directory, tile_size, workers, seed, octaves, cache_dir)
+        if not self.cached:
+            self.terrain = self.terrain.apply_circular_mask(0.75)
+            self.moisture = self.moisture.apply_circular_mask(0.4)
+            self.terrain = self.terrain.apply_mask(self.moisture.map, 0.4)
+            self.save_cache()
 
         super().create_mapping(
             [
@@ -336,31 +1087,117 @@ class Continent:
         self.coordinates = coordinates
 
 
+@lru_cache(maxsize=32)
+def paste_layout(shape, edge_size):
+    """
+    The square mask for shape as an opaque box, where it is exactly 1, and the rectangles
+    (top, bottom, left, right) around it that are blended, with the mask ready to broadcast.
+    Cached by shape, so repeated pastes of a tile share one read-only mask
+    """
+    height, width = shape
+    mask = create_mask(shape, 'square', edge_size, dtype=np.float32)[:, :, None]
+    mask.setflags(write=False)
+    rows, cols = np.flatnonzero((mask == 1).any(axis=(1, 2))), np.flatnonzero(
+        (mask == 1).any(axis=(0, 2))
+    )
+    if len(rows) == 0 or not (mask[rows[0] : rows[-1] + 1, cols[0] : cols[-1] + 1] == 1).all():
+        return mask, None, [(0, height, 0, width)]
+
+    top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    edges = [
+        (0, top, 0, width),
+        (bottom, height, 0, width),
+        (top, bottom, 0, left),
+        (top, bottom, right, width),
+    ]
+    return mask, (top, bottom, left, right), edges
+
+
 class World:
+    """
+    A float32 RGB canvas that tiles are alpha-blended into in place,
+    converted to a PIL image only when the image is read
+    """
+
     def __init__(self, width):
         self.width = width
         self.height = int(self.width / 2)
-        self.image = Image.new('RGB', (self.width, self.height))
+        self.canvas = np.zeros((self.height, self.width, 3), dtype=np.float32)
+        self._image = None
+
+    @property
+    def image(self):
+        if self._image is None:
+            # Converted a band of rows at a time, keeping the temporaries small
+            pixels = np.empty(self.canvas.shape, dtype=np.uint8)
+            band = max(1, 2 ** 20 // (self.width * 3))
+            for top in range(0, self.height, band):
+                # Blends of values in [0, 1] stay in it, so the cast needs no clipping
+                pixels[top : top + band] = self.canvas[top : top + band] * 255
+            self._image = Image.fromarray(pixels, 'RGB')
+        return self._image
 
     def small(self):
         return self.image.resize((800, int(800 * 2 / 3)))
 
     def smooth_paste(self, inimage, coordinates, edge_size=None):
+        self.paste_many(inimage, [coordinates], edge_size)
+
+    def paste_many(self, inimage, locations, edge_size=None):
+        """
+        Blends inimage at each (x, y) in locations in turn, through a square mask fading over
+        edge_size at every border. Where the mask is 1 the tile is copied, so only the
+        edges are blended. Parts falling outside the canvas are clipped
+        """
         if edge_size is None:
             edge_size = inimage.width // 40
-        mask = inimage.blank_like().apply_square_mask(1, edge_size=edge_size)
-        self.image.paste(inimage.read_rgb(), coordinates, mask=mask.read_l())
+        tile = inimage.map.astype(np.float32, copy=False)
+        mask, opaque, edges = paste_layout((inimage.height, inimage.width), edge_size)
+        difference = np.empty_like(tile)
+        self._image = None
+
+        for x, y in locations:
+            # Each rectangle of the tile, clipped to the canvas, in tile and then canvas coordinates
+            def clip(top, bottom, left, right):
+                top, left = max(top, -y), max(left, -x)
+                bottom, right = min(bottom, self.height - y), min(right, self.width - x)
+                if top >= bottom or left >= right:
+                    return None
+                return (slice(top, bottom), slice(left, right)), (
+                    slice(top + y, bottom + y),
+                    slice(left + x, right + x),
+                )
 
+            if opaque is not None:
+                box = clip(*opaque)
+                if box is not None:
+                    self.canvas[box[1]] = tile[box[0]]
 
-def stitch_world_map():
-    world = World(2400)
+            for edge in edges:
+                box = clip(*edge)
+                if box is None:
+                    continue
+                # canvas += mask * (tile - canvas)
+                region, part = self.canvas[box[1]], difference[box[0]]
+                np.subtract(tile[box[0]], region, out=part)
+                part *= mask[box[0]]
+                region += part
 
-    ocean_texture = Texture('images/samples/ocean.png', 50).make_composite((300, 300))
+
+def stitch_world_map(width=2400):
+    world = World(width)
+
+    ocean_texture = textures.get('ocean').make_composite((300, 300))
     # storm = Texture('images/samples/storm.png')
 
-    for i in range(-20, world.width, ocean_texture.width - 20):
-        for j in range(-20, world.height, ocean_texture.height - 20):
-            world.smooth_paste(ocean_texture, (i, j))
+    world.paste_many(
+        ocean_texture,
+        [
+            (i, j)
+            for i in range(-20, world.width, ocean_texture.width - 20)
+            for j in range(-20, world.height, ocean_texture.height - 20)
+        ],
+    )
 
     piskus = Continent('Piskus', 'images/map/piskus.png', [0, 500])
     erebos = Continent(
@@ -387,7 +1224,8 @@ def stitch_world_map():
 
 
 def main():
-    island = BigIsland((200, 200))
+    textures.cache_dir = 'cache/textures'
+    island = BigIsland((200, 200), seed=0, cache_dir='cache')
     island.terrain.colorize().show()
     scaled_island = island.terrain.resize((1000, 1000))
     scaled_island.texturize(0).show()
@@ -395,6 +1233,7 @@ def main():
 
     # world = stitch_world_map()
     # world.image.show()
+    # export_pyramid(world.image, 'images/tiles')
 
 
 if __name__ == '__main__':